@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Compare ways of getting a large ``__INITIAL_STATE__`` slice into Python.
+
+Paths measured (synthetic feed state, default ~3 MB of JSON):
+
+* ``stringify+json`` / ``stringify+orjson``: the page returns ``JSON.stringify(...)``
+  and Python parses one string (what ``xhs_mcp.infra.codec.evaluate_json`` does).
+* ``direct transfer``: the page returns the object and Playwright ships it as its
+  tagged value tree, which Python decodes from the protocol message and rebuilds
+  with ``parse_value`` node by node.
+
+The in-process numbers isolate the Python-side cost, which dominates for big states.
+Pass ``--browser`` to also time real ``page.evaluate`` calls in headless Chromium.
+
+Usage: python -m scripts.bench_codec [--notes 1500] [--rounds 5] [--browser]
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import time
+from typing import Any, Callable
+
+import typer
+
+from xhs_mcp.infra import codec
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+
+def _synthetic_state(notes: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"{i:024x}",
+            "modelType": "note",
+            "xsecToken": "AB" + "x" * 40,
+            "noteCard": {
+                "type": "normal",
+                "displayTitle": f"周末去哪儿玩 第{i}篇 城市漫步路线分享",
+                "user": {"userId": f"{i * 7:024x}", "nickname": f"用户{i}", "avatar": "https://sns-avatar.example/" + "a" * 60},
+                "interactInfo": {"liked": False, "likedCount": str(i * 3), "collected": False},
+                "cover": {
+                    "width": 1080,
+                    "height": 1440,
+                    "urlDefault": "https://sns-webpic.example/" + "c" * 80,
+                    "infoList": [{"imageScene": s, "url": "https://sns-webpic.example/" + s * 40} for s in ("WB_PRV", "WB_DFT")],
+                },
+                "imageList": [{"width": 1080, "height": 1440, "traceId": "t" * 32} for _ in range(6)],
+                "tagList": [{"id": f"{t}", "name": f"话题{t}", "type": "topic"} for t in range(4)],
+            },
+        }
+        for i in range(notes)
+    ]
+
+
+def _time(fn: Callable[[], Any], rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def _in_process(state: list[dict[str, Any]], rounds: int) -> dict[str, float]:
+    from playwright._impl._js_handle import parse_value, serialize_value
+
+    text = json.dumps(state, ensure_ascii=False)
+    # What the driver sends for a direct transfer: the tagged tree inside a JSON message.
+    message = json.dumps({"result": {"value": serialize_value(state, [])}}, ensure_ascii=False)
+    results = {"stringify+json": _time(lambda: json.loads(text), rounds)}
+    if orjson is not None:
+        results["stringify+orjson"] = _time(lambda: orjson.loads(text), rounds)
+    results["direct transfer"] = _time(lambda: parse_value(json.loads(message)["result"]["value"]), rounds)
+    print(f"payload: {len(text.encode()) / 1e6:.2f} MB as JSON, {len(message.encode()) / 1e6:.2f} MB as value tree")
+    return results
+
+
+def _in_browser(state: list[dict[str, Any]], rounds: int) -> dict[str, float]:
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch()
+        page = browser.new_page()
+        page.evaluate("(s) => { window.__INITIAL_STATE__ = { feed: { feeds: s } }; }", state)
+        results = {
+            f"page stringify+{codec.backend()}": _time(
+                lambda: codec.evaluate_json(page, "() => JSON.stringify(window.__INITIAL_STATE__.feed.feeds)"), rounds
+            ),
+            "page direct transfer": _time(lambda: page.evaluate("() => window.__INITIAL_STATE__.feed.feeds"), rounds),
+        }
+        browser.close()
+    return results
+
+
+def main(
+    notes: int = typer.Option(1500, help="Synthetic notes in the state payload."),
+    rounds: int = typer.Option(5, help="Repetitions per path (median reported)."),
+    browser: bool = typer.Option(False, help="Also time page.evaluate in headless Chromium."),
+) -> None:
+    state = _synthetic_state(notes)
+    results = _in_process(state, rounds)
+    if browser:
+        results.update(_in_browser(state, rounds))
+    for name, ms in results.items():
+        print(f"{name:>28}: {ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Startup-time check for the CLIs.
+
+For each CLI module this reports the cumulative import time from ``python -X importtime``,
+the slowest imports, and the median wall time of ``python -m <module> --help``. It exits
+non-zero when an import exceeds ``--budget-ms``, so deploy scripts and CI can catch
+regressions such as a heavy module (MCP SDK, Playwright, requests) becoming an eager
+import again.
+
+Usage: python -m scripts.bench_startup [--budget-ms 250] [--runs 5] [--top 5]
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import typer
+
+
+ROOT = Path(__file__).resolve().parent.parent
+MODULES = ("xhs_mcp.cli.mcp_cli", "xhs_mcp.cli.login_cli")
+
+
+def _import_profile(module: str) -> tuple[float, list[tuple[float, str]]]:
+    """Return (cumulative ms for ``module``, [(self ms, name), ...]) parsed from -X importtime."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0.0
+    entries: list[tuple[float, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        entries.append((int(self_us) / 1000, name))
+        if name == module:
+            total = int(cumulative_us) / 1000
+    return total, sorted(entries, reverse=True)
+
+
+def _help_wall_ms(module: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-m", module, "--help"], cwd=ROOT, capture_output=True, check=True)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main(
+    budget_ms: float = typer.Option(250.0, help="Maximum cumulative import time per CLI module."),
+    runs: int = typer.Option(5, help="Runs of `--help` per module (median reported)."),
+    top: int = typer.Option(5, help="Slowest imports to list per module."),
+) -> None:
+    over_budget = []
+    for module in MODULES:
+        total, entries = _import_profile(module)
+        wall = _help_wall_ms(module, runs)
+        status = "ok" if total <= budget_ms else "OVER BUDGET"
+        typer.echo(f"{module}: import {total:.1f} ms, `--help` {wall:.1f} ms wall [{status}]")
+        for self_ms, name in entries[:top]:
+            typer.echo(f"    {self_ms:7.1f} ms  {name}")
+        if total > budget_ms:
+            over_budget.append(module)
+    if over_budget:
+        typer.echo(f"import budget of {budget_ms:.0f} ms exceeded by: {', '.join(over_budget)}")
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Check the static-asset caching proxy against a local HTTP stand-in for the CDN.
+
+Starts a throwaway origin server serving a hash-named bundle, a font, an image and an
+uncacheable API response, then requests each through the proxy twice: once as a
+forward-proxy GET and once via ``/fetch?url=``. Asserts that static assets are served
+from disk on the second request (the origin sees them once), that API responses always
+pass through, and that LRU eviction keeps the store under its size cap. Prints the
+proxy's hit-ratio stats and exits non-zero on any failure.
+
+Usage: python -m scripts.check_asset_proxy
+"""
+
+from __future__ import annotations
+
+import http.client
+import tempfile
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import typer
+
+from xhs_mcp.infra.asset_proxy import AssetProxy, AssetStore, fetch_url
+
+
+ASSETS = {
+    "/static/js/app.3f9a1c2e.js": ("application/javascript", b"console.log('app');" * 200),
+    "/static/fonts/site.woff2": ("font/woff2", bytes(range(256)) * 40),
+    "/img/cover.webp": ("image/webp", b"RIFF" + b"\x00" * 60_000),
+    "/api/feed": ("application/json", b'{"items": []}'),
+}
+
+
+class _Origin(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    seen: Counter[str] = Counter()
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        self.seen[path] += 1
+        if path not in ASSETS:
+            self.send_error(404)
+            return
+        content_type, body = ASSETS[path]
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if path.startswith("/api/"):
+            self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _get(proxy: AssetProxy, target: str) -> tuple[int, str, bytes]:
+    parts = urlsplit(proxy.url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=10)
+    try:
+        conn.request("GET", target)
+        response = conn.getresponse()
+        return response.status, response.headers.get("X-Cache", ""), response.read()
+    finally:
+        conn.close()
+
+
+def main() -> None:
+    origin = ThreadingHTTPServer(("127.0.0.1", 0), _Origin)
+    threading.Thread(target=origin.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{origin.server_address[1]}"
+    failures: list[str] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        proxy = AssetProxy(AssetStore(Path(tmp), max_mb=1))
+        proxy.start()
+        try:
+            for path, (_type, body) in ASSETS.items():
+                url = base + path
+                for target in (url, fetch_url("", url)):
+                    status, cache, received = _get(proxy, target)
+                    if status != 200 or received != body:
+                        failures.append(f"{target}: status {status}, {len(received)} bytes")
+                    typer.echo(f"{cache:6} {target}")
+            for path in ASSETS:
+                expected = 2 if path.startswith("/api/") else 1
+                if _Origin.seen[path] != expected:
+                    failures.append(f"origin saw {path} {_Origin.seen[path]}x, expected {expected}")
+
+            # Fill past the 1 MB cap: the oldest entries must be evicted.
+            big = b"x" * 400_000
+            for index in range(4):
+                ASSETS[f"/img/big{index}.png"] = ("image/png", big)
+                _get(proxy, f"{base}/img/big{index}.png")
+            stats = proxy.stats()
+            if stats["size_mb"] > 1 or not stats["evictions"]:
+                failures.append(f"store not bounded: {stats['size_mb']} MB, {stats['evictions']} evictions")
+            typer.echo(stats)
+        finally:
+            proxy.close()
+            origin.shutdown()
+
+    if failures:
+        for failure in failures:
+            typer.echo(f"FAIL {failure}")
+        raise typer.Exit(code=1)
+    typer.echo("ok")
+
+
+if __name__ == "__main__":
+    typer.run(main)
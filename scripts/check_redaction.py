@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Check that redaction results do not depend on the order of the rules.
+
+Applies every permutation of a few overlapping rule sets (a broad path next to deeper
+paths under it, wildcards, ``modelType:`` prefixes) to the same sample items and
+asserts that all orders leave identical output. Exits non-zero on any mismatch.
+
+Usage: python -m scripts.check_redaction
+"""
+
+from __future__ import annotations
+
+import copy
+from itertools import permutations
+
+import typer
+
+from xhs_mcp.infra.redaction import Redactor
+
+
+SAMPLE = [
+    {"modelType": "note", "a": {"b": 1, "c": 2}, "noteCard": {"user": {"xsecToken": "t", "name": "n"}}},
+    {"modelType": "hot_query", "a": [{"b": 1}, {"c": 2}], "noteCard": {"user": {"xsecToken": "t"}}},
+]
+
+RULE_SETS = [
+    ("a", "a.b"),
+    ("a.b", "a.*", "a"),
+    ("*.b", "a"),
+    ("note:noteCard.user", "noteCard.user.xsecToken", "note:noteCard.user.name"),
+    ("a.*", "a.*.b", "noteCard"),
+]
+
+
+def main() -> None:
+    failures: list[str] = []
+    for rules in RULE_SETS:
+        outputs = {}
+        for order in permutations(rules):
+            items = copy.deepcopy(SAMPLE)
+            Redactor(order).redact(items)
+            outputs[order] = items
+        distinct = {repr(items) for items in outputs.values()}
+        if len(distinct) != 1:
+            failures.append(f"{rules}: {len(distinct)} different results across orders")
+        else:
+            typer.echo(f"{rules!r:60} -> {distinct.pop()}")
+    if failures:
+        for failure in failures:
+            typer.echo(f"FAIL {failure}")
+        raise typer.Exit(code=1)
+    typer.echo("ok")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -35,11 +35,15 @@ list
 
 import json
 
+from xhs_mcp.infra.redaction import redact
+
 
 def clean_xsec_tokens(data_array):
     """
     清洗数组中的重复xsecToken
 
+    兼容旧接口：实际规则与计数由 ``xhs_mcp.infra.redaction`` 处理，不再逐条打印。
+
     Args:
         data_array: 数组，包含多个对象
 
@@ -48,25 +52,7 @@ def clean_xsec_tokens(data_array):
     """
     if not isinstance(data_array, list):
         raise TypeError("输入必须是数组！")
-
-    cleaned_count = 0
-
-    # 遍历数组中的每个元素
-    for item in data_array:
-        # 只处理 note 类型的对象
-        if isinstance(item, dict) and item.get('modelType') == 'note':
-            # 检查 noteCard 和 user 是否存在
-            if 'noteCard' in item and 'user' in item['noteCard']:
-                user = item['noteCard']['user']
-
-                # 如果用户对象有 xsecToken，就删除它
-                if 'xsecToken' in user:
-                    del user['xsecToken']
-                    cleaned_count += 1
-                    print(f"✓ 已删除 xsecToken (对象ID: {item.get('id', 'N/A')[:10]}...)")
-
-    print(f"\n📊 清洗完成: 共删除了 {cleaned_count} 个重复的 xsecToken")
-    return data_array
+    return redact(data_array)
 
 
 def clean_json_string(json_string):
@@ -86,12 +72,7 @@ def clean_json_string(json_string):
         obj = json.loads(json_string)
 
         # 如果是note类型，删除user.xsecToken
-        if isinstance(obj, dict) and obj.get('modelType') == 'note':
-            if 'noteCard' in obj and 'user' in obj['noteCard']:
-                user = obj['noteCard']['user']
-                if 'xsecToken' in user:
-                    del user['xsecToken']
-                    print(f"✓ 已删除字符串中的 user.xsecToken")
+        redact([obj])
 
         # 转换回JSON字符串
         return json.dumps(obj, ensure_ascii=False)
@@ -4,20 +4,21 @@ import base64
 from pathlib import Path
 
 import typer
-from playwright.sync_api import Error as PWError
 
+# Playwright and requests are imported on first use inside the commands, so
+# `--help` and short-lived calls don't pay for them up front.
 from xhs_mcp.configs import get_cookies_path, get_chrome_executable
 from xhs_mcp.infra.browser import pw, launch, new_context
 from xhs_mcp.infra.cookies import save_storage_state
 from xhs_mcp.xhs.login import check_login_status, fetch_qrcode_image, wait_for_login
-import os
-import sys
-from typing import Optional
 
-try:
-    import requests  # type: ignore
-except Exception:
-    requests = None  # lazy optional: only needed if QR src is http(s)
+
+def _load_requests():
+    try:
+        import requests  # type: ignore
+    except Exception:
+        return None  # optional: only needed if QR src is http(s)
+    return requests
 
 
 app = typer.Typer(help="Headless login CLI for xiaohongshu-mcp-py")
@@ -76,6 +77,7 @@ def get_qrcode(
                     data = base64.b64decode(b64)
                     Path(out).write_bytes(data)
                 elif src.startswith("http://") or src.startswith("https://"):
+                    requests = _load_requests()
                     if requests is None:
                         typer.echo("QR is URL but 'requests' not available. Install requests.")
                         raise typer.Exit(code=2)
@@ -109,6 +111,8 @@ def wait(
                     typer.echo("Login timed out")
                     raise typer.Exit(code=3)
                 # Save storage_state to file
+                from playwright.sync_api import Error as PWError
+
                 try:
                     state = ctx.storage_state()
                 except PWError:
@@ -181,6 +185,7 @@ def login(
                     Path(out).write_bytes(base64.b64decode(b64))
                 # 若是 http(s) URL，则下载图片写入文件
                 elif src.startswith("http://") or src.startswith("https://"):
+                    requests = _load_requests()
                     if requests is None:
                         typer.echo("QR is URL but 'requests' is not installed. Please install requests.")
                         raise typer.Exit(code=2)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import time
 from pathlib import Path
 from typing import Optional
 
 import typer
 
-from xhs_mcp.mcp_server import configure_defaults, create_server
+from xhs_mcp.infra.redaction import DEFAULT_RULES
 
 
 app = typer.Typer(help="Run the Xiaohongshu MCP server.")
@@ -31,23 +32,162 @@ def serve(
     chrome_bin: Optional[str] = typer.Option(None, help="Default Chromium/Chrome executable path."),
     debug_dir: Optional[Path] = typer.Option(None, help="Dump DOM/screenshot to this directory for every call."),
     trace: bool = typer.Option(False, help="Capture Playwright tracing when debug_dir is set."),
+    workers: int = typer.Option(
+        0,
+        help="Browser worker processes; each keeps its own Playwright driver and warm contexts. 0 runs calls in-process.",
+    ),
+    worker_timeout: float = typer.Option(900.0, help="Seconds before a hung worker call is killed and the worker restarted."),
+    browser_endpoint: list[str] = typer.Option(
+        [],
+        help="WebSocket endpoint of a `playwright run-server` host (repeatable). Replaces local browser launches.",
+    ),
+    endpoint_capacity: int = typer.Option(4, help="Concurrent calls allowed per browser endpoint."),
+    optimize_images: bool = typer.Option(
+        False,
+        help="Validate, auto-orient, downscale and re-encode images before upload (requires Pillow).",
+    ),
+    image_max_edge: int = typer.Option(2560, help="Longest image edge in pixels kept by --optimize-images."),
+    state_dir: Optional[Path] = typer.Option(None, help="Directory for persisted server state such as jobs.json."),
+    publish_queue_interval: float = typer.Option(
+        30.0,
+        help="Seconds between publish-queue scheduler ticks; 0 runs the queue only via publish_queue_run.",
+    ),
+    watch_sink: Optional[Path] = typer.Option(None, help="Append new notes found by watches to this JSONL file."),
+    keepalive_interval: float = typer.Option(
+        0.0,
+        help="Seconds between keep-alive runs per saved profile (profiles/*/cookies.json); 0 disables.",
+    ),
+    keepalive_warn_hours: float = typer.Option(
+        72.0, help="Flag profiles whose login cookie expires within this many hours."
+    ),
+    prewarm: bool = typer.Option(
+        False,
+        help="Before serving, launch the browser and build a warm context for the default profile (needs --workers).",
+    ),
+    prewarm_profile: list[str] = typer.Option([], help="Also pre-warm this profile (repeatable)."),
+    prewarm_navigate: bool = typer.Option(
+        False, help="Keep one page per pre-warmed profile open on the explore page for the first call."
+    ),
+    keep_warm: bool = typer.Option(
+        False, help="Health checks probe warm contexts and rebuild dead ones before a call hits them."
+    ),
+    browser_cache_dir: Optional[Path] = typer.Option(
+        None,
+        help="Run browsers on persistent per-profile user-data directories here so the HTTP cache survives calls.",
+    ),
+    browser_cache_mb: float = typer.Option(1024.0, help="Size cap for --browser-cache-dir; idle LRU profiles are pruned."),
+    asset_cache_dir: Optional[Path] = typer.Option(
+        None,
+        help="Run a local caching proxy for hash-named bundles, fonts and images shared by all browsers.",
+    ),
+    asset_cache_mb: float = typer.Option(512.0, help="Size cap for --asset-cache-dir (LRU eviction)."),
+    max_renderer_mb: Optional[float] = typer.Option(
+        None, help="Recycle pages, then contexts, when a renderer process exceeds this RSS (needs --workers)."
+    ),
+    max_browser_mb: Optional[float] = typer.Option(
+        None, help="Relaunch a worker's browser when its whole Chromium process tree exceeds this RSS."
+    ),
+    max_pages_per_context: Optional[int] = typer.Option(None, help="Rebuild a warm context after this many pages."),
+    max_calls_per_browser: Optional[int] = typer.Option(None, help="Relaunch a worker's browser after this many calls."),
+    memory_budget_mb: Optional[float] = typer.Option(
+        None,
+        help="Admit browser calls only while their estimated memory fits this budget; others queue.",
+    ),
+    admission_queue: int = typer.Option(32, help="Calls allowed to wait for memory before new ones are refused."),
+    admission_timeout: float = typer.Option(120.0, help="Seconds a queued call waits for memory before failing."),
+    call_cost: list[str] = typer.Option(
+        [],
+        help="Override a tool's memory estimate as TOOL=MB, e.g. publish_video=900 or export=800 (repeatable).",
+    ),
+    redact: list[str] = typer.Option(
+        [],
+        help="Extra redaction rule `[modelType:]dotted.path` (`*` matches any key/index); repeatable.",
+    ),
 ) -> None:
     """Launch the MCP server."""
 
+    # Imported here: the server pulls in the MCP SDK and Playwright, which `--help` doesn't need.
+    from xhs_mcp.infra.admission import parse_costs
+    from xhs_mcp.infra.memory import MemoryLimits
+    from xhs_mcp.mcp_server import (
+        configure_admission,
+        configure_asset_cache,
+        configure_browser_endpoints,
+        configure_defaults,
+        configure_keepalive,
+        configure_publish_queue,
+        configure_watches,
+        configure_workers,
+        create_server,
+        prewarm_browsers,
+        shutdown_workers,
+    )
+
     configure_defaults(
         profile=profile,
         cookies_path=cookies_path,
         chrome_bin=chrome_bin,
         debug_dir=str(debug_dir) if debug_dir else None,
         trace=trace or False,
+        optimize_images=optimize_images,
+        image_max_edge=image_max_edge,
+        state_dir=state_dir,
+        redact_rules=(*DEFAULT_RULES, *redact) if redact else None,
+        browser_cache_dir=browser_cache_dir,
+        browser_cache_mb=browser_cache_mb,
+    )
+
+    configure_browser_endpoints(browser_endpoint, capacity=endpoint_capacity)
+    configure_asset_cache(asset_cache_dir, max_mb=asset_cache_mb)
+    try:
+        costs = parse_costs(call_cost)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--call-cost") from exc
+    configure_admission(
+        memory_budget_mb,
+        max_queue=admission_queue,
+        queue_timeout=admission_timeout,
+        costs=costs,
+    )
+    warm_profiles: list[str | None] = ([None] if prewarm else []) + list(prewarm_profile)
+    if warm_profiles and workers <= 0:
+        typer.echo("pre-warming keeps browsers in worker processes; starting 1 worker", err=True)
+        workers = 1
+    limits = MemoryLimits(
+        renderer_mb=max_renderer_mb,
+        browser_total_mb=max_browser_mb,
+        pages_per_context=max_pages_per_context,
+        calls_per_browser=max_calls_per_browser,
+    )
+    if limits.enabled and workers <= 0:
+        typer.echo("memory caps apply to worker processes; starting 1 worker", err=True)
+        workers = 1
+    configure_workers(
+        workers,
+        call_timeout=worker_timeout,
+        keep_warm=keep_warm,
+        memory_limits=limits if limits.enabled else None,
     )
+    if warm_profiles:
+        started = time.monotonic()
+        for report in prewarm_browsers(warm_profiles, navigate=prewarm_navigate):
+            name = report["profile"] or "default"
+            outcome = "ok" if report["ok"] else report["error"]
+            typer.echo(f"pre-warm {name}: {outcome} ({report['seconds']} s)", err=True)
+        typer.echo(f"warm-up finished in {time.monotonic() - started:.1f} s; server ready", err=True)
+    configure_publish_queue(publish_queue_interval)
+    configure_watches(watch_sink)
+    configure_keepalive(keepalive_interval, warn_before=keepalive_warn_hours * 3600)
 
     server = create_server()
     if transport == "streamable-http":
         server.settings.host = host
         server.settings.port = port
 
-    server.run(transport=transport)
+    try:
+        server.run(transport=transport)
+    finally:
+        shutdown_workers()
 
 
 if __name__ == "__main__":
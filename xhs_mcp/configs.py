@@ -5,6 +5,7 @@ from pathlib import Path
 
 DEFAULT_COOKIES_FILE = "cookies.json"
 DEFAULT_PROFILES_DIR = Path("profiles")
+DEFAULT_STATE_DIR = Path("state")
 
 
 def legacy_cookies_path_exists() -> bool:
@@ -41,3 +42,10 @@ def get_cookies_path(cookies_path: str | None = None, profile: str | None = None
 
 def get_chrome_executable(bin_path: str | None) -> str | None:
     return bin_path or os.getenv("CHROME_BIN") or None
+
+
+def get_state_dir(state_dir: str | Path | None = None) -> Path:
+    # Server-side bookkeeping (jobs, queues, ...); env override for containerized deploys.
+    path = Path(state_dir or os.getenv("XHS_MCP_STATE_DIR") or DEFAULT_STATE_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from collections import deque
+from typing import Any, Iterator, Mapping
+
+from . import metrics
+
+
+# Rough peak RSS (MB) of one call per tool class: a Chromium renderer plus its share of
+# the browser. Publishing holds decoded media in the page, scrolling tools grow the DOM.
+DEFAULT_COSTS_MB: dict[str, float] = {
+    "check_login": 200.0,
+    "login_qrcode": 200.0,
+    "wait_login": 200.0,
+    "keepalive": 200.0,
+    "feeds_list": 300.0,
+    "search": 300.0,
+    "feed_detail": 300.0,
+    "my_profile": 300.0,
+    "interact": 300.0,
+    "post_comment": 300.0,
+    "watch_user": 350.0,
+    "interact_batch": 350.0,
+    "media_notes": 350.0,
+    "feed_comments": 400.0,
+    "user_profile": 400.0,
+    # Streaming exports scroll long listings (comments, creator notes) in one call.
+    "export": 500.0,
+    "publish_image": 500.0,
+    "publish_video": 700.0,
+    "publish_queue": 700.0,
+}
+DEFAULT_COST_MB = 300.0
+
+# Costs are keyed by handler class; MCP tool names given to ``--call-cost`` map onto them.
+TOOL_COST_KEYS: dict[str, str] = {
+    "check_login": "check_login",
+    "get_login_qrcode": "login_qrcode",
+    "wait_for_login_complete": "wait_login",
+    "keepalive_status": "keepalive",
+    "feeds_list": "feeds_list",
+    "search_feeds": "search",
+    "feed_detail": "feed_detail",
+    "my_profile": "my_profile",
+    "like_feed": "interact",
+    "unlike_feed": "interact",
+    "favorite_feed": "interact",
+    "unfavorite_feed": "interact",
+    "post_comment": "post_comment",
+    "interact_batch": "interact_batch",
+    "download_media": "media_notes",
+    "feed_comments": "feed_comments",
+    "user_profile": "user_profile",
+    "publish_image": "publish_image",
+    "publish_video": "publish_video",
+    "publish_queue_add": "publish_queue",
+    "publish_queue_run": "publish_queue",
+}
+
+
+class AdmissionRejected(RuntimeError):
+    """Raised when a call cannot be admitted (queue full or waited too long)."""
+
+
+def parse_costs(values: list[str]) -> dict[str, float]:
+    """Parse ``tool=MB`` overrides as given on the command line.
+
+    ``tool`` is an MCP tool name (``search_feeds``) or a cost key (``search``, ``export``);
+    anything else raises ``ValueError`` rather than being silently ignored.
+    """
+    costs: dict[str, float] = {}
+    for value in values:
+        name, sep, mb = value.partition("=")
+        name = name.strip()
+        if not sep or not name:
+            raise ValueError(f"expected TOOL=MB, got {value!r}")
+        key = TOOL_COST_KEYS.get(name, name)
+        if key not in DEFAULT_COSTS_MB:
+            known = ", ".join(sorted({*TOOL_COST_KEYS, *DEFAULT_COSTS_MB}))
+            raise ValueError(f"unknown tool {name!r} in {value!r}; expected one of: {known}")
+        try:
+            costs[key] = float(mb)
+        except ValueError:
+            raise ValueError(f"expected TOOL=MB, got {value!r}") from None
+    return costs
+
+
+class AdmissionController:
+    """Admit browser calls while their projected memory stays under ``budget_mb``.
+
+    Each call is charged the estimated cost of its tool class. Calls that do not fit wait
+    in a FIFO queue of at most ``max_queue`` entries for up to ``queue_timeout`` seconds;
+    only the head of the queue may be admitted, so a heavy publish is not starved by a
+    stream of cheap reads. A call is always admitted when nothing else is running, even
+    if its estimate alone exceeds the budget.
+    """
+
+    def __init__(
+        self,
+        budget_mb: float,
+        *,
+        max_queue: int = 32,
+        queue_timeout: float = 120.0,
+        costs: Mapping[str, float] | None = None,
+        default_cost: float = DEFAULT_COST_MB,
+    ) -> None:
+        self.budget_mb = budget_mb
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.costs = {**DEFAULT_COSTS_MB, **(costs or {})}
+        self.default_cost = default_cost
+        self._cond = threading.Condition()
+        self._waiting: deque[object] = deque()
+        self._in_flight: dict[str, int] = {}
+        self._projected = 0.0
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    def cost(self, tool: str) -> float:
+        return self.costs.get(tool, self.default_cost)
+
+    def _fits(self, cost: float) -> bool:
+        return self._projected == 0.0 or self._projected + cost <= self.budget_mb
+
+    @contextlib.contextmanager
+    def admit(self, tool: str, *, timeout: float | None = None) -> Iterator[None]:
+        cost = self.cost(tool)
+        deadline = time.monotonic() + (self.queue_timeout if timeout is None else timeout)
+        ticket = object()
+        started = time.monotonic()
+        with self._cond:
+            if not self._waiting and self._fits(cost):
+                self._grant(tool, cost)
+            else:
+                if len(self._waiting) >= self.max_queue:
+                    self._rejected += 1
+                    metrics.incr("admission.rejected")
+                    raise AdmissionRejected(
+                        f"server busy: {len(self._waiting)} calls already queued for browser memory"
+                    )
+                self._waiting.append(ticket)
+                try:
+                    while not (self._waiting[0] is ticket and self._fits(cost)):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._timed_out += 1
+                            metrics.incr("admission.timeouts")
+                            raise AdmissionRejected(
+                                f"waited {time.monotonic() - started:.0f} s for browser memory "
+                                f"({self._projected:.0f}/{self.budget_mb:.0f} MB in use, {tool} needs {cost:.0f} MB)"
+                            )
+                        self._cond.wait(remaining)
+                    self._grant(tool, cost)
+                finally:
+                    self._waiting.remove(ticket)
+                    self._cond.notify_all()
+        metrics.observe("admission.wait_ms", (time.monotonic() - started) * 1000)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._projected = max(0.0, self._projected - cost)
+                self._in_flight[tool] -= 1
+                if not self._in_flight[tool]:
+                    del self._in_flight[tool]
+                self._cond.notify_all()
+
+    def _grant(self, tool: str, cost: float) -> None:
+        # Caller holds the condition.
+        self._projected += cost
+        self._in_flight[tool] = self._in_flight.get(tool, 0) + 1
+        self._admitted += 1
+
+    def status(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "budget_mb": self.budget_mb,
+                "projected_mb": self._projected,
+                "in_flight": dict(self._in_flight),
+                "queued": len(self._waiting),
+                "max_queue": self.max_queue,
+                "queue_timeout": self.queue_timeout,
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+            }
@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import hashlib
+import http.client
+import os
+import re
+import shutil
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+from urllib.parse import parse_qs, quote, urlsplit
+
+from .codec import dumps, loads
+from .http_pool import ConnectionPool, host_key
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Route
+
+
+# Immutable assets only: content-hashed bundles, fonts, and images/thumbnails (the
+# site's image CDN serves extension-less, content-addressed URLs). Video is streamed
+# with Range requests and is left to the browser. Kept JS-compatible: Playwright
+# evaluates route patterns in the driver, so non-matching requests never reach Python.
+STATIC_URL = re.compile(
+    r"^https?://(?:"
+    r"(?:sns-webpic|sns-avatar|sns-img|picasso-static)[\w-]*\.[^/?#]+/[^?#]*"
+    r"|[^?#]*(?:[._-][0-9a-f]{8,}(?:\.[a-z]+)?\.(?:js|mjs|css)|\.(?:woff2?|ttf|otf|eot|png|jpe?g|webp|gif|avif|svg|ico))"
+    r")(?:[?#].*)?$",
+    re.I,
+)
+_FORWARD_HEADERS = ("user-agent", "accept", "accept-language", "referer", "origin")
+_CHUNK = 64 * 1024
+
+
+def is_static_asset(url: str) -> bool:
+    return STATIC_URL.match(url) is not None
+
+
+def _storable(status: int, headers: http.client.HTTPMessage) -> bool:
+    cache_control = (headers.get("Cache-Control") or "").lower()
+    return (
+        status == 200
+        and "no-store" not in cache_control
+        and "private" not in cache_control
+        and headers.get("Set-Cookie") is None
+        and headers.get("Content-Range") is None
+    )
+
+
+class AssetStore:
+    """Size-bounded LRU of response bodies on disk, keyed by URL.
+
+    Each entry is ``<sha256>.body`` plus ``<sha256>.meta`` (content type), written via a
+    temporary file and renamed, so concurrent readers never see partial bodies. The LRU
+    order survives restarts through file mtimes.
+    """
+
+    def __init__(self, root: Path, *, max_mb: float = 512.0, max_entry_mb: float = 16.0) -> None:
+        self.root = root
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.max_entry_bytes = int(max_entry_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+        self.bytes_from_cache = 0
+        self.bytes_from_upstream = 0
+        self._load()
+
+    def _load(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        entries = []
+        for body in self.root.glob("*/*.body"):
+            try:
+                stat = body.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, body.stem, stat.st_size))
+        for _mtime, key, size in sorted(entries):
+            self._index[key] = size
+            self._bytes += size
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        folder = self.root / key[:2]
+        return folder / f"{key}.body", folder / f"{key}.meta"
+
+    def open(self, url: str) -> tuple[IO[bytes], int, str] | None:
+        """Return ``(body file, size, content type)`` for a cached URL, else ``None``."""
+        key = self.key(url)
+        body_path, meta_path = self._paths(key)
+        with self._lock:
+            if key not in self._index:
+                return None
+            try:
+                handle = open(body_path, "rb")
+                meta = loads(meta_path.read_bytes())
+            except (OSError, ValueError):
+                self._forget(key)
+                return None
+            self._index.move_to_end(key)
+            size = self._index[key]
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+        return handle, size, meta.get("content_type", "application/octet-stream")
+
+    def writer(self, url: str, content_type: str) -> "_EntryWriter":
+        key = self.key(url)
+        body_path, meta_path = self._paths(key)
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        return _EntryWriter(self, key, body_path, meta_path, content_type)
+
+    def _commit(self, key: str, size: int) -> None:
+        with self._lock:
+            if key in self._index:
+                self._bytes -= self._index.pop(key)
+            self._index[key] = size
+            self._bytes += size
+            while self._bytes > self.max_bytes and len(self._index) > 1:
+                oldest = next(iter(self._index))
+                self._forget(oldest)
+                self.evictions += 1
+
+    def _forget(self, key: str) -> None:
+        # Caller holds the lock.
+        size = self._index.pop(key, None)
+        if size is not None:
+            self._bytes -= size
+        for path in self._paths(key):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._index.clear()
+            self._bytes = 0
+            shutil.rmtree(self.root, ignore_errors=True)
+            self.root.mkdir(parents=True, exist_ok=True)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "root": str(self.root),
+                "entries": len(self._index),
+                "size_mb": round(self._bytes / (1024 * 1024), 1),
+                "max_mb": round(self.max_bytes / (1024 * 1024), 1),
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+                "evictions": self.evictions,
+                "bytes_from_cache": self.bytes_from_cache,
+                "bytes_from_upstream": self.bytes_from_upstream,
+            }
+
+    def count(self, field: str, value: int = 1) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + value)
+
+
+class _EntryWriter:
+    """Streams one upstream body to a temporary file; ``commit`` publishes it."""
+
+    def __init__(self, store: AssetStore, key: str, body_path: Path, meta_path: Path, content_type: str) -> None:
+        self.store = store
+        self.key = key
+        self.body_path = body_path
+        self.meta_path = meta_path
+        self.content_type = content_type
+        self.tmp = body_path.with_name(f"{body_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        self.handle: IO[bytes] | None = open(self.tmp, "wb")
+        self.size = 0
+
+    def write(self, chunk: bytes) -> None:
+        if self.handle is None:
+            return
+        self.size += len(chunk)
+        if self.size > self.store.max_entry_bytes:
+            self.abort()
+            return
+        self.handle.write(chunk)
+
+    def commit(self) -> None:
+        if self.handle is None:
+            return
+        self.handle.close()
+        self.handle = None
+        self.meta_path.write_text(dumps({"content_type": self.content_type}), encoding="utf-8")
+        os.replace(self.tmp, self.body_path)
+        self.store._commit(self.key, self.size)
+
+    def abort(self) -> None:
+        if self.handle is not None:
+            self.handle.close()
+            self.handle = None
+        try:
+            self.tmp.unlink()
+        except OSError:
+            pass
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    server: "_ProxyServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        pass  # stdout belongs to the MCP stdio transport
+
+    def do_GET(self) -> None:
+        if self.path.startswith(("http://", "https://")):
+            url = self.path  # forward-proxy request (absolute-form)
+        elif self.path.startswith("/fetch?"):
+            url = parse_qs(urlsplit(self.path).query).get("url", [""])[0]
+        else:
+            self.send_error(404, "expected an absolute URL or /fetch?url=")
+            return
+        if not url.startswith(("http://", "https://")):
+            self.send_error(400, "bad url")
+            return
+        self.server.proxy.serve(self, url)
+
+
+class _ProxyServer(ThreadingHTTPServer):
+    daemon_threads = True
+    proxy: "AssetProxy"
+
+
+class AssetProxy:
+    """Embedded caching HTTP proxy for immutable static assets, shared by every browser.
+
+    Accepts ordinary forward-proxy GETs (``GET http://host/path``) and, for HTTPS assets
+    that a forward proxy can only see as opaque CONNECT tunnels, ``GET /fetch?url=...``.
+    Browsers reach the latter through a ``context.route`` hook (:func:`attach`). Only
+    URLs that :func:`is_static_asset` accepts and responses that are plain cacheable 200s
+    are stored; everything else is passed through and counted as ``bypassed``.
+    """
+
+    def __init__(self, store: AssetStore, *, host: str = "127.0.0.1", port: int = 0, timeout: float = 30.0) -> None:
+        self.store = store
+        self.timeout = timeout
+        self._server = _ProxyServer((host, port), _ProxyHandler)
+        self._server.proxy = self
+        self._thread: threading.Thread | None = None
+        self._pool = ConnectionPool(timeout=timeout)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._server.serve_forever, name="xhs-asset-proxy", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._pool.close()
+
+    def serve(self, handler: BaseHTTPRequestHandler, url: str) -> None:
+        cacheable = is_static_asset(url)
+        if cacheable:
+            cached = self.store.open(url)
+            if cached is not None:
+                body, size, content_type = cached
+                with body:
+                    self.store.count("hits")
+                    self.store.count("bytes_from_cache", size)
+                    handler.send_response(200)
+                    handler.send_header("Content-Type", content_type)
+                    handler.send_header("Content-Length", str(size))
+                    handler.send_header("Cache-Control", "public, max-age=31536000, immutable")
+                    handler.send_header("X-Cache", "HIT")
+                    handler.end_headers()
+                    shutil.copyfileobj(body, handler.wfile, _CHUNK)
+                return
+            self.store.count("misses")
+        else:
+            self.store.count("bypassed")
+        self._fetch(handler, url, store=cacheable)
+
+    def _fetch(self, handler: BaseHTTPRequestHandler, url: str, *, store: bool) -> None:
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+        headers = {name: handler.headers[name] for name in _FORWARD_HEADERS if handler.headers.get(name)}
+        key = host_key(parts)
+        for fresh in (False, True):
+            conn = self._pool.get(key, fresh=fresh)
+            try:
+                conn.request("GET", target, headers=headers)
+                response = conn.getresponse()
+                break
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                error = exc  # a pooled keep-alive connection may have been closed upstream; retry fresh
+        else:
+            handler.send_error(502, f"upstream failed: {type(error).__name__}")
+            return
+        writer = None
+        if store and _storable(response.status, response.headers):
+            writer = self.store.writer(url, response.headers.get("Content-Type", "application/octet-stream"))
+        handler.send_response(response.status)
+        # Location: CDN redirects are passed through (never stored) and followed by the browser.
+        for name in ("Content-Type", "Cache-Control", "Last-Modified", "ETag", "Location"):
+            if response.headers.get(name):
+                handler.send_header(name, response.headers[name])
+        length = response.headers.get("Content-Length")
+        if length is not None:
+            handler.send_header("Content-Length", length)
+        else:
+            handler.send_header("Connection", "close")
+            handler.close_connection = True
+        handler.send_header("X-Cache", "MISS" if writer is not None else "BYPASS")
+        handler.end_headers()
+        received = 0
+        try:
+            while chunk := response.read(_CHUNK):
+                received += len(chunk)
+                handler.wfile.write(chunk)
+                if writer is not None:
+                    writer.write(chunk)
+            # read(amt) returns b"" when upstream closes early instead of raising IncompleteRead.
+            if length is not None and received != int(length):
+                raise http.client.IncompleteRead(b"", int(length) - received)
+        except (OSError, http.client.HTTPException, ValueError):
+            if writer is not None:
+                writer.abort()
+            conn.close()
+            handler.close_connection = True
+            return
+        self.store.count("bytes_from_upstream", received)
+        if writer is not None:
+            writer.commit()
+        if response.will_close:
+            conn.close()
+        else:
+            self._pool.put(key, conn)
+
+    def stats(self) -> dict[str, Any]:
+        return {"url": self.url, **self.store.stats()}
+
+
+def fetch_url(proxy_url: str, url: str) -> str:
+    return f"{proxy_url}/fetch?url={quote(url, safe='')}"
+
+
+def attach(context: BrowserContext, proxy_url: str) -> None:
+    """Serve a context's static-asset GETs from the shared asset proxy.
+
+    Requests that fail through the proxy fall back to the network untouched.
+    """
+
+    def handle(route: Route) -> None:
+        request = route.request
+        if request.method != "GET":
+            route.fallback()
+            return
+        try:
+            response = route.fetch(url=fetch_url(proxy_url, request.url))
+        except Exception:
+            route.fallback()
+            return
+        if response.status >= 500:
+            route.fallback()
+            return
+        route.fulfill(response=response)
+
+    context.route(STATIC_URL, handle)
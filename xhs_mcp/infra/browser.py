@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
+import json
 from pathlib import Path
-from typing import Iterator
+from typing import TYPE_CHECKING, Iterator
 
-from playwright.sync_api import Browser, BrowserContext, Playwright, sync_playwright
 from .cookies import load_storage_state
 
+if TYPE_CHECKING:  # Playwright is imported on first use so CLIs start fast
+    from playwright.sync_api import Browser, BrowserContext, Page, Playwright
+
 
 def _stealth_context_args() -> dict:
     # Basic stealth: disable headless signals, tweak user agent, and reduce automation signals
@@ -24,10 +28,7 @@ def _stealth_context_args() -> dict:
     }
 
 
-@contextlib.contextmanager
-def launch(playwright: Playwright, chrome_bin: str | None = None) -> Iterator[Browser]:
-    # Prefer Chromium; allow custom executable to reduce detection.
-    chromium = playwright.chromium
+def _launch_args(chrome_bin: str | None = None) -> dict:
     launch_args = {
         "headless": True,
         "args": [
@@ -43,31 +44,186 @@ def launch(playwright: Playwright, chrome_bin: str | None = None) -> Iterator[Br
     }
     if chrome_bin:
         launch_args["executable_path"] = chrome_bin
+    return launch_args
+
+
+def launch_browser(playwright: Playwright, chrome_bin: str | None = None) -> Browser:
+    # Prefer Chromium; allow custom executable to reduce detection.
+    return playwright.chromium.launch(**_launch_args(chrome_bin))
 
-    browser = chromium.launch(**launch_args)
+
+@contextlib.contextmanager
+def launch(playwright: Playwright, chrome_bin: str | None = None) -> Iterator[Browser]:
+    browser = launch_browser(playwright, chrome_bin)
     try:
         yield browser
     finally:
         browser.close()
 
 
+def connect_browser(playwright: Playwright, ws_endpoint: str, timeout: float = 30_000) -> Browser:
+    # Remote hosts run `playwright run-server`; launch flags are owned by that host,
+    # stealth context options below still apply per context.
+    return playwright.chromium.connect(ws_endpoint, timeout=timeout)
+
+
 @contextlib.contextmanager
-def new_context(browser: Browser, storage_state_path: Path | None = None) -> Iterator[BrowserContext]:
+def connect(playwright: Playwright, ws_endpoint: str) -> Iterator[Browser]:
+    browser = connect_browser(playwright, ws_endpoint)
+    try:
+        yield browser
+    finally:
+        browser.close()
+
+
+def context_args(storage_state_path: Path | None = None) -> dict:
     ctx_args = _stealth_context_args()
     if storage_state_path and storage_state_path.exists():
         # Only inject storage_state if the file contains valid JSON
         state = load_storage_state(storage_state_path)
         if state is not None:
             ctx_args["storage_state"] = state
-    context = browser.new_context(**ctx_args)
+    return ctx_args
+
+
+def open_context(browser: Browser, storage_state_path: Path | None = None, asset_proxy: str | None = None) -> BrowserContext:
+    context = browser.new_context(**context_args(storage_state_path))
+    if asset_proxy:
+        from .asset_proxy import attach
+
+        attach(context, asset_proxy)
+    return context
+
+
+_RESTORE_LOCAL_STORAGE_JS = """
+(([origin, stamp, items]) => {
+  if (location.origin !== origin) return;
+  try {
+    // Once per state file: later navigations keep what the page itself stored.
+    if (localStorage.getItem('__xhs_mcp_state') === stamp) return;
+    for (const [name, value] of items) localStorage.setItem(name, value);
+    localStorage.setItem('__xhs_mcp_state', stamp);
+  } catch (e) {}
+})(%s);
+"""
+
+
+def _restore_local_storage(context: BrowserContext, state: dict) -> None:
+    """Replay the ``origins`` localStorage of a storage state into a persistent context.
+
+    ``launch_persistent_context`` takes no ``storage_state``; without this the tokens
+    the site keeps in localStorage would come from whatever the profile directory had.
+    """
+    origins = state.get("origins") or []
+    stamp = hashlib.sha1(json.dumps(origins, sort_keys=True).encode()).hexdigest()[:16]
+    for entry in origins:
+        items = [[item["name"], item["value"]] for item in entry.get("localStorage") or []]
+        if entry.get("origin") and items:
+            context.add_init_script(_RESTORE_LOCAL_STORAGE_JS % json.dumps([entry["origin"], stamp, items]))
+
+
+@contextlib.contextmanager
+def new_context(
+    browser: Browser,
+    storage_state_path: Path | None = None,
+    asset_proxy: str | None = None,
+) -> Iterator[BrowserContext]:
+    context = open_context(browser, storage_state_path, asset_proxy)
+    try:
+        yield context
+    finally:
+        context.close()
+
+
+def launch_persistent(
+    playwright: Playwright,
+    user_data_dir: Path,
+    storage_state_path: Path | None = None,
+    chrome_bin: str | None = None,
+    cache_mb: float | None = None,
+    asset_proxy: str | None = None,
+) -> BrowserContext:
+    """Launch a browser on a persistent user-data directory and return its single context.
+
+    Unlike ``new_context`` contexts (off-the-record, memory cache only), this one keeps
+    Chromium's disk cache between runs. Cookies and localStorage always come from the
+    cookies file: the directory only carries caches, so whatever it remembered is replaced.
+    """
+    launch_args = _launch_args(chrome_bin)
+    if cache_mb:
+        launch_args["args"].append(f"--disk-cache-size={int(cache_mb * 1024 * 1024)}")
+    ctx_args = context_args(storage_state_path)
+    state = ctx_args.pop("storage_state", None)
+    context = playwright.chromium.launch_persistent_context(str(user_data_dir), **launch_args, **ctx_args)
+    try:
+        context.clear_cookies()
+        if state and state.get("cookies"):
+            context.add_cookies(state["cookies"])
+        if state:
+            _restore_local_storage(context, state)
+        if asset_proxy:
+            from .asset_proxy import attach
+
+            attach(context, asset_proxy)
+    except Exception:
+        context.close()
+        raise
+    return context
+
+
+@contextlib.contextmanager
+def persistent_context(
+    playwright: Playwright,
+    user_data_dir: Path,
+    storage_state_path: Path | None = None,
+    chrome_bin: str | None = None,
+    cache_mb: float | None = None,
+    asset_proxy: str | None = None,
+) -> Iterator[BrowserContext]:
+    context = launch_persistent(playwright, user_data_dir, storage_state_path, chrome_bin, cache_mb, asset_proxy)
     try:
         yield context
     finally:
         context.close()
 
 
+@contextlib.contextmanager
+def debug_capture(
+    context: BrowserContext,
+    page: Page,
+    debug_dir: Path | None,
+    trace: bool = False,
+) -> Iterator[None]:
+    """Dump DOM, screenshot, console log (and optional trace) after the wrapped block."""
+    console_logs: list[str] = []
+    if trace and debug_dir:
+        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    if debug_dir is not None:
+        page.on("console", lambda msg: console_logs.append(f"[{msg.type}] {msg.text}"))
+
+    try:
+        yield
+    finally:
+        if debug_dir is not None:
+            debug_dir.mkdir(parents=True, exist_ok=True)
+            (debug_dir / "dom.html").write_text(page.content(), encoding="utf-8")
+
+            screenshot_path = debug_dir / "page.png"
+            try:
+                page.screenshot(path=str(screenshot_path), full_page=True)
+            except Exception as exc:
+                (debug_dir / "screenshot-error.log").write_text(str(exc), encoding="utf-8")
+
+            (debug_dir / "console.log").write_text("\n".join(console_logs), encoding="utf-8")
+
+        if trace and debug_dir:
+            context.tracing.stop(path=str(debug_dir / "trace.zip"))
+
+
 @contextlib.contextmanager
 def pw() -> Iterator[Playwright]:
+    from playwright.sync_api import sync_playwright
+
     p = sync_playwright().start()
     try:
         yield p
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # optional: the stdlib json module is used instead
+
+
+_MISSING = object()
+
+
+def backend() -> str:
+    return "orjson" if orjson is not None else "json"
+
+
+def loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize to a UTF-8 JSON string (non-ASCII kept as-is, like ``ensure_ascii=False``)."""
+    if orjson is not None:
+        try:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(obj, default=str, option=option | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles those
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None, default=str)
+
+
+def evaluate_json(page: Any, expression: str, arg: Any = _MISSING) -> Any:
+    """Evaluate ``expression`` in the page, which must return a JSON string (or "" for none).
+
+    Large ``__INITIAL_STATE__`` slices are stringified in the page on purpose: V8's
+    ``JSON.stringify`` plus one native parse here is several times faster than letting
+    Playwright transfer the object, which encodes every value as a tagged tree and
+    rebuilds it node by node in Python (see scripts/bench_codec.py). Small, targeted
+    reads should return plain values from ``page.evaluate`` instead.
+    """
+    payload = page.evaluate(expression) if arg is _MISSING else page.evaluate(expression, arg)
+    if not payload:
+        return None
+    return loads(payload)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 import os
 from pathlib import Path
 from typing import Any
 
+from .codec import dumps, loads
+
 
 def load_storage_state(path: Path) -> dict | None:
     """Load storage_state JSON from file.
@@ -17,7 +18,7 @@ def load_storage_state(path: Path) -> dict | None:
         text = path.read_text(encoding="utf-8")
         if not text or not text.strip():
             return None
-        data = json.loads(text)
+        data = loads(text)
         if isinstance(data, dict):
             return data
         return None
@@ -39,5 +40,5 @@ def save_storage_state(path: Path, state: dict) -> None:
     """Persist storage_state atomically to avoid empty/truncated files."""
     # Ensure state is a dict; fallback to minimal structure if not
     data: dict[str, Any] = state if isinstance(state, dict) else {}
-    payload = json.dumps(data, ensure_ascii=False, indent=2)
+    payload = dumps(data, indent=True)
     _atomic_write(path, payload)
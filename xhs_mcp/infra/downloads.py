@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+import hashlib
+import http.client
+import mimetypes
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Sequence
+from urllib.parse import urljoin, urlsplit
+
+from . import metrics
+from .codec import dumps, loads
+from .cookies import _atomic_write
+from .http_pool import ConnectionPool, host_key
+
+
+DOWNLOADED = "downloaded"
+RESUMED = "resumed"
+EXISTS = "exists"
+DUPLICATE = "duplicate"
+FAILED = "failed"
+
+INDEX_FILE = ".media-index.json"
+_PARTIAL_SUFFIXES = (".part", ".part.meta", ".tmp")
+_CHUNK = 256 * 1024
+_MAX_REDIRECTS = 5
+_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/webp": ".webp",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/heic": ".heic",
+    "image/avif": ".avif",
+    "video/mp4": ".mp4",
+    "video/quicktime": ".mov",
+}
+
+
+@dataclass(slots=True)
+class DownloadRequest:
+    urls: Sequence[str]
+    # Target path without extension; the extension comes from the response's content type.
+    stem: Path
+
+
+@dataclass(slots=True)
+class DownloadResult:
+    url: str
+    path: str | None
+    status: str
+    bytes: int = 0
+    sha256: str | None = None
+    error: str | None = None
+    seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def cookie_header(state: dict[str, Any] | None, host: str) -> str | None:
+    """``Cookie`` header for ``host`` built from a Playwright storage state."""
+    if not state:
+        return None
+    pairs = []
+    for cookie in state.get("cookies") or []:
+        domain = (cookie.get("domain") or "").lstrip(".")
+        if domain and (host == domain or host.endswith("." + domain)):
+            pairs.append(f"{cookie['name']}={cookie['value']}")
+    return "; ".join(pairs) or None
+
+
+def _extension(content_type: str | None, url: str) -> str:
+    mime = (content_type or "").split(";")[0].strip().lower()
+    if mime in _EXTENSIONS:
+        return _EXTENSIONS[mime]
+    suffix = Path(urlsplit(url).path).suffix
+    if suffix and len(suffix) <= 5:
+        return suffix
+    return mimetypes.guess_extension(mime) or ".bin"
+
+
+class _Incomplete(Exception):
+    """The connection ended early; the part file keeps what arrived for a resume."""
+
+
+class _Rejected(Exception):
+    """The server refused the URL; retrying the same URL will not help."""
+
+
+class MediaDownloader:
+    """Concurrent, resumable downloads over pooled keep-alive connections.
+
+    Bodies stream to ``<stem>.part`` in chunks and are renamed once complete, so an
+    interrupted file resumes with an HTTP ``Range`` request on the next run. The
+    ``<stem>.part.meta`` sidecar remembers which URL (and ETag) wrote the part file;
+    only that URL resumes it, any other starts over. Finished
+    files are hashed and recorded in ``<dest>/.media-index.json``; a file whose SHA-256
+    is already known elsewhere under ``dest`` is removed and reported as ``duplicate``
+    pointing at the existing copy (and is not fetched again on later runs). At most ``per_host`` transfers hit one host at a time.
+    """
+
+    def __init__(
+        self,
+        dest: Path,
+        *,
+        headers: dict[str, str] | None = None,
+        cookies: dict[str, Any] | None = None,
+        concurrency: int = 8,
+        per_host: int = 4,
+        timeout: float = 30.0,
+        retries: int = 2,
+    ) -> None:
+        self.dest = dest
+        self.headers = dict(headers or {})
+        self.cookies = cookies
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.retries = retries
+        self._pool = ConnectionPool(timeout=timeout, max_idle=self.per_host)
+        self._lock = threading.Lock()
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._index_path = dest / INDEX_FILE
+        # sha256 -> file path, and duplicate stem -> sha256 of the copy it points at.
+        self._index: dict[str, str] = {}
+        self._aliases: dict[str, str] = {}
+
+    def _load_index(self) -> None:
+        try:
+            raw = loads(self._index_path.read_bytes())
+        except (OSError, ValueError):
+            raw = {}
+        if not isinstance(raw, dict):
+            raw = {}
+        self._index = {k: v for k, v in (raw.get("files") or {}).items() if (self.dest / v).exists()}
+        self._aliases = {k: v for k, v in (raw.get("aliases") or {}).items() if v in self._index}
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return slot
+
+    def download(
+        self,
+        requests: Sequence[DownloadRequest],
+        on_done: Callable[[DownloadResult, int, int], None] | None = None,
+    ) -> list[DownloadResult]:
+        """Download every request; ``on_done(result, finished, total)`` runs in the caller's thread."""
+        self.dest.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+        results: list[DownloadResult | None] = [None] * len(requests)
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="xhs-media") as pool:
+                futures = {pool.submit(self._download_safely, request): i for i, request in enumerate(requests)}
+                for finished, future in enumerate(as_completed(futures), 1):
+                    result = future.result()
+                    results[futures[future]] = result
+                    metrics.incr(f"media.{result.status}")
+                    if on_done is not None:
+                        on_done(result, finished, len(requests))
+        finally:
+            self._pool.close()
+            with self._lock:
+                _atomic_write(self._index_path, dumps({"files": self._index, "aliases": self._aliases}, indent=True))
+        return [r for r in results if r is not None]
+
+    def _download_safely(self, request: DownloadRequest) -> DownloadResult:
+        try:
+            return self._download_one(request)
+        except Exception as exc:  # e.g. the destination is not writable
+            return DownloadResult(request.urls[0], None, FAILED, error=f"{type(exc).__name__}: {exc}")
+
+    def _download_one(self, request: DownloadRequest) -> DownloadResult:
+        started = time.monotonic()
+        stem = request.stem
+        stem.parent.mkdir(parents=True, exist_ok=True)
+        existing = [p for p in stem.parent.glob(stem.name + ".*") if not p.name.endswith(_PARTIAL_SUFFIXES)]
+        if existing:
+            path = existing[0]
+            return DownloadResult(
+                request.urls[0], str(path), EXISTS, path.stat().st_size, self._known_hash(path), seconds=0.0
+            )
+        with self._lock:
+            digest = self._aliases.get(str(stem.relative_to(self.dest)))
+            known = self._index.get(digest) if digest else None
+        if known is not None:
+            path = self.dest / known
+            return DownloadResult(request.urls[0], str(path), DUPLICATE, path.stat().st_size, digest)
+
+        part = stem.with_name(stem.name + ".part")
+        errors: list[str] = []
+        for url in request.urls:
+            for _attempt in range(self.retries + 1):
+                try:
+                    content_type, digest, size, resumed = self._fetch(url, part)
+                except (OSError, http.client.HTTPException, _Incomplete) as exc:
+                    errors.append(f"{urlsplit(url).hostname}: {type(exc).__name__}: {exc}")
+                    continue
+                except _Rejected as exc:
+                    errors.append(f"{urlsplit(url).hostname}: {exc}")
+                    break  # a 4xx will not change on retry; try the next URL
+                path = stem.with_name(stem.name + _extension(content_type, url))
+                os.replace(part, path)
+                _meta_path(part).unlink(missing_ok=True)
+                path, duplicate = self._dedup(path, digest)
+                status = DUPLICATE if duplicate else RESUMED if resumed else DOWNLOADED
+                metrics.observe("media.bytes", size)
+                return DownloadResult(url, str(path), status, size, digest, seconds=round(time.monotonic() - started, 3))
+        return DownloadResult(
+            request.urls[0],
+            None,
+            FAILED,
+            error="; ".join(errors[-3:]) or "no url",
+            seconds=round(time.monotonic() - started, 3),
+        )
+
+    def _known_hash(self, path: Path) -> str | None:
+        relative = str(path.relative_to(self.dest))
+        with self._lock:
+            for digest, known in self._index.items():
+                if known == relative:
+                    return digest
+        digest = _hash_file(path)
+        with self._lock:
+            self._index.setdefault(digest, relative)
+        return digest
+
+    def _dedup(self, path: Path, digest: str) -> tuple[Path, bool]:
+        relative = str(path.relative_to(self.dest))
+        with self._lock:
+            known = self._index.get(digest)
+            if known is not None and known != relative and (self.dest / known).exists():
+                path.unlink()
+                self._aliases[str(path.with_suffix("").relative_to(self.dest))] = digest
+                return self.dest / known, True
+            self._index[digest] = relative
+        return path, False
+
+    def _fetch(self, url: str, part: Path) -> tuple[str | None, str, int, bool]:
+        """Stream ``url`` into ``part`` (resuming it) and return (content type, sha256, size, resumed)."""
+        source = url
+        meta = _read_meta(part)
+        offset = part.stat().st_size if part.exists() and meta.get("url") == source else 0
+        hasher = hashlib.sha256()
+        if offset:
+            _hash_into(hasher, part)
+        for _redirect in range(_MAX_REDIRECTS):
+            parts = urlsplit(url)
+            with self._slot(parts.hostname or ""):
+                response, conn, key = self._request(url, offset, meta.get("etag"))
+                reusable = False
+                try:
+                    if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+                        response.read()
+                        reusable = True
+                        url = urljoin(url, response.getheader("Location"))
+                        continue
+                    if response.status == 416 and offset:
+                        response.read()
+                        reusable = True
+                        if _range_total(response.getheader("Content-Range")) == offset:
+                            # Nothing left past the part file: the previous run got every byte.
+                            return meta.get("content_type"), hasher.hexdigest(), offset, True
+                        _discard_part(part)
+                        raise _Incomplete("part file does not match the remote size; starting over")
+                    if response.status == 206 and _range_start(response.getheader("Content-Range")) != offset:
+                        _discard_part(part)
+                        raise _Incomplete("server answered a different range; starting over")
+                    if response.status == 200 and offset:
+                        offset = 0  # Range ignored, or If-Range saw a changed file; start over
+                        hasher = hashlib.sha256()
+                    elif response.status not in (200, 206):
+                        response.read()
+                        reusable = True
+                        raise _Rejected(f"HTTP {response.status}")
+                    if not offset:
+                        meta = {
+                            "url": source,
+                            "etag": response.getheader("ETag"),
+                            "content_type": response.getheader("Content-Type"),
+                        }
+                        _atomic_write(_meta_path(part), dumps(meta))
+                    expected = response.getheader("Content-Length")
+                    received = 0
+                    with open(part, "ab" if offset else "wb") as handle:
+                        while chunk := response.read(_CHUNK):
+                            handle.write(chunk)
+                            hasher.update(chunk)
+                            received += len(chunk)
+                    if expected is not None and received != int(expected):
+                        raise _Incomplete(f"got {received} of {expected} bytes")
+                    reusable = True
+                    return meta.get("content_type"), hasher.hexdigest(), offset + received, offset > 0
+                finally:
+                    if reusable and not response.will_close:
+                        self._pool.put(key, conn)
+                    else:
+                        conn.close()
+        raise _Rejected("too many redirects")
+
+    def _request(self, url: str, offset: int, etag: str | None = None):
+        parts = urlsplit(url)
+        key = host_key(parts)
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+        headers = dict(self.headers)
+        cookie = cookie_header(self.cookies, parts.hostname or "")
+        if cookie:
+            headers["Cookie"] = cookie
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            if etag and not etag.startswith("W/"):
+                headers["If-Range"] = etag  # a changed file comes back whole as a 200
+        error: Exception | None = None
+        for fresh in (False, True):
+            conn = self._pool.get(key, fresh=fresh)
+            try:
+                conn.request("GET", target, headers=headers)
+                return conn.getresponse(), conn, key
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                error = exc  # a pooled keep-alive connection may have been closed upstream
+        assert error is not None
+        raise error
+
+
+def _meta_path(part: Path) -> Path:
+    return part.with_name(part.name + ".meta")
+
+
+def _read_meta(part: Path) -> dict[str, Any]:
+    try:
+        meta = loads(_meta_path(part).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def _discard_part(part: Path) -> None:
+    part.unlink(missing_ok=True)
+    _meta_path(part).unlink(missing_ok=True)
+
+
+def _range_start(content_range: str | None) -> int | None:
+    """First byte of ``Content-Range: bytes <start>-<end>/<total>``."""
+    try:
+        return int((content_range or "").split()[1].split("-", 1)[0])
+    except (IndexError, ValueError):
+        return None
+
+
+def _range_total(content_range: str | None) -> int | None:
+    """Total size from ``Content-Range: bytes */<total>`` (or ``bytes <range>/<total>``)."""
+    try:
+        return int((content_range or "").rsplit("/", 1)[1])
+    except (IndexError, ValueError):
+        return None
+
+
+def _hash_into(hasher: Any, path: Path) -> None:
+    with open(path, "rb") as handle:
+        while chunk := handle.read(_CHUNK):
+            hasher.update(chunk)
+
+
+def _hash_file(path: Path) -> str:
+    hasher = hashlib.sha256()
+    _hash_into(hasher, path)
+    return hasher.hexdigest()
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import IO, Any
+
+from .codec import dumps
+
+try:
+    import zstandard  # type: ignore
+except Exception:
+    zstandard = None  # optional: needed only for jsonl.zst exports
+
+try:
+    import pyarrow  # type: ignore
+    import pyarrow.parquet as parquet  # type: ignore
+except Exception:
+    pyarrow = None  # optional: needed only for parquet exports
+    parquet = None
+
+
+JSONL = "jsonl"
+JSONL_ZST = "jsonl.zst"
+PARQUET = "parquet"
+EXTENSIONS = {JSONL: ".jsonl", JSONL_ZST: ".jsonl.zst", PARQUET: ".parquet"}
+
+# Top-level keys not seen in the first row group land here as one JSON object per row.
+EXTRA_COLUMN = "_extra"
+
+
+def check_format(fmt: str) -> None:
+    if fmt not in EXTENSIONS:
+        raise ValueError(f"export format must be one of {', '.join(EXTENSIONS)}")
+    if fmt == JSONL_ZST and zstandard is None:
+        raise RuntimeError("jsonl.zst export needs the zstandard package (pip install zstandard)")
+    if fmt == PARQUET and pyarrow is None:
+        raise RuntimeError("parquet export needs the pyarrow package (pip install pyarrow)")
+
+
+def default_path(directory: Path, name: str, fmt: str) -> Path:
+    return directory / f"{name}-{time.strftime('%Y%m%d-%H%M%S')}{EXTENSIONS[fmt]}"
+
+
+class ExportWriter:
+    """Append items to a JSONL (optionally zstd) or Parquet file as they are produced.
+
+    Only a bounded buffer is held: JSONL is flushed every ``flush_rows`` rows, Parquet is
+    written one row group of ``row_group_rows`` rows at a time. Parquet columns are the
+    first row group's top-level keys, all stored as strings (nested values as JSON);
+    keys that only appear later go to the ``_extra`` column. A failed export removes the
+    partial file.
+    """
+
+    def __init__(self, path: Path, fmt: str = JSONL, *, flush_rows: int = 500, row_group_rows: int = 5000) -> None:
+        check_format(fmt)
+        self.path = path
+        self.format = fmt
+        self.flush_rows = flush_rows
+        self.row_group_rows = row_group_rows
+        self.rows = 0
+        self._raw: IO[bytes] | None = None
+        self._stream: Any = None
+        self._pending: list[dict[str, Any]] = []
+        self._columns: list[str] | None = None
+        self._parquet: Any = None
+
+    def __enter__(self) -> "ExportWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.format != PARQUET:
+            self._raw = open(self.path, "wb")
+            self._stream = (
+                zstandard.ZstdCompressor(level=10).stream_writer(self._raw)
+                if self.format == JSONL_ZST
+                else self._raw
+            )
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        try:
+            self.close()
+        finally:
+            if exc_type is not None:
+                self.path.unlink(missing_ok=True)
+
+    def write(self, item: dict[str, Any]) -> None:
+        self.rows += 1
+        if self.format == PARQUET:
+            self._pending.append(item)
+            if len(self._pending) >= self.row_group_rows:
+                self._write_row_group()
+            return
+        self._stream.write((dumps(item) + "\n").encode("utf-8"))
+        if self.rows % self.flush_rows == 0:
+            self._stream.flush()
+
+    def _write_row_group(self) -> None:
+        if not self._pending:
+            return
+        if self._columns is None:
+            columns = dict.fromkeys(key for item in self._pending for key in item)
+            self._columns = [*columns, EXTRA_COLUMN]
+            schema = pyarrow.schema([(name, pyarrow.string()) for name in self._columns])
+            self._parquet = parquet.ParquetWriter(str(self.path), schema, compression="zstd")
+        known = set(self._columns)
+        data: dict[str, list[str | None]] = {name: [] for name in self._columns}
+        for item in self._pending:
+            for name in self._columns[:-1]:
+                data[name].append(_cell(item.get(name)))
+            extra = {k: v for k, v in item.items() if k not in known}
+            data[EXTRA_COLUMN].append(dumps(extra) if extra else None)
+        self._parquet.write_table(pyarrow.table(data, schema=self._parquet.schema))
+        self._pending.clear()
+
+    def close(self) -> None:
+        if self.format == PARQUET:
+            self._write_row_group()
+            if self._parquet is not None:
+                self._parquet.close()
+                self._parquet = None
+            elif not self.path.exists():
+                # No rows at all: still leave a valid (empty) file behind.
+                parquet.write_table(pyarrow.table({EXTRA_COLUMN: pyarrow.array([], pyarrow.string())}), str(self.path))
+            return
+        if self._stream is not None:
+            self._stream.flush()
+            if self._stream is not self._raw:
+                self._stream.close()  # writes the zstd frame footer and closes the file
+            else:
+                self._raw.close()
+            self._stream = self._raw = None
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "format": self.format,
+            "rows": self.rows,
+            "bytes": self.path.stat().st_size if self.path.exists() else 0,
+        }
+
+
+def _cell(value: Any) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    return dumps(value)
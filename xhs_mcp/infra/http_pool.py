@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import http.client
+import threading
+from urllib.parse import SplitResult
+
+
+HostKey = tuple[str, str, int | None]
+
+
+def host_key(parts: SplitResult) -> HostKey:
+    return (parts.scheme, parts.hostname or "", parts.port)
+
+
+class ConnectionPool:
+    """Idle keep-alive ``http.client`` connections per (scheme, host, port).
+
+    ``get`` hands out an idle connection or opens a new one; ``put`` returns it for reuse
+    (keeping at most ``max_idle`` per host). A pooled connection may have been closed by
+    the server in the meantime, so callers retry once with ``fresh=True``.
+    """
+
+    def __init__(self, *, timeout: float = 30.0, max_idle: int = 4) -> None:
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._idle: dict[HostKey, list[http.client.HTTPConnection]] = {}
+
+    def get(self, key: HostKey, *, fresh: bool = False) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if not fresh:
+            with self._lock:
+                conns = self._idle.get(key)
+                if conns:
+                    return conns.pop()
+        conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return conn_cls(host, port, timeout=self.timeout)
+
+    def put(self, key: HostKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < self.max_idle:
+                conns.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
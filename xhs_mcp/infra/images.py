@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import hashlib
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+try:
+    from PIL import Image, ImageOps  # type: ignore
+except Exception:
+    Image = None  # optional: without Pillow images are uploaded as-is
+    ImageOps = None
+
+
+# Notes are rendered at most ~1440px wide on the web and apps; larger sources only
+# cost upload time before the platform downsamples them again.
+DEFAULT_MAX_EDGE = 2560
+DEFAULT_QUALITY = 88
+DEFAULT_CACHE_DIR = Path(tempfile.gettempdir()) / "xhs-mcp-images"
+
+_EXIF_ORIENTATION = 0x0112
+_PASSTHROUGH_FORMATS = {"JPEG", "PNG", "WEBP"}
+_PASSTHROUGH_BYTES = 2 * 1024 * 1024
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+@dataclass(slots=True)
+class ImageOptions:
+    max_edge: int = DEFAULT_MAX_EDGE
+    quality: int = DEFAULT_QUALITY
+    cache_dir: Path = DEFAULT_CACHE_DIR
+
+    def cache_tag(self) -> str:
+        return f"e{self.max_edge}q{self.quality}"
+
+
+def pillow_available() -> bool:
+    return Image is not None
+
+
+def _executor() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn, not fork: the server process has Playwright, anyio and worker-pool threads.
+            _pool = ProcessPoolExecutor(
+                max_workers=max(1, min(4, os.cpu_count() or 1)),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def shutdown_image_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
+
+
+def _discard_pool(broken: ProcessPoolExecutor) -> None:
+    # A pool whose worker died stays broken; drop it so the next call spawns a fresh one.
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def _content_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _prepare_one(path_str: str, options: ImageOptions) -> str:
+    """Validate, orient, downscale and re-encode one image; return the path to upload.
+
+    Runs inside the process pool. Images that are already small, upright and in an
+    accepted format are returned unchanged to avoid a lossy re-encode.
+    """
+    path = Path(path_str)
+    key = f"{_content_hash(path)}-{options.cache_tag()}"
+    for suffix in (".jpg", ".png"):
+        cached = options.cache_dir / f"{key}{suffix}"
+        if cached.exists():
+            return str(cached)
+
+    with Image.open(path) as probe:
+        probe.verify()  # raises on truncated/corrupt files
+
+    with Image.open(path) as img:
+        orientation = img.getexif().get(_EXIF_ORIENTATION, 1)
+        too_large = max(img.size) > options.max_edge
+        if (
+            not too_large
+            and orientation == 1
+            and img.format in _PASSTHROUGH_FORMATS
+            and path.stat().st_size <= _PASSTHROUGH_BYTES
+        ):
+            return str(path)
+
+        out = ImageOps.exif_transpose(img)
+        if too_large:
+            out.thumbnail((options.max_edge, options.max_edge), Image.LANCZOS)
+
+        has_alpha = out.mode in ("RGBA", "LA") or (out.mode == "P" and "transparency" in out.info)
+        options.cache_dir.mkdir(parents=True, exist_ok=True)
+        target = options.cache_dir / f"{key}{'.png' if has_alpha else '.jpg'}"
+        # One pool process handles one job at a time, so the pid keeps concurrent jobs
+        # for the same image (same target) from sharing a tmp file.
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            if has_alpha:
+                out.save(tmp, format="PNG", optimize=True)
+            else:
+                out.convert("RGB").save(tmp, format="JPEG", quality=options.quality, optimize=True, progressive=True)
+            os.replace(tmp, target)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return str(target)
+
+
+def prepare_images(paths: Sequence[str], options: ImageOptions | None = None) -> list[str]:
+    """Pre-process images for upload in a process pool, preserving order.
+
+    Without Pillow installed the original paths are returned unchanged. An image listed
+    more than once is processed once.
+    """
+    if not paths or Image is None:
+        return list(paths)
+    options = options or ImageOptions()
+    executor = _executor()
+    results: dict[str, str] = {}
+    try:
+        futures = {path: executor.submit(_prepare_one, path, options) for path in dict.fromkeys(map(str, paths))}
+        for path, future in futures.items():
+            try:
+                results[path] = future.result()
+            except BrokenProcessPool:
+                raise
+            except Exception as exc:
+                raise ValueError(f"invalid image {path}: {exc}") from exc
+    except BrokenProcessPool as exc:
+        _discard_pool(executor)
+        raise RuntimeError(f"image worker pool broke: {exc}") from exc
+    return [results[str(path)] for path in paths]
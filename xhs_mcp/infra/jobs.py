@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from .codec import dumps, loads
+from .cookies import _atomic_write
+
+
+PENDING = "pending"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+INTERRUPTED = "interrupted"
+
+FINISHED_STATES = {SUCCEEDED, FAILED, CANCELLED, INTERRUPTED}
+
+# Job bodies receive (on_progress, cancel_event) and return a JSON-serializable result.
+JobBody = Callable[[Callable[[float | None, str], None], threading.Event], Any]
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    params: dict[str, Any] = field(default_factory=dict)
+    status: str = PENDING
+    phase: str = "queued"
+    progress: float | None = None
+    result: Any = None
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+
+    def snapshot(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class JobManager:
+    """Runs long tool calls in background threads and persists their state to a JSON file.
+
+    Jobs that were pending or running when the previous server process exited are
+    reloaded as ``interrupted`` so callers can still see what happened to them.
+    """
+
+    def __init__(self, path: Path, *, keep_finished: int = 200, flush_interval: float = 1.0) -> None:
+        self.path = path
+        self.keep_finished = keep_finished
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._jobs: dict[str, Job] = {}
+        self._cancel_events: dict[str, threading.Event] = {}
+        self._last_flush = 0.0
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            raw = loads(self.path.read_bytes())
+        except Exception:
+            return
+        for item in raw if isinstance(raw, list) else []:
+            try:
+                job = Job(**item)
+            except TypeError:
+                continue
+            if job.status not in FINISHED_STATES:
+                job.status = INTERRUPTED
+                job.error = f"server restarted during phase '{job.phase}'"
+                job.finished_at = time.time()
+            self._jobs[job.id] = job
+        self._flush(force=True)
+
+    def _flush(self, force: bool = False) -> None:
+        # Caller holds the lock (or is in __init__).
+        now = time.time()
+        if not force and now - self._last_flush < self.flush_interval:
+            return
+        self._last_flush = now
+        finished = sorted(
+            (j for j in self._jobs.values() if j.status in FINISHED_STATES),
+            key=lambda j: j.finished_at or j.updated_at,
+        )
+        for job in finished[: max(0, len(finished) - self.keep_finished)]:
+            self._jobs.pop(job.id, None)
+        payload = dumps([j.snapshot() for j in self._jobs.values()])
+        _atomic_write(self.path, payload)
+
+    def submit(self, kind: str, body: JobBody, params: dict[str, Any] | None = None) -> Job:
+        job = Job(id=uuid.uuid4().hex[:16], kind=kind, params=params or {})
+        cancel_event = threading.Event()
+        with self._lock:
+            self._jobs[job.id] = job
+            self._cancel_events[job.id] = cancel_event
+            self._flush(force=True)
+        thread = threading.Thread(
+            target=self._run,
+            args=(job, body, cancel_event),
+            name=f"xhs-job-{job.id}",
+            daemon=True,
+        )
+        thread.start()
+        return job
+
+    def _update(self, job: Job, *, force: bool = False, **changes: Any) -> None:
+        with self._lock:
+            for key, value in changes.items():
+                setattr(job, key, value)
+            job.updated_at = time.time()
+            if job.status in FINISHED_STATES and job.finished_at is None:
+                job.finished_at = job.updated_at
+            self._flush(force=force)
+
+    def _run(self, job: Job, body: JobBody, cancel_event: threading.Event) -> None:
+        from xhs_mcp.xhs.base import ActionCancelled
+
+        self._update(job, force=True, status=RUNNING, phase="starting")
+
+        def on_progress(progress: float | None, phase: str) -> None:
+            self._update(job, force=phase != job.phase, progress=progress, phase=phase)
+
+        try:
+            result = body(on_progress, cancel_event)
+        except ActionCancelled:
+            self._update(job, force=True, status=CANCELLED, error="cancelled by request")
+        except Exception as exc:
+            status = CANCELLED if cancel_event.is_set() else FAILED
+            self._update(job, force=True, status=status, error=f"{type(exc).__name__}: {exc}")
+        else:
+            self._update(job, force=True, status=SUCCEEDED, phase="done", progress=100.0, result=result)
+        finally:
+            with self._lock:
+                self._cancel_events.pop(job.id, None)
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Request cancellation; returns False when the job is unknown or already finished."""
+        with self._lock:
+            event = self._cancel_events.get(job_id)
+            job = self._jobs.get(job_id)
+            if event is None or job is None or job.status in FINISHED_STATES:
+                return False
+            event.set()
+            job.phase = "cancelling"
+            job.updated_at = time.time()
+            self._flush(force=True)
+            return True
+
+    def list(self, *, active_only: bool = False) -> list[Job]:
+        with self._lock:
+            jobs = list(self._jobs.values())
+        if active_only:
+            jobs = [j for j in jobs if j.status not in FINISHED_STATES]
+        return sorted(jobs, key=lambda j: j.created_at, reverse=True)
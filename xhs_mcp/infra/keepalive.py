@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from . import metrics
+from .cookies import load_storage_state, save_storage_state
+
+
+SESSION_COOKIE = "web_session"
+
+# Runs one cheap logged-in page load for (profile, cookies file); returns the storage state
+# to persist, or None when the session is no longer logged in.
+RefreshFn = Callable[[str, Path], dict[str, Any] | None]
+
+
+def session_expiry(state: dict[str, Any] | None, cookie_name: str = SESSION_COOKIE) -> float | None:
+    """Expiry (epoch seconds) of the login cookie in a storage state; ``None`` when absent or session-only."""
+    for cookie in (state or {}).get("cookies") or []:
+        if isinstance(cookie, dict) and cookie.get("name") == cookie_name:
+            expires = cookie.get("expires")
+            return float(expires) if isinstance(expires, (int, float)) and expires > 0 else None
+    return None
+
+
+def discover_profiles(profiles_dir: Path, cookies_name: str = "cookies.json") -> dict[str, Path]:
+    return {path.parent.name: path for path in sorted(profiles_dir.glob(f"*/{cookies_name}"))}
+
+
+def _lower_priority(niceness: int) -> None:
+    # Per-thread on Linux; the Playwright driver and browsers started from this thread inherit it.
+    try:
+        tid = threading.get_native_id()
+        if os.getpriority(os.PRIO_PROCESS, tid) < niceness:
+            os.setpriority(os.PRIO_PROCESS, tid, niceness)
+    except (AttributeError, OSError):
+        pass
+
+
+@dataclass
+class ProfileHealth:
+    profile: str
+    cookies_file: str
+    next_run_at: float
+    expires_at: float | None = None
+    logged_in: bool | None = None
+    last_run_at: float | None = None
+    last_refresh_at: float | None = None
+    last_error: str | None = None
+    runs: int = 0
+    failures: int = 0
+
+    def snapshot(self, now: float, warn_before: float) -> dict[str, Any]:
+        expires_in = self.expires_at - now if self.expires_at is not None else None
+        return {
+            **asdict(self),
+            "expires_in_s": expires_in,
+            "expiring": expires_in is not None and expires_in < warn_before,
+        }
+
+
+class KeepAliveScheduler:
+    """Periodically exercises every saved profile so its session stays fresh, and tracks expiry.
+
+    Profiles are the ``<profiles_dir>/*/cookies.json`` files, rediscovered on every tick;
+    their cookie expiry is read from the file right away, before any browser run. Each
+    run calls ``refresh`` and saves the returned storage state (a logged-out result
+    leaves the file alone). Runs go one at a time on a low-priority thread, each
+    profile's next run is jittered by ``±jitter × interval`` so accounts do not hit the
+    site in lockstep, and due runs wait (up to ``max_defer`` seconds) while ``is_busy``
+    reports user calls in flight.
+    """
+
+    def __init__(
+        self,
+        profiles_dir: Path,
+        refresh: RefreshFn,
+        *,
+        interval: float = 6 * 3600.0,
+        jitter: float = 0.2,
+        warn_before: float = 3 * 86400.0,
+        tick: float = 60.0,
+        max_defer: float = 1800.0,
+        niceness: int = 10,
+        is_busy: Callable[[], bool] | None = None,
+    ) -> None:
+        self.profiles_dir = profiles_dir
+        self.refresh = refresh
+        self.interval = interval
+        self.jitter = min(max(jitter, 0.0), 0.9)
+        self.warn_before = warn_before
+        self.tick = tick
+        self.max_defer = max_defer
+        self.niceness = niceness
+        self.is_busy = is_busy
+        self._cond = threading.Condition()
+        self._health: dict[str, ProfileHealth] = {}
+        self._running: set[str] = set()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._loop, name="xhs-keepalive", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def _next_delay(self) -> float:
+        return self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def discover(self) -> None:
+        now = time.time()
+        found = discover_profiles(self.profiles_dir)
+        with self._cond:
+            for name in [n for n in self._health if n not in found]:
+                del self._health[name]
+                metrics.gauge(f"keepalive.expires_in_h.{name}", None)
+            for name, path in found.items():
+                if name in self._health:
+                    continue
+                health = ProfileHealth(
+                    profile=name,
+                    cookies_file=str(path),
+                    # First runs are spread over a jitter window instead of all firing at boot.
+                    next_run_at=now + random.uniform(0, self.interval * self.jitter),
+                    expires_at=session_expiry(load_storage_state(path)),
+                )
+                self._health[name] = health
+            self._publish(now)
+
+    def _publish(self, now: float) -> None:
+        # Caller holds the lock.
+        expiring = 0
+        for health in self._health.values():
+            snapshot = health.snapshot(now, self.warn_before)
+            expires_in = snapshot["expires_in_s"]
+            metrics.gauge(
+                f"keepalive.expires_in_h.{health.profile}",
+                round(expires_in / 3600, 2) if expires_in is not None else None,
+            )
+            expiring += bool(snapshot["expiring"] or health.logged_in is False)
+        metrics.gauge("keepalive.expiring", expiring)
+
+    def run_profile(self, name: str) -> dict[str, Any]:
+        with self._cond:
+            health = self._health.get(name)
+            if health is None:
+                raise KeyError(name)
+            if name in self._running:
+                return health.snapshot(time.time(), self.warn_before)
+            self._running.add(name)
+        cookies_file = Path(health.cookies_file)
+        try:
+            state = self.refresh(name, cookies_file)
+            error = None
+        except Exception as exc:
+            state, error = None, f"{type(exc).__name__}: {exc}"
+        if state is not None:
+            try:
+                save_storage_state(cookies_file, state)
+            except OSError as exc:
+                error = f"{type(exc).__name__}: {exc}"
+        now = time.time()
+        with self._cond:
+            self._running.discard(name)
+            health.last_run_at = now
+            health.next_run_at = now + self._next_delay()
+            health.runs += 1
+            health.last_error = error
+            if error is not None:
+                health.failures += 1
+                metrics.incr("keepalive.failures")
+            elif state is None:
+                health.logged_in = False
+                metrics.incr("keepalive.logged_out")
+            else:
+                health.logged_in = True
+                health.last_refresh_at = now
+                health.expires_at = session_expiry(state)
+                metrics.incr("keepalive.refreshed")
+            self._publish(now)
+            return health.snapshot(now, self.warn_before)
+
+    def status(self) -> list[dict[str, Any]]:
+        now = time.time()
+        with self._cond:
+            snapshots = [h.snapshot(now, self.warn_before) for h in self._health.values()]
+        return sorted(snapshots, key=lambda s: (s["expires_at"] is None, s["expires_at"] or 0))
+
+    def _due(self, now: float) -> list[str]:
+        with self._cond:
+            due = sorted(
+                (h for h in self._health.values() if h.next_run_at <= now and h.profile not in self._running),
+                key=lambda h: h.next_run_at,
+            )
+        if due and self.is_busy is not None and self.is_busy():
+            # Yield to user calls unless a profile has already waited too long.
+            due = [h for h in due if now - h.next_run_at >= self.max_defer]
+        return [h.profile for h in due]
+
+    def _loop(self) -> None:
+        _lower_priority(self.niceness)
+        while True:
+            try:
+                self.discover()
+                for name in self._due(time.time()):
+                    with self._cond:
+                        if self._closed:
+                            return
+                    try:
+                        self.run_profile(name)
+                    except KeyError:
+                        pass  # profile removed meanwhile
+            except Exception:
+                metrics.incr("keepalive.errors")
+            with self._cond:
+                self._cond.wait(self.tick)
+                if self._closed:
+                    return
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Any, Callable, ContextManager
+
+from . import metrics
+
+
+# Entered on the session's own thread; yields the Playwright page the session keeps open.
+PageOpener = Callable[[], ContextManager[Any]]
+
+
+class LoginSessionClosed(RuntimeError):
+    """The session expired or was closed before (or while) a call could run on it."""
+
+
+class LoginSession:
+    """A browser page kept open between tool calls, owned by one dedicated thread.
+
+    Playwright's sync API binds a page to the thread that created it, so calls are
+    queued to the session thread and run there one at a time. The page is closed
+    once ``expires_at`` passes with no call running, or when ``close`` is called.
+    """
+
+    def __init__(self, key: str, opener: PageOpener, ttl: float) -> None:
+        self.id = uuid.uuid4().hex[:16]
+        self.key = key
+        self.created_at = time.time()
+        self.expires_at = self.created_at + ttl
+        self.busy = False
+        self.error: str | None = None
+        self._opener = opener
+        self._calls: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"xhs-login-{self.id}", daemon=True)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def call(self, fn: Callable[[Any], Any]) -> Any:
+        """Run ``fn(page)`` on the session thread and return its result."""
+        future: Future = Future()
+        with self._lock:
+            if self._closed.is_set():
+                raise LoginSessionClosed(self.error or f"login session {self.id} is closed")
+            self._calls.put((fn, future))
+        return future.result()
+
+    def close(self) -> None:
+        self._calls.put(None)
+
+    def _run(self) -> None:
+        try:
+            with self._opener() as page:
+                while True:
+                    try:
+                        item = self._calls.get(timeout=max(0.0, self.expires_at - time.time()))
+                    except queue.Empty:
+                        metrics.incr("login.sessions_expired")
+                        break
+                    if item is None:
+                        break
+                    fn, future = item
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    self.busy = True
+                    try:
+                        future.set_result(fn(page))
+                    except BaseException as exc:
+                        future.set_exception(exc)
+                    finally:
+                        self.busy = False
+        except Exception as exc:
+            self.error = f"{type(exc).__name__}: {exc}"
+        finally:
+            with self._lock:
+                self._closed.set()
+            # Fail whatever was queued behind the last call instead of leaving callers blocked.
+            while True:
+                try:
+                    item = self._calls.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[1].set_exception(LoginSessionClosed(self.error or f"login session {self.id} is closed"))
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "session_id": self.id,
+            "key": self.key,
+            "created_at": self.created_at,
+            "expires_at": self.expires_at,
+            "busy": self.busy,
+            "closed": self.closed,
+            "error": self.error,
+        }
+
+
+class LoginSessionManager:
+    """Open QR-login pages by session id, at most one per key (cookies file).
+
+    Opening a session for a key that already has one closes the old one, so a fresh
+    QR code always replaces a stale one. Each session holds a browser, so at most
+    ``max_sessions`` are open at a time.
+    """
+
+    def __init__(self, *, ttl: float = 300.0, max_sessions: int = 4) -> None:
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._sessions: dict[str, LoginSession] = {}
+
+    def _prune(self) -> None:
+        # Caller holds the lock.
+        for session_id in [sid for sid, s in self._sessions.items() if s.closed]:
+            del self._sessions[session_id]
+
+    def open(self, key: str, opener: PageOpener, *, ttl: float | None = None) -> LoginSession:
+        with self._lock:
+            self._prune()
+            for existing in [s for s in self._sessions.values() if s.key == key]:
+                existing.close()
+                del self._sessions[existing.id]
+            if len(self._sessions) >= self.max_sessions:
+                raise RuntimeError(f"too many open login sessions (max {self.max_sessions})")
+            session = LoginSession(key, opener, self.ttl if ttl is None else ttl)
+            self._sessions[session.id] = session
+        session.start()
+        metrics.incr("login.sessions_opened")
+        return session
+
+    def get(self, session_id: str) -> LoginSession | None:
+        with self._lock:
+            self._prune()
+            return self._sessions.get(session_id)
+
+    def close(self, session_id: str) -> bool:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+        session.close()
+        return True
+
+    def close_all(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def status(self) -> list[dict[str, Any]]:
+        with self._lock:
+            self._prune()
+            return [s.snapshot() for s in self._sessions.values()]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+
+_PROC = Path("/proc")
+
+
+@dataclass(slots=True)
+class MemoryLimits:
+    """Thresholds for recycling a worker's browsers; ``None`` disables a check.
+
+    ``renderer_mb`` applies to each renderer process, ``browser_total_mb`` to the whole
+    Chromium process tree. ``pages_per_context`` and ``calls_per_browser`` bound how much
+    work a context/browser serves before it is rebuilt regardless of memory.
+    """
+
+    renderer_mb: float | None = None
+    browser_total_mb: float | None = None
+    pages_per_context: int | None = None
+    calls_per_browser: int | None = None
+    check_interval: float = 15.0
+
+    @property
+    def enabled(self) -> bool:
+        return any(
+            value is not None
+            for value in (self.renderer_mb, self.browser_total_mb, self.pages_per_context, self.calls_per_browser)
+        )
+
+
+@dataclass(slots=True)
+class MemorySample:
+    total_mb: float = 0.0
+    browser_mb: float = 0.0
+    renderer_mb: float = 0.0
+    other_mb: float = 0.0
+    largest_renderer_mb: float = 0.0
+    renderers: int = 0
+    processes: int = 0
+
+    @property
+    def chromium_mb(self) -> float:
+        return self.browser_mb + self.renderer_mb
+
+
+def supported() -> bool:
+    return (_PROC / "self" / "status").exists()
+
+
+def _children_map() -> dict[int, list[int]]:
+    children: dict[int, list[int]] = {}
+    for entry in _PROC.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # The comm field may contain spaces/parentheses; fields after the last ')' are fixed.
+        fields = stat[stat.rfind(")") + 2 :].split()
+        children.setdefault(int(fields[1]), []).append(int(entry.name))
+    return children
+
+
+def _descendants(root: int) -> list[int]:
+    children = _children_map()
+    found, stack = [], [root]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            found.append(child)
+            stack.append(child)
+    return found
+
+
+def _rss_mb(pid: int) -> float:
+    try:
+        for line in (_PROC / str(pid) / "status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0.0
+
+
+def _cmdline(pid: int) -> str:
+    try:
+        return (_PROC / str(pid) / "cmdline").read_bytes().replace(b"\0", b" ").decode(errors="replace")
+    except OSError:
+        return ""
+
+
+def sample_browser_tree(root: int | None = None) -> MemorySample | None:
+    """Sum RSS of Chromium processes below ``root`` (default: this process), split by role.
+
+    Linux only (reads /proc); returns None elsewhere. The Playwright driver itself is
+    counted under ``other_mb``; remote browsers are not visible here.
+    """
+    if not supported():
+        return None
+    sample = MemorySample()
+    for pid in _descendants(root or os.getpid()):
+        rss = _rss_mb(pid)
+        if not rss:
+            continue
+        cmdline = _cmdline(pid)
+        sample.processes += 1
+        sample.total_mb += rss
+        if "--type=renderer" in cmdline:
+            sample.renderers += 1
+            sample.renderer_mb += rss
+            sample.largest_renderer_mb = max(sample.largest_renderer_mb, rss)
+        elif "--type=" in cmdline or "chrom" in cmdline or "headless_shell" in cmdline:
+            sample.browser_mb += rss
+        else:
+            sample.other_mb += rss
+    return sample
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Iterator
+
+
+@dataclass(slots=True)
+class _Summary:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+
+_lock = threading.Lock()
+_counters: dict[str, int] = {}
+_summaries: dict[str, _Summary] = {}
+_gauges: dict[str, float] = {}
+_started_at = time.time()
+
+
+def incr(name: str, value: int = 1) -> None:
+    """Add ``value`` to the counter ``name``."""
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def observe(name: str, value: float) -> None:
+    """Record one sample (e.g. a latency in ms) for the summary ``name``."""
+    with _lock:
+        summary = _summaries.get(name)
+        if summary is None:
+            summary = _summaries[name] = _Summary()
+        summary.observe(value)
+
+
+def gauge(name: str, value: float | None) -> None:
+    """Set the current value of ``name`` (``None`` removes it); gauges survive ``reset``."""
+    with _lock:
+        if value is None:
+            _gauges.pop(name, None)
+        else:
+            _gauges[name] = value
+
+
+@contextlib.contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Observe the wall time of the block in milliseconds; failures also bump ``<name>.errors``."""
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        incr(f"{name}.errors")
+        raise
+    finally:
+        observe(name, (time.perf_counter() - started) * 1000)
+
+
+def snapshot() -> dict[str, Any]:
+    with _lock:
+        summaries = {}
+        for name, summary in _summaries.items():
+            data = asdict(summary)
+            data["avg"] = summary.total / summary.count if summary.count else 0.0
+            summaries[name] = data
+        return {
+            "uptime_s": time.time() - _started_at,
+            "counters": dict(_counters),
+            "summaries": summaries,
+            "gauges": dict(_gauges),
+        }
+
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
+        _summaries.clear()
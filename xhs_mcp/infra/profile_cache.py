@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None  # slots are then only exclusive within one process
+
+
+class ProfileCache:
+    """Persistent Chromium user-data directories, leased per cookies file.
+
+    A user-data directory can only be opened by one browser at a time, so every cookies
+    file gets numbered slots (``<key>-0``, ``<key>-1`` ...) and a lease takes the first
+    slot no other thread or process holds (an ``flock`` on ``<slot>.lock``). The HTTP
+    cache, code cache and service-worker storage survive between leases, so repeated
+    navigations reuse the site's bundles instead of downloading them again.
+
+    Total size is kept under ``max_mb``: least recently used idle slots are deleted
+    whole. Cookies are re-injected from the cookies file on every open, so a deleted
+    slot only costs a cold cache.
+    """
+
+    def __init__(self, root: Path, *, max_mb: float = 1024.0, prune_interval: float = 60.0) -> None:
+        self.root = root
+        self.max_mb = max_mb
+        self.prune_interval = prune_interval
+        self._lock = threading.Lock()
+        self._held: set[Path] = set()
+        self._last_prune = 0.0
+        self._pruned = 0
+        self._freed_mb = 0.0
+
+    def _key(self, cookies_file: Path) -> str:
+        resolved = str(Path(cookies_file).expanduser().resolve())
+        stem = Path(cookies_file).parent.name or "default"
+        return f"{stem}-{hashlib.sha1(resolved.encode()).hexdigest()[:10]}"
+
+    @contextlib.contextmanager
+    def lease(self, cookies_file: Path) -> Iterator[Path]:
+        """Yield a user-data directory for ``cookies_file`` that nobody else is using."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.maybe_prune()
+        key = self._key(cookies_file)
+        index = 0
+        while True:
+            slot = self.root / f"{key}-{index}"
+            handle = self._try_hold(slot)
+            if handle is not None:
+                break
+            index += 1
+        try:
+            slot.mkdir(exist_ok=True)
+            yield slot
+        finally:
+            self._release(slot, handle)
+            self.maybe_prune()
+
+    def _try_hold(self, slot: Path) -> IO[str] | None:
+        with self._lock:
+            if slot in self._held:
+                return None
+            handle = open(slot.with_name(slot.name + ".lock"), "a+")
+            if fcntl is not None:
+                try:
+                    fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    handle.close()
+                    return None
+            self._held.add(slot)
+            return handle
+
+    def _release(self, slot: Path, handle: IO[str]) -> None:
+        with self._lock:
+            self._held.discard(slot)
+            with contextlib.suppress(OSError):
+                os.utime(handle.name)  # last-used time for LRU pruning
+            handle.close()  # also drops the flock
+
+    def _slots(self) -> list[Path]:
+        if not self.root.exists():
+            return []
+        return [p for p in self.root.iterdir() if p.is_dir()]
+
+    def maybe_prune(self) -> None:
+        if time.monotonic() - self._last_prune >= self.prune_interval:
+            self.prune()
+
+    def prune(self) -> dict[str, Any]:
+        """Delete least recently used idle slots until the total fits ``max_mb``."""
+        self._last_prune = time.monotonic()
+        sizes = {slot: _dir_mb(slot) for slot in self._slots()}
+        total = sum(sizes.values())
+        freed = 0.0
+        removed = 0
+        for slot in sorted(sizes, key=_last_used):
+            if total <= self.max_mb:
+                break
+            handle = self._try_hold(slot)
+            if handle is None:
+                continue  # in use by this or another process
+            try:
+                shutil.rmtree(slot, ignore_errors=True)
+            finally:
+                self._release(slot, handle)
+            total -= sizes[slot]
+            freed += sizes[slot]
+            removed += 1
+        self._pruned += removed
+        self._freed_mb += freed
+        return {"size_mb": round(total, 1), "removed": removed, "freed_mb": round(freed, 1)}
+
+    def status(self) -> dict[str, Any]:
+        slots = self._slots()
+        return {
+            "root": str(self.root),
+            "max_mb": self.max_mb,
+            "size_mb": round(sum(_dir_mb(slot) for slot in slots), 1),
+            "slots": len(slots),
+            "in_use": len(self._held),
+            "pruned_slots": self._pruned,
+            "freed_mb": round(self._freed_mb, 1),
+        }
+
+
+def _last_used(slot: Path) -> float:
+    try:
+        return slot.with_name(slot.name + ".lock").stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _dir_mb(path: Path) -> float:
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(path):
+        for name in filenames:
+            with contextlib.suppress(OSError):
+                total += os.lstat(os.path.join(dirpath, name)).st_size
+    return total / (1024 * 1024)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Sequence
+
+
+FULL = "full"
+
+# Named field sets per result shape. ``full`` (no projection) is valid everywhere.
+PRESETS: dict[str, dict[str, tuple[str, ...]]] = {
+    "feed": {
+        "ids_only": ("id", "xsecToken"),
+        "summary": (
+            "id",
+            "xsecToken",
+            "modelType",
+            "noteCard.type",
+            "noteCard.displayTitle",
+            "noteCard.user.userId",
+            "noteCard.user.nickname",
+            "noteCard.user.nickName",
+            "noteCard.interactInfo.likedCount",
+            "noteCard.cover.urlDefault",
+        ),
+    },
+    "detail": {
+        "ids_only": ("note.noteId", "note.xsecToken", "comments.list.*.id"),
+        "summary": (
+            "note.noteId",
+            "note.xsecToken",
+            "note.type",
+            "note.title",
+            "note.desc",
+            "note.time",
+            "note.ipLocation",
+            "note.user.userId",
+            "note.user.nickname",
+            "note.interactInfo",
+            "note.tagList.*.name",
+            "note.imageList.*.urlDefault",
+            "note.video.media.stream.h264.*.masterUrl",
+            "comments.list.*.id",
+            "comments.list.*.content",
+            "comments.list.*.likeCount",
+            "comments.list.*.userInfo.nickname",
+            "comments.cursor",
+            "comments.hasMore",
+        ),
+    },
+    "profile": {
+        "ids_only": ("basic_info.redId", "feeds.*.id", "feeds.*.xsecToken", "cursor", "has_more"),
+        "summary": (
+            "basic_info.nickname",
+            "basic_info.redId",
+            "basic_info.desc",
+            "basic_info.ipLocation",
+            "interactions",
+            "feeds.*.id",
+            "feeds.*.xsecToken",
+            "feeds.*.noteCard.type",
+            "feeds.*.noteCard.displayTitle",
+            "feeds.*.noteCard.interactInfo.likedCount",
+            "cursor",
+            "has_more",
+        ),
+    },
+}
+
+_WILDCARD = "*"
+_LEAF = object()
+
+
+class Projector:
+    """Copies only the requested dotted paths out of a result.
+
+    Paths are compiled into a trie once, so projecting walks just the requested
+    branches and its cost follows the size of the output, not of the source JSON.
+    ``*`` selects every element of a list (or every key of a dict). Missing paths are
+    skipped.
+    """
+
+    def __init__(self, paths: Sequence[str]) -> None:
+        self.paths = tuple(paths)
+        self._trie: dict[str, Any] = {}
+        for path in self.paths:
+            segments = path.split(".")
+            if not path or any(not segment for segment in segments):
+                raise ValueError(f"invalid field path {path!r}")
+            node = self._trie
+            for segment in segments[:-1]:
+                child = node.get(segment)
+                if child is _LEAF:
+                    break  # a shorter path already keeps the whole subtree
+                if child is None:
+                    child = node[segment] = {}
+                node = child
+            else:
+                node[segments[-1]] = _LEAF
+
+    def __reduce__(self):
+        # The trie's _LEAF sentinel is per process; rebuild from the paths when a
+        # projector crosses into a worker process.
+        return _compiled, (self.paths,)
+
+    def project(self, value: Any) -> Any:
+        return _copy(value, self._trie)
+
+    def project_many(self, items: list[Any]) -> list[Any]:
+        return [_copy(item, self._trie) for item in items]
+
+
+def _copy(value: Any, trie: dict[str, Any]) -> Any:
+    if isinstance(value, list):
+        child = trie.get(_WILDCARD)
+        if child is None:
+            return []
+        return list(value) if child is _LEAF else [_copy(element, child) for element in value]
+    if not isinstance(value, dict):
+        return value
+    out: dict[str, Any] = {}
+    for segment, child in trie.items():
+        keys = value.keys() if segment == _WILDCARD else ((segment,) if segment in value else ())
+        for key in keys:
+            out[key] = value[key] if child is _LEAF else _copy(value[key], child)
+    return out
+
+
+@lru_cache(maxsize=64)
+def _compiled(paths: tuple[str, ...]) -> Projector:
+    return Projector(paths)
+
+
+def resolve_projector(shape: str, fields: str | Sequence[str] | None) -> Projector | None:
+    """Turn a ``fields`` tool argument into a projector; ``None``/``"full"`` means no projection.
+
+    ``fields`` is a preset name for the given result shape or a list of dotted paths.
+    """
+    if fields is None or fields == FULL:
+        return None
+    if isinstance(fields, str):
+        presets = PRESETS[shape]
+        if fields not in presets:
+            raise ValueError(f"unknown fields preset {fields!r}; expected one of {[FULL, *presets]} or a list of paths")
+        return _compiled(presets[fields])
+    return _compiled(tuple(fields))
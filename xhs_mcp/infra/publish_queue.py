@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from . import metrics
+from .codec import dumps, loads
+from .cookies import _atomic_write
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None  # the thread lock below still serialises writers within one process
+
+
+QUEUED = "queued"
+CLAIMED = "claimed"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+INTERRUPTED = "interrupted"
+
+FINISHED_STATES = {SUCCEEDED, FAILED, INTERRUPTED}
+
+
+class PublishQueueCorrupt(RuntimeError):
+    """The queue file exists but cannot be parsed; it is left untouched for inspection."""
+
+
+def parse_schedule(value: str | float | int | None) -> float | None:
+    """Accept epoch seconds or ISO 8601 (naive values are local time)."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    return datetime.fromisoformat(value).timestamp()
+
+
+@dataclass
+class QueueItem:
+    id: str
+    kind: str
+    title: str
+    content: str
+    image_paths: list[str] = field(default_factory=list)
+    video_path: str | None = None
+    tags: list[str] = field(default_factory=list)
+    profile: str | None = None
+    cookies_path: str | None = None
+    session_key: str = ""
+    scheduled_at: float | None = None
+    status: str = QUEUED
+    attempts: int = 0
+    error: str | None = None
+    enqueued_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    duration_s: float | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QueueItem":
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def is_due(self, now: float) -> bool:
+        return self.status == QUEUED and (self.scheduled_at is None or self.scheduled_at <= now)
+
+
+class PublishQueue:
+    """Persistent publish queue stored as one JSON file.
+
+    Every operation re-reads the file under an exclusive lock, and mutating ones
+    rewrite it, so browser workers in other processes can record per-item outcomes
+    directly. A file that cannot be parsed raises ``PublishQueueCorrupt`` instead of
+    being treated as empty, so no operation ever overwrites scheduled posts with ``[]``.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def _locked(self, *, write: bool = True) -> Iterator[list[QueueItem]]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = self.path.with_suffix(self.path.suffix + ".lock")
+        with self._lock, open(lock_path, "a+") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                items = self._read()
+                yield items
+                if write:
+                    _atomic_write(self.path, dumps([i.to_dict() for i in items]))
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> list[QueueItem]:
+        if not self.path.exists():
+            return []
+        try:
+            raw = loads(self.path.read_bytes() or b"[]")
+        except ValueError as exc:
+            raise PublishQueueCorrupt(f"cannot parse {self.path}: {exc}; fix or move it aside") from exc
+        if not isinstance(raw, list):
+            raise PublishQueueCorrupt(f"{self.path} does not hold a list of queue items; fix or move it aside")
+        return [QueueItem.from_dict(item) for item in raw if isinstance(item, dict)]
+
+    def add(self, items: list[QueueItem]) -> list[QueueItem]:
+        with self._locked() as current:
+            for item in items:
+                item.id = item.id or uuid.uuid4().hex[:12]
+                current.append(item)
+        return items
+
+    def list(self, status: str | None = None) -> list[QueueItem]:
+        with self._locked(write=False) as current:
+            return [i for i in current if status is None or i.status == status]
+
+    def get(self, item_id: str) -> QueueItem | None:
+        with self._locked(write=False) as current:
+            return next((i for i in current if i.id == item_id), None)
+
+    def update(self, item_id: str, **changes: Any) -> None:
+        with self._locked() as current:
+            for item in current:
+                if item.id == item_id:
+                    for key, value in changes.items():
+                        setattr(item, key, value)
+                    return
+
+    def remove(self, item_id: str) -> bool:
+        """Drop a queued (not yet started) item."""
+        with self._locked() as current:
+            for index, item in enumerate(current):
+                if item.id == item_id and item.status == QUEUED:
+                    del current[index]
+                    return True
+        return False
+
+    def claim_due(self, now: float | None = None, busy_keys: set[str] | None = None) -> dict[str, list[QueueItem]]:
+        """Mark due items as claimed and return them grouped by session key, in schedule order."""
+        now = time.time() if now is None else now
+        busy_keys = busy_keys or set()
+        grouped: dict[str, list[QueueItem]] = {}
+        with self._locked() as current:
+            due = [i for i in current if i.is_due(now) and i.session_key not in busy_keys]
+            for item in sorted(due, key=lambda i: (i.scheduled_at or 0.0, i.enqueued_at)):
+                item.status = CLAIMED
+                grouped.setdefault(item.session_key, []).append(item)
+        return grouped
+
+    def recover(self) -> int:
+        """After a restart, items that were mid-publish are marked interrupted (never re-posted blindly)."""
+        count = 0
+        with self._locked() as current:
+            for item in current:
+                if item.status == CLAIMED:
+                    item.status = QUEUED
+                elif item.status == RUNNING:
+                    item.status = INTERRUPTED
+                    item.error = "server stopped while publishing; check the account before re-queueing"
+                    item.finished_at = time.time()
+                    count += 1
+        return count
+
+    def release_claimed(self, item_ids: list[str], error: str) -> None:
+        """Fail items a session claimed but never reached (e.g. the browser failed to start)."""
+        wanted = set(item_ids)
+        with self._locked() as current:
+            for item in current:
+                if item.id in wanted and item.status in (CLAIMED, RUNNING):
+                    item.status = FAILED
+                    item.error = error
+                    item.finished_at = time.time()
+
+
+class PublishQueueScheduler:
+    """Background thread that runs due queue items, one warm session per profile at a time."""
+
+    def __init__(
+        self,
+        queue: PublishQueue,
+        run_session: Callable[[str, list[QueueItem]], None],
+        *,
+        interval: float = 30.0,
+    ) -> None:
+        self.queue = queue
+        self.run_session = run_session
+        self.interval = interval
+        self._cond = threading.Condition()
+        self._closed = False
+        self._busy: set[str] = set()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self.queue.recover()
+        self._thread = threading.Thread(target=self._loop, name="xhs-publish-queue", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def wake(self) -> None:
+        with self._cond:
+            self._cond.notify_all()
+
+    def tick(self) -> dict[str, int]:
+        """Claim due items and start a session per profile; returns claimed counts by session key."""
+        with self._cond:
+            busy = set(self._busy)
+        grouped = self.queue.claim_due(busy_keys=busy)
+        for key, items in grouped.items():
+            with self._cond:
+                self._busy.add(key)
+            threading.Thread(
+                target=self._session,
+                args=(key, items),
+                name=f"xhs-publish-session-{key}",
+                daemon=True,
+            ).start()
+        return {key: len(items) for key, items in grouped.items()}
+
+    def _session(self, key: str, items: list[QueueItem]) -> None:
+        try:
+            self.run_session(key, items)
+        except Exception as exc:
+            self.queue.release_claimed([i.id for i in items], f"session failed: {type(exc).__name__}: {exc}")
+        finally:
+            with self._cond:
+                self._busy.discard(key)
+
+    def _loop(self) -> None:
+        while True:
+            try:
+                self.tick()
+            except Exception:
+                # e.g. PublishQueueCorrupt: keep the thread alive; publish_queue_status reports the error.
+                metrics.incr("publish_queue.tick_errors")
+            with self._cond:
+                self._cond.wait(self.interval)
+                if self._closed:
+                    return
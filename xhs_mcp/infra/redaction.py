@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Sequence
+
+from . import metrics
+
+
+# The per-author token duplicates the note's own top-level xsecToken.
+DEFAULT_RULES: tuple[str, ...] = ("note:noteCard.user.xsecToken",)
+
+_WILDCARD = "*"
+_LEAF = object()
+
+
+class Redactor:
+    """Removes fields from scraped items according to compiled field-path rules.
+
+    A rule is ``[modelType:]dotted.path``. ``*`` matches any key of a dict or any
+    element of a list, and a rule with a ``modelType:`` prefix only applies to items
+    whose ``modelType`` matches. The rules are merged into one trie per model type,
+    so each item is walked once along the rule paths only, never through the whole
+    document.
+    """
+
+    def __init__(self, rules: Sequence[str]) -> None:
+        self.rules = tuple(rules)
+        self._any: dict[str, Any] = {}
+        self._by_type: dict[str, dict[str, Any]] = {}
+        for rule in self.rules:
+            model_type, sep, path = rule.rpartition(":")
+            segments = path.split(".")
+            if not path or any(not segment for segment in segments):
+                raise ValueError(f"invalid redaction rule {rule!r}")
+            trie = self._by_type.setdefault(model_type, {}) if sep else self._any
+            for segment in segments[:-1]:
+                node = trie.get(segment)
+                if node is _LEAF:
+                    break  # a shorter rule already removes the whole subtree
+                if node is None:
+                    node = trie[segment] = {}
+                trie = node
+            else:
+                # A shorter rule wins over deeper ones whichever order they come in.
+                trie[segments[-1]] = _LEAF
+
+    def _tries(self, item: Any) -> list[dict[str, Any]]:
+        tries = [self._any] if self._any else []
+        if self._by_type and isinstance(item, dict):
+            typed = self._by_type.get(item.get("modelType"))
+            if typed:
+                tries.append(typed)
+        return tries
+
+    def apply(self, item: Any) -> int:
+        """Redact one item in place; return how many fields were removed."""
+        return sum(_walk(item, trie) for trie in self._tries(item))
+
+    def redact(self, items: list[Any]) -> list[Any]:
+        """Redact a list in place (one pass) and return it."""
+        removed = 0
+        for item in items:
+            removed += self.apply(item)
+        _record(len(items), removed)
+        return items
+
+    def iter_redact(self, items: Iterable[Any]) -> Iterator[Any]:
+        """Redact items lazily as they are consumed from a stream."""
+        count = removed = 0
+        try:
+            for item in items:
+                removed += self.apply(item)
+                count += 1
+                yield item
+        finally:
+            _record(count, removed)
+
+
+def _walk(node: Any, trie: dict[str, Any]) -> int:
+    removed = 0
+    if isinstance(node, dict):
+        for segment, child in trie.items():
+            keys = list(node) if segment == _WILDCARD else ([segment] if segment in node else [])
+            for key in keys:
+                if child is _LEAF:
+                    del node[key]
+                    removed += 1
+                else:
+                    removed += _walk(node[key], child)
+    elif isinstance(node, list):
+        child = trie.get(_WILDCARD)
+        if child is _LEAF:
+            removed += len(node)
+            node.clear()
+        elif child is not None:
+            for element in node:
+                removed += _walk(element, child)
+    return removed
+
+
+def _record(items: int, removed: int) -> None:
+    metrics.incr("redaction.items", items)
+    metrics.incr("redaction.fields_removed", removed)
+
+
+@lru_cache(maxsize=32)
+def compile_rules(rules: tuple[str, ...] = DEFAULT_RULES) -> Redactor:
+    return Redactor(rules)
+
+
+def redact(items: list[Any], rules: Sequence[str] = DEFAULT_RULES) -> list[Any]:
+    return compile_rules(tuple(rules)).redact(items)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import contextlib
+import http.client
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+from urllib.parse import urlsplit
+
+
+@dataclass
+class BrowserEndpoint:
+    """A pre-launched browser server reachable over Playwright's WebSocket protocol."""
+
+    ws_endpoint: str
+    capacity: int = 4
+    healthy: bool = True
+    active: int = 0
+    failures: int = 0
+    last_probe: float | None = None
+    last_latency_ms: float | None = None
+    last_error: str | None = None
+
+    @property
+    def load(self) -> float:
+        return self.active / max(1, self.capacity)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "ws_endpoint": self.ws_endpoint,
+            "capacity": self.capacity,
+            "healthy": self.healthy,
+            "active": self.active,
+            "failures": self.failures,
+            "last_probe": self.last_probe,
+            "last_latency_ms": self.last_latency_ms,
+            "last_error": self.last_error,
+        }
+
+
+def probe_endpoint(ws_endpoint: str, timeout: float = 3.0) -> float:
+    """Return round-trip latency in ms of an HTTP GET against the server's WebSocket URL.
+
+    `playwright run-server` answers plain HTTP on the same port, so any response
+    means the host is up. Raises OSError/HTTPException when unreachable.
+    """
+    parts = urlsplit(ws_endpoint)
+    conn_cls = http.client.HTTPSConnection if parts.scheme in ("wss", "https") else http.client.HTTPConnection
+    start = time.monotonic()
+    conn = conn_cls(parts.hostname or "127.0.0.1", parts.port, timeout=timeout)
+    try:
+        conn.request("GET", parts.path or "/")
+        conn.getresponse().read()
+    finally:
+        conn.close()
+    return (time.monotonic() - start) * 1000
+
+
+class BrowserEndpointRegistry:
+    """Tracks remote browser servers, probes their health and hands out the least loaded one."""
+
+    def __init__(
+        self,
+        endpoints: Iterable[str],
+        *,
+        capacity: int = 4,
+        probe_interval: float = 15.0,
+        probe_timeout: float = 3.0,
+        acquire_timeout: float = 120.0,
+    ) -> None:
+        self._endpoints = [BrowserEndpoint(ws_endpoint=url, capacity=capacity) for url in endpoints]
+        if not self._endpoints:
+            raise ValueError("at least one browser endpoint is required")
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.acquire_timeout = acquire_timeout
+        self._cond = threading.Condition()
+        self._closed = False
+        self._prober: threading.Thread | None = None
+
+    def start(self) -> None:
+        self.probe_all()
+        self._prober = threading.Thread(target=self._probe_loop, name="xhs-endpoint-probe", daemon=True)
+        self._prober.start()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def probe_all(self) -> None:
+        for endpoint in self._endpoints:
+            try:
+                latency = probe_endpoint(endpoint.ws_endpoint, self.probe_timeout)
+            except (OSError, http.client.HTTPException) as exc:
+                with self._cond:
+                    endpoint.healthy = False
+                    endpoint.last_error = str(exc)
+                    endpoint.last_probe = time.time()
+                continue
+            with self._cond:
+                endpoint.healthy = True
+                endpoint.last_error = None
+                endpoint.last_latency_ms = latency
+                endpoint.last_probe = time.time()
+                self._cond.notify_all()
+
+    def _probe_loop(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed, timeout=self.probe_interval)
+                if self._closed:
+                    return
+            self.probe_all()
+
+    def _pick(self) -> BrowserEndpoint | None:
+        candidates = [e for e in self._endpoints if e.healthy and e.active < e.capacity]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda e: (e.load, e.last_latency_ms or 0.0))
+
+    def acquire(self, timeout: float | None = None) -> BrowserEndpoint:
+        deadline = time.monotonic() + (self.acquire_timeout if timeout is None else timeout)
+        with self._cond:
+            while True:
+                endpoint = self._pick()
+                if endpoint is not None:
+                    endpoint.active += 1
+                    return endpoint
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._closed:
+                    raise TimeoutError("no healthy browser endpoint with free capacity")
+                self._cond.wait(remaining)
+
+    def release(self, endpoint: BrowserEndpoint, *, failed: bool = False) -> None:
+        with self._cond:
+            endpoint.active = max(0, endpoint.active - 1)
+            if failed:
+                # Take it out of rotation until the next successful probe.
+                endpoint.failures += 1
+                endpoint.healthy = False
+            self._cond.notify_all()
+
+    @contextlib.contextmanager
+    def lease(self, timeout: float | None = None) -> Iterator[BrowserEndpoint]:
+        endpoint = self.acquire(timeout)
+        failed = False
+        try:
+            yield endpoint
+        except Exception as exc:
+            failed = _is_connection_error(exc)
+            raise
+        finally:
+            self.release(endpoint, failed=failed)
+
+    def status(self) -> list[dict[str, Any]]:
+        with self._cond:
+            return [e.snapshot() for e in self._endpoints]
+
+
+_CONNECTION_MARKERS = ("ECONNREFUSED", "ECONNRESET", "WebSocket error", "Browser has been closed", "browser has disconnected")
+
+
+def _is_connection_error(exc: BaseException) -> bool:
+    # Only transport failures count against the endpoint, not action errors raised by handlers.
+    if isinstance(exc, ConnectionError):
+        return True
+    message = str(exc)
+    return any(marker in message for marker in _CONNECTION_MARKERS)
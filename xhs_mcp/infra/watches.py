@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from .codec import dumps, loads
+from .cookies import _atomic_write
+
+
+KEYWORD = "keyword"
+USER = "user"
+WATCH_KINDS = (KEYWORD, USER)
+
+
+class RotatingSeenSet:
+    """Bounded "have we seen this id" set made of two generations.
+
+    New ids go into the current generation; once it holds ``generation_size`` ids it
+    becomes the previous one and the oldest generation is dropped. Lookups check both,
+    so an id is remembered for at least ``generation_size`` later insertions while memory
+    stays under ``2 * generation_size`` ids. Unlike a Bloom filter it has no false positives,
+    so a genuinely new note is never suppressed.
+    """
+
+    def __init__(self, generation_size: int = 2_000, current: Iterable[str] = (), previous: Iterable[str] = ()) -> None:
+        self.generation_size = generation_size
+        self.current: set[str] = set(current)
+        self.previous: set[str] = set(previous)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.current or key in self.previous
+
+    def __len__(self) -> int:
+        return len(self.current | self.previous)
+
+    def add(self, key: str) -> None:
+        if key in self:
+            return
+        if len(self.current) >= self.generation_size:
+            self.previous, self.current = self.current, set()
+        self.current.add(key)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"current": sorted(self.current), "previous": sorted(self.previous)}
+
+
+@dataclass
+class Watch:
+    id: str
+    kind: str
+    target: str
+    xsec_token: str | None = None
+    interval_s: float = 300.0
+    profile: str | None = None
+    cookies_path: str | None = None
+    created_at: float = field(default_factory=time.time)
+    last_run_at: float | None = None
+    last_error: str | None = None
+    runs: int = 0
+    new_total: int = 0
+    seen: dict[str, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Watch":
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+    def is_due(self, now: float) -> bool:
+        return self.last_run_at is None or now - self.last_run_at >= self.interval_s
+
+    def snapshot(self) -> dict[str, Any]:
+        data = asdict(self)
+        seen = data.pop("seen")
+        data["seen_ids"] = len(set(seen.get("current", [])) | set(seen.get("previous", [])))
+        return data
+
+
+@dataclass(slots=True)
+class WatchDelta:
+    seq: int
+    watch_id: str
+    kind: str
+    target: str
+    found_at: float
+    note: dict[str, Any]
+
+
+def note_id(note: dict[str, Any]) -> str:
+    card = note.get("noteCard") or note.get("note_card") or {}
+    return str(note.get("id") or note.get("note_id") or card.get("noteId") or card.get("note_id") or "")
+
+
+class WatchManager:
+    """Runs keyword/user watches on their intervals and keeps only newly seen notes.
+
+    Watches and their seen-id sets persist in a JSON file. Deltas get increasing
+    sequence numbers and go into a bounded in-memory ring for ``poll``. When a sink
+    path is set they are also appended to a JSONL file. The first run of a watch only
+    seeds its seen set, so existing results are not reported as new.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        run_watch: Callable[[Watch], list[dict[str, Any]]],
+        *,
+        sink: Path | None = None,
+        tick: float = 15.0,
+        max_buffered: int = 1_000,
+        generation_size: int = 2_000,
+    ) -> None:
+        self.path = path
+        self.run_watch = run_watch
+        self.sink = sink
+        self.tick = tick
+        self.generation_size = generation_size
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._watches: dict[str, Watch] = {}
+        self._seen: dict[str, RotatingSeenSet] = {}
+        self._deltas: deque[WatchDelta] = deque(maxlen=max_buffered)
+        self._seq = 0
+        self._running: set[str] = set()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            raw = loads(self.path.read_bytes())
+        except Exception:
+            return
+        self._seq = int(raw.get("seq", 0))
+        for item in raw.get("watches", []):
+            watch = Watch.from_dict(item)
+            self._watches[watch.id] = watch
+            self._seen[watch.id] = RotatingSeenSet(self.generation_size, **watch.seen)
+
+    def _flush(self) -> None:
+        # Caller holds the lock.
+        for watch_id, watch in self._watches.items():
+            watch.seen = self._seen[watch_id].to_dict()
+        payload = {"seq": self._seq, "watches": [asdict(w) for w in self._watches.values()]}
+        _atomic_write(self.path, dumps(payload))
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._loop, name="xhs-watches", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def add(self, watch: Watch) -> Watch:
+        if watch.kind not in WATCH_KINDS:
+            raise ValueError(f"unsupported watch kind {watch.kind!r}; expected one of {WATCH_KINDS}")
+        watch.id = watch.id or uuid.uuid4().hex[:12]
+        with self._cond:
+            self._watches[watch.id] = watch
+            self._seen[watch.id] = RotatingSeenSet(self.generation_size)
+            self._flush()
+            self._cond.notify_all()
+        return watch
+
+    def remove(self, watch_id: str) -> bool:
+        with self._cond:
+            if self._watches.pop(watch_id, None) is None:
+                return False
+            self._seen.pop(watch_id, None)
+            self._flush()
+            return True
+
+    def list(self) -> list[Watch]:
+        with self._lock:
+            return sorted(self._watches.values(), key=lambda w: w.created_at)
+
+    def poll(self, since: int = 0, watch_id: str | None = None, limit: int = 100) -> tuple[list[WatchDelta], int]:
+        """Deltas with ``seq > since`` (oldest first) and the cursor to pass next time."""
+        with self._lock:
+            matching = [d for d in self._deltas if d.seq > since and (watch_id is None or d.watch_id == watch_id)]
+        page = matching[:limit]
+        return page, (page[-1].seq if page else max(since, 0))
+
+    def run_now(self, watch_id: str) -> list[WatchDelta]:
+        with self._lock:
+            watch = self._watches.get(watch_id)
+        if watch is None:
+            raise KeyError(watch_id)
+        return self._run(watch)
+
+    def _run(self, watch: Watch) -> list[WatchDelta]:
+        with self._lock:
+            if watch.id in self._running:
+                return []
+            self._running.add(watch.id)
+        try:
+            notes = self.run_watch(watch)
+            error = None
+        except Exception as exc:
+            notes, error = [], f"{type(exc).__name__}: {exc}"
+        finally:
+            with self._lock:
+                self._running.discard(watch.id)
+
+        new: list[WatchDelta] = []
+        with self._lock:
+            seen = self._seen.get(watch.id)
+            if seen is None:  # removed while running
+                return []
+            first_run = watch.runs == 0 and error is None
+            now = time.time()
+            for note in notes:
+                key = note_id(note)
+                if not key or key in seen:
+                    continue
+                seen.add(key)
+                if first_run:
+                    continue
+                self._seq += 1
+                new.append(WatchDelta(self._seq, watch.id, watch.kind, watch.target, now, note))
+            self._deltas.extend(new)
+            watch.last_run_at = now
+            watch.last_error = error
+            if error is None:
+                watch.runs += 1
+            watch.new_total += len(new)
+            self._flush()
+        if new and self.sink is not None:
+            self.sink.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.sink, "a", encoding="utf-8") as f:
+                for delta in new:
+                    f.write(dumps(asdict(delta)) + "\n")
+        return new
+
+    def _loop(self) -> None:
+        while True:
+            now = time.time()
+            with self._lock:
+                due = [w for w in self._watches.values() if w.is_due(now) and w.id not in self._running]
+            for watch in due:
+                threading.Thread(target=self._run, args=(watch,), name=f"xhs-watch-{watch.id}", daemon=True).start()
+            with self._cond:
+                self._cond.wait(self.tick)
+                if self._closed:
+                    return
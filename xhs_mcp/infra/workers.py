@@ -0,0 +1,758 @@
+from __future__ import annotations
+
+import contextlib
+import multiprocessing
+import pickle
+import queue
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from multiprocessing.connection import Connection
+
+from .memory import MemoryLimits, sample_browser_tree
+from .profile_cache import ProfileCache
+
+
+# Handlers travel to worker processes by pickle, so they must be module-level
+# functions (optionally wrapped in functools.partial), not closures.
+Handler = Callable[[Any, Path], Any]
+
+
+@dataclass
+class WorkerTask:
+    handler: Handler
+    cookies_file: Path
+    chrome_bin: str | None = None
+    ws_endpoint: str | None = None
+    debug_dir: Path | None = None
+    trace: bool = False
+    # Leave the handler's page open as the context's spare page for the next call (pre-warm).
+    keep_page: bool = False
+    # Run local contexts on persistent user-data directories under this root (disk cache).
+    cache_root: Path | None = None
+    cache_mb: float = 1024.0
+    # Serve static assets of local contexts through the server's shared asset proxy.
+    asset_proxy: str | None = None
+
+    @property
+    def persistent(self) -> bool:
+        return self.cache_root is not None and not self.ws_endpoint
+
+    @property
+    def browser_key(self) -> str:
+        # Remote endpoints and local executables each get their own browser in a worker;
+        # persistent contexts are their own browser.
+        if self.persistent:
+            return f"persistent:{self.chrome_bin or ''}"
+        return self.ws_endpoint or f"local:{self.chrome_bin or ''}"
+
+    @property
+    def affinity_key(self) -> str:
+        return str(self.cookies_file)
+
+
+class WorkerError(RuntimeError):
+    """Raised in the front end when a worker fails in a way that cannot be re-raised as-is."""
+
+
+# ---------------------------------------------------------------------------
+# Worker process side
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _WarmContext:
+    context: Any
+    cookies_mtime: float | None
+    task: WorkerTask | None = None
+    spare_page: Any = None
+    warm_url: str | None = None
+    pages_opened: int = 0
+    # Holds the user-data-directory lease of a persistent context.
+    lease: contextlib.ExitStack | None = None
+
+    def take_spare_page(self) -> Any:
+        page, self.spare_page = self.spare_page, None
+        if page is not None and not page.is_closed():
+            return page
+        return None
+
+
+def _mtime(path: Path) -> float | None:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+class _BrowserHost:
+    """Owns the Playwright driver, browsers and warm contexts of one worker."""
+
+    def __init__(self, limits: MemoryLimits | None = None) -> None:
+        self._playwright = None
+        self._browsers: dict[str, Any] = {}
+        self._contexts: dict[tuple[str, str], _WarmContext] = {}
+        self.limits = limits
+        self._browser_calls: dict[str, int] = {}
+        self.last_sample = None
+        self.recycles: deque[dict[str, Any]] = deque(maxlen=20)
+        self.recycle_total = 0
+        self._profile_caches: dict[Path, ProfileCache] = {}
+        # The reader thread answers pings with stats() while the main thread mutates
+        # contexts/recycles; both sides take this lock around those structures.
+        self._lock = threading.Lock()
+
+    def _driver(self):
+        from playwright.sync_api import sync_playwright
+
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        return self._playwright
+
+    def _browser_for(self, task: WorkerTask):
+        from .browser import connect_browser, launch_browser
+
+        self._driver()
+        browser_key = task.browser_key
+        browser = self._browsers.get(browser_key)
+        if browser is not None and browser.is_connected():
+            return browser
+        # Browser crashed, disconnected or was never started: forget its contexts and reopen.
+        with self._lock:
+            for key in [k for k in self._contexts if k[0] == browser_key]:
+                self._contexts.pop(key, None)
+        if task.ws_endpoint:
+            browser = connect_browser(self._playwright, task.ws_endpoint)
+        else:
+            browser = launch_browser(self._playwright, task.chrome_bin)
+        self._browsers[browser_key] = browser
+        self._browser_calls[browser_key] = 0
+        return browser
+
+    def context_for(self, task: WorkerTask):
+        return self._warm_for(task).context
+
+    def _warm_for(self, task: WorkerTask) -> _WarmContext:
+        from .browser import open_context
+
+        browser = None if task.persistent else self._browser_for(task)
+        cookies_file = task.cookies_file
+        key = (task.browser_key, str(cookies_file))
+        mtime = _mtime(cookies_file)
+        warm = self._contexts.get(key)
+        if warm is not None:
+            # A re-login rewrites the cookies file; rebuild so the new session is used.
+            if warm.cookies_mtime == mtime:
+                return warm
+            self._close_context(key)
+        if browser is None:
+            warm = self._persistent_warm(task, mtime)
+        else:
+            context = open_context(browser, cookies_file, None if task.ws_endpoint else task.asset_proxy)
+            warm = _WarmContext(context=context, cookies_mtime=mtime, task=task)
+        with self._lock:
+            self._contexts[key] = warm
+        return warm
+
+    def _persistent_warm(self, task: WorkerTask, mtime: float | None) -> _WarmContext:
+        from .browser import launch_persistent
+
+        cache = self._profile_caches.get(task.cache_root)
+        if cache is None:
+            cache = self._profile_caches[task.cache_root] = ProfileCache(task.cache_root, max_mb=task.cache_mb)
+        lease = contextlib.ExitStack()
+        try:
+            user_data_dir = lease.enter_context(cache.lease(task.cookies_file))
+            context = launch_persistent(
+                self._driver(), user_data_dir, task.cookies_file, task.chrome_bin, task.cache_mb, task.asset_proxy
+            )
+        except BaseException:
+            lease.close()
+            raise
+        return _WarmContext(context=context, cookies_mtime=mtime, task=task, lease=lease)
+
+    def _close_context(self, key: tuple[str, str]) -> None:
+        with self._lock:
+            warm = self._contexts.pop(key, None)
+        if warm is None:
+            return
+        try:
+            warm.context.close()
+        except Exception:
+            pass
+        if warm.lease is not None:
+            warm.lease.close()
+
+    def run(self, task: WorkerTask, on_progress: Callable[[float | None, str], None], cancel_event: threading.Event) -> Any:
+        from xhs_mcp.xhs.base import ActionContext
+
+        from .browser import debug_capture
+
+        warm = self._warm_for(task)
+        context = warm.context
+        page = warm.take_spare_page()
+        if page is None:
+            page = context.new_page()
+            warm.pages_opened += 1
+        self._browser_calls[task.browser_key] = self._browser_calls.get(task.browser_key, 0) + 1
+        try:
+            with debug_capture(context, page, task.debug_dir, task.trace):
+                ctx = ActionContext(page, on_progress=on_progress, cancel_event=cancel_event)
+                result = task.handler(ctx, task.cookies_file)
+        except BaseException:
+            _close_quietly(page)
+            raise
+        if task.keep_page:
+            warm.spare_page = page
+            warm.warm_url = page.url
+        else:
+            _close_quietly(page)
+        return result
+
+    def probe(self) -> dict[str, Any]:
+        """Check every warm context with a browser round-trip and rebuild the dead ones.
+
+        Runs on the worker's main thread between calls, so a user call never lands on a
+        context whose browser or renderer went away while the worker was idle.
+        """
+        rebuilt = failed = 0
+        for key, warm in list(self._contexts.items()):
+            if self._contexts.get(key) is not warm:
+                continue  # already replaced while rebuilding a sibling on the same browser
+            try:
+                browser = self._browsers.get(key[0])
+                if warm.lease is None and (browser is None or not browser.is_connected()):
+                    raise RuntimeError("browser disconnected")
+                warm.context.cookies()
+                if warm.spare_page is not None and warm.spare_page.is_closed():
+                    raise RuntimeError("spare page closed")
+                continue
+            except Exception:
+                self._close_context(key)
+            if warm.task is None:
+                continue
+            try:
+                fresh = self._warm_for(warm.task)
+                if warm.warm_url:
+                    page = fresh.context.new_page()
+                    page.goto(warm.warm_url, wait_until="domcontentloaded")
+                    fresh.spare_page = page
+                    fresh.warm_url = warm.warm_url
+                rebuilt += 1
+            except Exception:
+                failed += 1
+        return {**self.stats(), "rebuilt": rebuilt, "failed": failed}
+
+    def warm_keys(self) -> list[str]:
+        with self._lock:
+            return [key[1] for key in self._contexts]
+
+    # -- memory governor -------------------------------------------------------
+
+    def _record_recycle(self, level: str, reason: str, before_mb: float | None) -> None:
+        after = sample_browser_tree()
+        self.last_sample = after
+        event = {
+            "at": time.time(),
+            "level": level,
+            "reason": reason,
+            "before_mb": round(before_mb, 1) if before_mb is not None else None,
+            "after_mb": round(after.chromium_mb, 1) if after is not None else None,
+        }
+        with self._lock:
+            self.recycles.append(event)
+            self.recycle_total += 1
+
+    def _recycle_browser(self, browser_key: str) -> None:
+        for key in [k for k in self._contexts if k[0] == browser_key]:
+            self._close_context(key)
+        browser = self._browsers.pop(browser_key, None)
+        self._browser_calls.pop(browser_key, None)
+        if browser is not None:
+            try:
+                browser.close()
+            except Exception:
+                pass
+
+    def govern(self) -> None:
+        """Recycle pages, contexts or whole browsers that crossed the configured limits.
+
+        Called on the worker's main thread between calls, so in-flight work is never cut
+        off: the call that pushed a browser over its budget finishes first. Recycled
+        contexts and browsers are rebuilt lazily by the next call that needs them.
+        """
+        limits = self.limits
+        if limits is None or not limits.enabled:
+            return
+        sample = sample_browser_tree()
+        self.last_sample = sample
+        before = sample.chromium_mb if sample is not None else None
+
+        if limits.calls_per_browser is not None:
+            for browser_key, calls in list(self._browser_calls.items()):
+                if calls >= limits.calls_per_browser:
+                    self._recycle_browser(browser_key)
+                    self._record_recycle("browser", f"{calls} calls on {browser_key}", before)
+        if limits.pages_per_context is not None:
+            for key, warm in list(self._contexts.items()):
+                if warm.pages_opened >= limits.pages_per_context:
+                    self._close_context(key)
+                    self._record_recycle("context", f"{warm.pages_opened} pages in {key[1]}", before)
+
+        sample = self.last_sample
+        if sample is None:
+            return
+        if limits.browser_total_mb is not None and sample.chromium_mb > limits.browser_total_mb:
+            # Persistent profiles have no shared Browser, only a context keyed "persistent:*".
+            browser_keys = {*self._browsers, *(key[0] for key in self._contexts)}
+            for browser_key in browser_keys:
+                self._recycle_browser(browser_key)
+            if browser_keys:
+                self._record_recycle("browser", f"chromium RSS {sample.chromium_mb:.0f} MB", sample.chromium_mb)
+            return
+        if limits.renderer_mb is not None and sample.largest_renderer_mb > limits.renderer_mb:
+            # Cheapest first: idle spare pages, then whole contexts if a renderer is still too big.
+            closed = 0
+            for warm in list(self._contexts.values()):
+                page = warm.take_spare_page()
+                if page is not None:
+                    _close_quietly(page)
+                    closed += 1
+            if closed:
+                self._record_recycle("page", f"renderer RSS {sample.largest_renderer_mb:.0f} MB", sample.chromium_mb)
+            after = self.last_sample
+            if after is not None and after.largest_renderer_mb > limits.renderer_mb and self._contexts:
+                for key in list(self._contexts):
+                    self._close_context(key)
+                self._record_recycle("context", f"renderer RSS {after.largest_renderer_mb:.0f} MB", after.chromium_mb)
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot for pings; safe to call from the reader thread."""
+        sample = self.last_sample
+        with self._lock:
+            warm = [key[1] for key in self._contexts]
+            recycles = list(self.recycles)
+            recycle_total = self.recycle_total
+        return {
+            "warm": warm,
+            "memory": asdict(sample) | {"chromium_mb": sample.chromium_mb} if sample is not None else None,
+            "recycles": recycles,
+            "recycle_total": recycle_total,
+        }
+
+    def close(self) -> None:
+        for key in list(self._contexts):
+            self._close_context(key)
+        for browser in self._browsers.values():
+            try:
+                browser.close()
+            except Exception:
+                pass
+        self._browsers.clear()
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+
+def _close_quietly(page: Any) -> None:
+    try:
+        page.close()
+    except Exception:
+        pass
+
+
+def _encode_error(exc: BaseException) -> tuple[str, Any]:
+    try:
+        return "err", pickle.dumps(exc)
+    except Exception:
+        return "err_text", f"{type(exc).__name__}: {exc}\n{traceback.format_exc()}"
+
+
+def _worker_main(conn: Connection, limits: MemoryLimits | None = None) -> None:
+    host = _BrowserHost(limits)
+    send_lock = threading.Lock()
+    calls: queue.Queue = queue.Queue()
+    cancel_event = threading.Event()
+
+    def send(message: tuple) -> None:
+        with send_lock:
+            conn.send(message)
+
+    def reader() -> None:
+        # Cancel requests must be seen while the main thread is busy inside Playwright.
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                calls.put(("stop",))
+                return
+            kind = message[0]
+            if kind == "cancel":
+                cancel_event.set()
+            elif kind == "ping":
+                send(("pong", host.stats()))
+            else:
+                calls.put(message)
+                if kind == "stop":
+                    return
+
+    threading.Thread(target=reader, name="xhs-worker-reader", daemon=True).start()
+    try:
+        governed = limits is not None and limits.enabled
+        while True:
+            try:
+                message = calls.get(timeout=limits.check_interval if governed else None)
+            except queue.Empty:
+                host.govern()  # idle browsers keep growing too (timers, media)
+                continue
+            if message[0] == "stop":
+                break
+            if message[0] == "probe":
+                host.govern()
+                send(("probed", host.probe()))
+                continue
+            cancel_event.clear()
+            try:
+                result = host.run(
+                    message[1],
+                    on_progress=lambda progress, phase: send(("progress", progress, phase)),
+                    cancel_event=cancel_event,
+                )
+            except BaseException as exc:  # noqa: BLE001 - everything is reported to the front end
+                send(_encode_error(exc))
+            else:
+                send(("ok", result))
+            host.govern()
+    finally:
+        host.close()
+
+
+# ---------------------------------------------------------------------------
+# Front-end side
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _WorkerHandle:
+    index: int
+    process: Any = None
+    conn: Connection | None = None
+    busy: bool = False
+    warm: set[str] = field(default_factory=set)
+    calls: int = 0
+    failures: int = 0
+    restarts: int = 0
+    rebuilt_contexts: int = 0
+    memory: dict[str, Any] | None = None
+    recycles: list[dict[str, Any]] = field(default_factory=list)
+    recycle_total: int = 0
+    started_at: float = 0.0
+    last_ok: float | None = None
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+
+class WorkerPool:
+    """Pool of browser worker processes, each with its own Playwright driver.
+
+    Calls are routed to an idle worker that already holds a warm context for the
+    same cookies file when possible. Workers that die, hang past the call timeout
+    or stop answering health pings are killed and restarted.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        *,
+        call_timeout: float = 900.0,
+        acquire_timeout: float = 300.0,
+        health_interval: float = 30.0,
+        ping_timeout: float = 10.0,
+        keep_warm: bool = False,
+        probe_timeout: float = 120.0,
+        memory_limits: MemoryLimits | None = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("worker pool size must be >= 1")
+        self.size = size
+        self.call_timeout = call_timeout
+        self.acquire_timeout = acquire_timeout
+        self.health_interval = health_interval
+        self.ping_timeout = ping_timeout
+        self.keep_warm = keep_warm
+        self.probe_timeout = probe_timeout
+        self.memory_limits = memory_limits
+        self._mp = multiprocessing.get_context("spawn")
+        self._cond = threading.Condition()
+        self._workers = [_WorkerHandle(index=i) for i in range(size)]
+        self._closed = False
+        self._monitor: threading.Thread | None = None
+
+    # -- lifecycle -----------------------------------------------------------
+
+    def start(self) -> None:
+        for worker in self._workers:
+            self._spawn(worker)
+        self._monitor = threading.Thread(target=self._monitor_loop, name="xhs-worker-health", daemon=True)
+        self._monitor.start()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        for worker in self._workers:
+            self._stop(worker)
+
+    def _spawn(self, worker: _WorkerHandle) -> None:
+        parent_conn, child_conn = self._mp.Pipe()
+        process = self._mp.Process(
+            target=_worker_main,
+            args=(child_conn, self.memory_limits),
+            name=f"xhs-browser-worker-{worker.index}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker.process = process
+        worker.conn = parent_conn
+        worker.warm.clear()
+        worker.started_at = time.time()
+
+    def _stop(self, worker: _WorkerHandle, *, graceful: bool = True) -> None:
+        if worker.conn is not None and graceful and worker.alive:
+            try:
+                worker.conn.send(("stop",))
+            except (OSError, BrokenPipeError):
+                pass
+        if worker.process is not None:
+            worker.process.join(timeout=5 if graceful else 0.1)
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join(timeout=5)
+        if worker.conn is not None:
+            worker.conn.close()
+        worker.process = None
+        worker.conn = None
+
+    def _restart(self, worker: _WorkerHandle) -> None:
+        self._stop(worker, graceful=False)
+        worker.restarts += 1
+        if not self._closed:
+            self._spawn(worker)
+
+    # -- dispatch ------------------------------------------------------------
+
+    def _checkout(self, key: str | None, timeout: float) -> _WorkerHandle:
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("worker pool is closed")
+                idle = [w for w in self._workers if not w.busy]
+                if idle:
+                    warm = [w for w in idle if key is not None and key in w.warm]
+                    # Cold calls go to the worker holding the fewest contexts.
+                    worker = warm[0] if warm else min(idle, key=lambda w: len(w.warm))
+                    worker.busy = True
+                    return worker
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("no browser worker became available in time")
+                self._cond.wait(remaining)
+
+    def _checkin(self, worker: _WorkerHandle) -> None:
+        with self._cond:
+            worker.busy = False
+            self._cond.notify()
+
+    def call(
+        self,
+        task: WorkerTask,
+        *,
+        timeout: float | None = None,
+        on_progress: Callable[[float | None, str], None] | None = None,
+        cancel_event: threading.Event | None = None,
+    ) -> Any:
+        """Run ``task`` on a worker and return its result (blocking).
+
+        Progress reported by the handler is forwarded to ``on_progress``; setting
+        ``cancel_event`` asks the worker to stop the running handler.
+        """
+        key = task.affinity_key
+        worker = self._checkout(key, self.acquire_timeout)
+        try:
+            if not worker.alive:
+                self._restart(worker)
+            worker.calls += 1
+            try:
+                worker.conn.send(("call", task))
+                kind, payload = self._await_result(worker, timeout or self.call_timeout, on_progress, cancel_event)
+            except (EOFError, OSError, BrokenPipeError) as exc:
+                worker.failures += 1
+                self._restart(worker)
+                raise WorkerError(f"browser worker {worker.index} died: {exc}") from exc
+        finally:
+            self._checkin(worker)
+
+        if kind == "timeout":
+            raise TimeoutError(f"browser worker {worker.index} timed out; restarted")
+        if kind == "ok":
+            worker.warm.add(key)
+            worker.last_ok = time.time()
+            return payload
+        worker.failures += 1
+        if kind == "err":
+            raise pickle.loads(payload)
+        raise WorkerError(payload)
+
+    def _await_result(
+        self,
+        worker: _WorkerHandle,
+        timeout: float,
+        on_progress: Callable[[float | None, str], None] | None,
+        cancel_event: threading.Event | None,
+    ) -> tuple[str, Any]:
+        deadline = time.monotonic() + timeout
+        cancel_sent = False
+        while True:
+            if cancel_event is not None and cancel_event.is_set() and not cancel_sent:
+                worker.conn.send(("cancel",))
+                cancel_sent = True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                worker.failures += 1
+                self._restart(worker)
+                return "timeout", None
+            if not worker.conn.poll(min(remaining, 0.5)):
+                continue
+            message = worker.conn.recv()
+            if message[0] == "progress":
+                if on_progress is not None:
+                    on_progress(message[1], message[2])
+                continue
+            return message[0], message[1]
+
+    # -- health --------------------------------------------------------------
+
+    def _ping(self, worker: _WorkerHandle) -> bool:
+        if not worker.alive or worker.conn is None:
+            return False
+        try:
+            worker.conn.send(("ping",))
+            if not worker.conn.poll(self.ping_timeout):
+                return False
+            kind, stats = worker.conn.recv()
+        except (EOFError, OSError, BrokenPipeError):
+            return False
+        if kind != "pong":
+            return False
+        self._apply_stats(worker, stats)
+        return True
+
+    @staticmethod
+    def _apply_stats(worker: _WorkerHandle, stats: dict[str, Any]) -> None:
+        worker.warm = set(stats["warm"])
+        worker.memory = stats["memory"]
+        worker.recycles = stats["recycles"]
+        worker.recycle_total = stats["recycle_total"]
+
+    def _probe(self, worker: _WorkerHandle) -> bool:
+        if not worker.alive or worker.conn is None:
+            return False
+        try:
+            worker.conn.send(("probe",))
+            if not worker.conn.poll(self.probe_timeout):
+                return False
+            kind, report = worker.conn.recv()
+        except (EOFError, OSError, BrokenPipeError):
+            return False
+        if kind != "probed":
+            return False
+        self._apply_stats(worker, report)
+        worker.rebuilt_contexts += report["rebuilt"]
+        return True
+
+    def check_health(self) -> None:
+        """Ping (or with keep_warm, probe) every idle worker once, restarting those that fail."""
+        for worker in self._workers:
+            with self._cond:
+                if worker.busy or self._closed:
+                    continue
+                worker.busy = True
+            try:
+                healthy = self._probe(worker) if self.keep_warm else self._ping(worker)
+                if not healthy:
+                    self._restart(worker)
+            finally:
+                self._checkin(worker)
+
+    def prewarm(
+        self,
+        tasks: list[WorkerTask],
+        *,
+        call: Callable[[WorkerTask], Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run warm-up tasks (one per profile) concurrently across workers; report each outcome.
+
+        ``call`` replaces :meth:`call` when the caller wraps dispatch (e.g. endpoint leasing).
+        """
+        call = call or self.call
+        reports: list[dict[str, Any]] = [{} for _ in tasks]
+
+        def warm(index: int, task: WorkerTask) -> None:
+            started = time.monotonic()
+            report: dict[str, Any] = {"cookies_file": str(task.cookies_file)}
+            try:
+                call(task)
+                report["ok"] = True
+            except Exception as exc:
+                report.update(ok=False, error=f"{type(exc).__name__}: {exc}")
+            report["seconds"] = round(time.monotonic() - started, 2)
+            reports[index] = report
+
+        threads = [
+            threading.Thread(target=warm, args=(i, task), name=f"xhs-prewarm-{i}", daemon=True)
+            for i, task in enumerate(tasks)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return reports
+
+    def _monitor_loop(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed, timeout=self.health_interval)
+                if self._closed:
+                    return
+            self.check_health()
+
+    def status(self) -> list[dict[str, Any]]:
+        with self._cond:
+            return [
+                {
+                    "index": w.index,
+                    "pid": w.process.pid if w.process is not None else None,
+                    "alive": w.alive,
+                    "busy": w.busy,
+                    "warm_profiles": sorted(w.warm),
+                    "calls": w.calls,
+                    "failures": w.failures,
+                    "restarts": w.restarts,
+                    "rebuilt_contexts": w.rebuilt_contexts,
+                    "memory_mb": w.memory,
+                    "recycle_total": w.recycle_total,
+                    "recent_recycles": list(w.recycles),
+                    "started_at": w.started_at,
+                    "last_ok": w.last_ok,
+                }
+                for w in self._workers
+            ]
@@ -1,21 +1,53 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import contextlib
+import threading
+import time
+from dataclasses import asdict, dataclass
 from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Iterable, Sequence, TypeVar
+from typing import Any, Callable, Iterable, Iterator, Sequence, TypeVar
 
 import anyio
-from mcp.server.fastmcp import FastMCP
-
-from xhs_mcp.configs import get_chrome_executable, get_cookies_path
-from xhs_mcp.infra.browser import launch, new_context, pw
-from xhs_mcp.infra.cookies import save_storage_state
-from xhs_mcp.xhs.base import ActionContext
+from mcp.server.fastmcp import Context, FastMCP
+
+from xhs_mcp.configs import DEFAULT_PROFILES_DIR, get_chrome_executable, get_cookies_path, get_state_dir
+from xhs_mcp.infra.browser import _stealth_context_args, connect, debug_capture, launch, new_context, persistent_context, pw
+from xhs_mcp.infra.cookies import load_storage_state, save_storage_state
+from xhs_mcp.infra.downloads import DownloadRequest, MediaDownloader
+from xhs_mcp.infra.export import ExportWriter, check_format, default_path
+from xhs_mcp.infra.images import DEFAULT_MAX_EDGE, ImageOptions, prepare_images, shutdown_image_pool
+from xhs_mcp.infra import metrics
+from xhs_mcp.infra.admission import AdmissionController
+from xhs_mcp.infra.asset_proxy import AssetProxy, AssetStore
+from xhs_mcp.infra.jobs import JobManager
+from xhs_mcp.infra.keepalive import KeepAliveScheduler
+from xhs_mcp.infra.login_sessions import LoginSession, LoginSessionManager
+from xhs_mcp.infra.memory import MemoryLimits
+from xhs_mcp.infra.profile_cache import ProfileCache
+from xhs_mcp.infra.publish_queue import (
+    CLAIMED,
+    FAILED,
+    RUNNING,
+    SUCCEEDED,
+    PublishQueue,
+    PublishQueueScheduler,
+    QueueItem,
+    parse_schedule,
+)
+from xhs_mcp.infra.projection import Projector, resolve_projector
+from xhs_mcp.infra.redaction import DEFAULT_RULES, compile_rules
+from xhs_mcp.infra.remote import BrowserEndpointRegistry
+from xhs_mcp.infra.watches import KEYWORD, USER, Watch, WatchManager
+from xhs_mcp.infra.workers import WorkerPool, WorkerTask
+from xhs_mcp.xhs.base import ActionCancelled, ActionContext, ProgressCallback
 from xhs_mcp.xhs.comment import CommentAction
+from xhs_mcp.xhs.feed_comments import FeedCommentsAction
 from xhs_mcp.xhs.feed_detail import FeedDetailAction
 from xhs_mcp.xhs.feeds import Feed, FeedsListAction, SearchAction
-from xhs_mcp.xhs.like_favorite import FavoriteAction, LikeAction
+from xhs_mcp.xhs.like_favorite import FavoriteAction, InteractResult, LikeAction
+from xhs_mcp.xhs.navigate import NavigateAction
+from xhs_mcp.xhs.media import resolve_media
 from xhs_mcp.xhs.login import check_login_status, fetch_qrcode_image, wait_for_login
 from xhs_mcp.xhs.publish import (
     PublishImageAction,
@@ -25,7 +57,6 @@ from xhs_mcp.xhs.publish import (
 )
 from xhs_mcp.xhs.user_profile import UserProfileAction
 
-from scripts import clean_array
 
 T = TypeVar("T")
 
@@ -37,10 +68,182 @@ class ServerDefaults:
     chrome_bin: str | None = None
     debug_dir: Path | None = None
     trace: bool = False
+    optimize_images: bool = False
+    image_max_edge: int = DEFAULT_MAX_EDGE
+    state_dir: Path | None = None
+    redact_rules: tuple[str, ...] = DEFAULT_RULES
+    browser_cache_dir: Path | None = None
+    browser_cache_mb: float = 1024.0
 
 
 DEFAULTS = ServerDefaults()
 
+_WORKER_POOL: WorkerPool | None = None
+_ENDPOINTS: BrowserEndpointRegistry | None = None
+_JOBS: JobManager | None = None
+_PUBLISH_SCHEDULER: PublishQueueScheduler | None = None
+_WATCHES: WatchManager | None = None
+_PREWARM_REPORT: list[dict[str, Any]] = []
+_ADMISSION: AdmissionController | None = None
+_PROFILE_CACHE: ProfileCache | None = None
+_ASSET_PROXY: AssetProxy | None = None
+_LOGIN_SESSIONS: LoginSessionManager | None = None
+_KEEPALIVE: KeepAliveScheduler | None = None
+
+
+def configure_workers(
+    size: int,
+    *,
+    call_timeout: float = 900.0,
+    health_interval: float = 30.0,
+    keep_warm: bool = False,
+    memory_limits: MemoryLimits | None = None,
+) -> None:
+    """Start a pool of ``size`` browser worker processes (0 keeps in-process threads).
+
+    With ``keep_warm`` the periodic health check probes every warm context and rebuilds
+    dead ones instead of only pinging the worker process. ``memory_limits`` makes each
+    worker recycle pages, contexts or its browser when they outgrow the caps.
+    """
+
+    global _WORKER_POOL
+    shutdown_workers()
+    if size <= 0:
+        return
+    pool = WorkerPool(
+        size,
+        call_timeout=call_timeout,
+        health_interval=health_interval,
+        keep_warm=keep_warm,
+        memory_limits=memory_limits,
+    )
+    pool.start()
+    _WORKER_POOL = pool
+
+
+def _prewarm_handler(ctx: ActionContext, _cookies: Path, *, navigate: bool) -> dict[str, str]:
+    if navigate:
+        NavigateAction(ctx).to_explore_page()
+    return {"url": ctx.page.url}
+
+
+def prewarm_browsers(profiles: Sequence[str | None], *, navigate: bool = False) -> list[dict[str, Any]]:
+    """Launch browsers and build one warm context per profile before serving (``None`` = default cookies).
+
+    With ``navigate`` each context also keeps a page open on the explore page, which the
+    first call for that profile reuses. Requires the worker pool.
+    """
+
+    global _PREWARM_REPORT
+    pool = _WORKER_POOL
+    if pool is None:
+        raise RuntimeError("pre-warming needs browser workers (serve --workers N)")
+    tasks = [
+        WorkerTask(
+            handler=partial(_prewarm_handler, navigate=navigate),
+            cookies_file=(
+                get_cookies_path(DEFAULTS.cookies_path, DEFAULTS.profile)
+                if profile is None
+                else get_cookies_path(None, profile)
+            ),
+            chrome_bin=get_chrome_executable(DEFAULTS.chrome_bin),
+            keep_page=navigate,
+            cache_root=DEFAULTS.browser_cache_dir,
+            cache_mb=DEFAULTS.browser_cache_mb,
+            asset_proxy=_asset_proxy_url(),
+        )
+        for profile in profiles
+    ]
+    reports = pool.prewarm(tasks, call=partial(_call_worker_pool, pool))
+    for profile, report in zip(profiles, reports):
+        report["profile"] = profile
+    _PREWARM_REPORT = reports
+    return reports
+
+
+def shutdown_workers() -> None:
+    global _WORKER_POOL, _ENDPOINTS, _PUBLISH_SCHEDULER, _WATCHES, _ASSET_PROXY, _LOGIN_SESSIONS, _KEEPALIVE
+    if _KEEPALIVE is not None:
+        _KEEPALIVE.close()
+        _KEEPALIVE = None
+    if _LOGIN_SESSIONS is not None:
+        _LOGIN_SESSIONS.close_all()
+        _LOGIN_SESSIONS = None
+    if _PUBLISH_SCHEDULER is not None:
+        _PUBLISH_SCHEDULER.close()
+        _PUBLISH_SCHEDULER = None
+    if _WATCHES is not None:
+        _WATCHES.close()
+        _WATCHES = None
+    if _WORKER_POOL is not None:
+        _WORKER_POOL.close()
+        _WORKER_POOL = None
+    if _ENDPOINTS is not None:
+        _ENDPOINTS.close()
+        _ENDPOINTS = None
+    if _ASSET_PROXY is not None:
+        _ASSET_PROXY.close()
+        _ASSET_PROXY = None
+    shutdown_image_pool()
+
+
+def configure_admission(
+    budget_mb: float | None,
+    *,
+    max_queue: int = 32,
+    queue_timeout: float = 120.0,
+    costs: dict[str, float] | None = None,
+) -> None:
+    """Only admit browser calls while their estimated memory fits ``budget_mb`` (``None`` disables)."""
+
+    global _ADMISSION
+    _ADMISSION = (
+        AdmissionController(budget_mb, max_queue=max_queue, queue_timeout=queue_timeout, costs=costs)
+        if budget_mb
+        else None
+    )
+
+
+def configure_asset_cache(root: str | Path | None, *, max_mb: float = 512.0) -> None:
+    """Start the shared static-asset caching proxy on loopback (``None`` stops it).
+
+    Local browser contexts route hash-named bundles, fonts and images through it, so
+    every worker and call shares one on-disk copy of each asset.
+    """
+
+    global _ASSET_PROXY
+    if _ASSET_PROXY is not None:
+        _ASSET_PROXY.close()
+        _ASSET_PROXY = None
+    if root is None:
+        return
+    proxy = AssetProxy(AssetStore(Path(root).expanduser(), max_mb=max_mb))
+    proxy.start()
+    _ASSET_PROXY = proxy
+
+
+def _asset_proxy_url() -> str | None:
+    return _ASSET_PROXY.url if _ASSET_PROXY is not None else None
+
+
+def configure_browser_endpoints(
+    endpoints: Sequence[str],
+    *,
+    capacity: int = 4,
+    probe_interval: float = 15.0,
+) -> None:
+    """Use pre-launched browser servers (``playwright run-server``) instead of local launches."""
+
+    global _ENDPOINTS
+    if _ENDPOINTS is not None:
+        _ENDPOINTS.close()
+        _ENDPOINTS = None
+    if not endpoints:
+        return
+    registry = BrowserEndpointRegistry(endpoints, capacity=capacity, probe_interval=probe_interval)
+    registry.start()
+    _ENDPOINTS = registry
+
 
 def configure_defaults(
     *,
@@ -49,6 +252,12 @@ def configure_defaults(
     chrome_bin: str | None = None,
     debug_dir: str | Path | None = None,
     trace: bool | None = None,
+    optimize_images: bool | None = None,
+    image_max_edge: int | None = None,
+    state_dir: str | Path | None = None,
+    redact_rules: Sequence[str] | None = None,
+    browser_cache_dir: str | Path | None = None,
+    browser_cache_mb: float | None = None,
 ) -> None:
     """Allow CLI to set fallback values for tool parameters."""
 
@@ -62,6 +271,19 @@ def configure_defaults(
         DEFAULTS.debug_dir = _normalize_debug_dir(debug_dir)
     if trace is not None:
         DEFAULTS.trace = trace
+    if optimize_images is not None:
+        DEFAULTS.optimize_images = optimize_images
+    if image_max_edge is not None:
+        DEFAULTS.image_max_edge = image_max_edge
+    if state_dir is not None:
+        DEFAULTS.state_dir = Path(state_dir).expanduser()
+    if redact_rules is not None:
+        compile_rules(tuple(redact_rules))  # fail fast on malformed rules
+        DEFAULTS.redact_rules = tuple(redact_rules)
+    if browser_cache_dir is not None:
+        DEFAULTS.browser_cache_dir = Path(browser_cache_dir).expanduser()
+    if browser_cache_mb is not None:
+        DEFAULTS.browser_cache_mb = browser_cache_mb
 
 
 def _normalize_debug_dir(value: str | Path | None) -> Path | None:
@@ -103,42 +325,110 @@ def _run_with_page_sync(
     debug_dir: Path | None,
     trace: bool,
     handler: Callable[[ActionContext, Path], T],
+    on_progress: ProgressCallback | None = None,
+    cancel_event: threading.Event | None = None,
+) -> T:
+    tool = _handler_name(handler)
+    admission = _ADMISSION
+    with admission.admit(tool) if admission is not None else contextlib.nullcontext():
+        with metrics.timed(f"call.{tool}"):
+            return _dispatch_page_call(
+                profile=profile,
+                cookies_path=cookies_path,
+                chrome_bin=chrome_bin,
+                debug_dir=debug_dir,
+                trace=trace,
+                handler=handler,
+                on_progress=on_progress,
+                cancel_event=cancel_event,
+            )
+
+
+def _handler_name(handler: Callable[..., Any]) -> str:
+    func = getattr(handler, "func", handler)
+    return getattr(func, "__name__", "handler").strip("_").removesuffix("_handler")
+
+
+def _dispatch_page_call(
+    *,
+    profile: str | None,
+    cookies_path: str | None,
+    chrome_bin: str | None,
+    debug_dir: Path | None,
+    trace: bool,
+    handler: Callable[[ActionContext, Path], T],
+    on_progress: ProgressCallback | None,
+    cancel_event: threading.Event | None,
 ) -> T:
     cookies_file = get_cookies_path(cookies_path, profile)
     chrome_exe = get_chrome_executable(chrome_bin)
 
-    debug_dir_path = debug_dir
-    console_logs: list[str] = []
-
-    with pw() as playwright:
-        with launch(playwright, chrome_bin=chrome_exe) as browser:
-            with new_context(browser, cookies_file) as context:
-                if trace and debug_dir_path:
-                    context.tracing.start(screenshots=True, snapshots=True, sources=True)
-
-                page = context.new_page()
-
-                if debug_dir_path is not None:
-                    page.on("console", lambda msg: console_logs.append(f"[{msg.type}] {msg.text}"))
-
-                try:
-                    return handler(ActionContext(page), cookies_file)
-                finally:
-                    if debug_dir_path is not None:
-                        debug_dir_path.mkdir(parents=True, exist_ok=True)
-                        (debug_dir_path / "dom.html").write_text(page.content(), encoding="utf-8")
-
-                        screenshot_path = debug_dir_path / "page.png"
-                        try:
-                            page.screenshot(path=str(screenshot_path), full_page=True)
-                        except Exception as exc:
-                            (debug_dir_path / "screenshot-error.log").write_text(str(exc), encoding="utf-8")
+    pool = _WORKER_POOL
+    if pool is not None:
+        task = WorkerTask(
+            handler=handler,
+            cookies_file=cookies_file,
+            chrome_bin=chrome_exe,
+            debug_dir=debug_dir,
+            trace=trace,
+            cache_root=DEFAULTS.browser_cache_dir,
+            cache_mb=DEFAULTS.browser_cache_mb,
+            asset_proxy=_asset_proxy_url(),
+        )
+        return _call_worker_pool(pool, task, on_progress=on_progress, cancel_event=cancel_event)
+
+    with pw() as playwright, _local_context(playwright, cookies_file, chrome_exe) as context:
+        page = context.new_page()
+        with debug_capture(context, page, debug_dir, trace):
+            ctx = ActionContext(page, on_progress=on_progress, cancel_event=cancel_event)
+            return handler(ctx, cookies_file)
+
+
+@contextlib.contextmanager
+def _local_context(playwright: Any, cookies_file: Path, chrome_exe: str | None) -> Iterator[Any]:
+    """Browser context for an in-process call: persistent profile, remote endpoint or fresh launch."""
+
+    cache = _profile_cache()
+    if cache is not None and _ENDPOINTS is None:
+        with cache.lease(cookies_file) as user_data_dir:
+            with persistent_context(
+                playwright,
+                user_data_dir,
+                cookies_file,
+                chrome_exe,
+                DEFAULTS.browser_cache_mb,
+                _asset_proxy_url(),
+            ) as context:
+                yield context
+        return
+    if _ENDPOINTS is not None:
+        with _ENDPOINTS.lease() as endpoint:
+            with connect(playwright, endpoint.ws_endpoint) as browser, new_context(browser, cookies_file) as context:
+                yield context
+        return
+    with launch(playwright, chrome_bin=chrome_exe) as browser:
+        with new_context(browser, cookies_file, _asset_proxy_url()) as context:
+            yield context
+
+
+def _profile_cache() -> ProfileCache | None:
+    """In-process persistent-profile cache (workers keep their own instance per process)."""
+
+    global _PROFILE_CACHE
+    root = DEFAULTS.browser_cache_dir
+    if root is None:
+        return None
+    if _PROFILE_CACHE is None or _PROFILE_CACHE.root != root:
+        _PROFILE_CACHE = ProfileCache(root, max_mb=DEFAULTS.browser_cache_mb)
+    return _PROFILE_CACHE
 
-                        (debug_dir_path / "console.log").write_text("\n".join(console_logs), encoding="utf-8")
 
-                    if trace and debug_dir_path:
-                        trace_path = debug_dir_path / "trace.zip"
-                        context.tracing.stop(path=str(trace_path))
+def _call_worker_pool(pool: WorkerPool, task: WorkerTask, **kwargs: Any) -> Any:
+    if _ENDPOINTS is None:
+        return pool.call(task, **kwargs)
+    with _ENDPOINTS.lease() as endpoint:
+        task.ws_endpoint = endpoint.ws_endpoint
+        return pool.call(task, **kwargs)
 
 
 async def _run_with_page(
@@ -149,6 +439,7 @@ async def _run_with_page(
     debug_dir: Path | None,
     trace: bool,
     handler: Callable[[ActionContext, Path], T],
+    on_progress: ProgressCallback | None = None,
 ) -> T:
     return await anyio.to_thread.run_sync(
         partial(
@@ -159,92 +450,362 @@ async def _run_with_page(
             debug_dir=debug_dir,
             trace=trace,
             handler=handler,
+            on_progress=on_progress,
         )
     )
 
 
+def _mcp_progress(mcp_ctx: Context | None) -> ProgressCallback | None:
+    """Forward action progress as MCP progress notifications (from the worker thread)."""
+
+    if mcp_ctx is None:
+        return None
+
+    def report(progress: float | None, phase: str) -> None:
+        if progress is None:
+            return
+        try:
+            anyio.from_thread.run(partial(mcp_ctx.report_progress, progress, 100.0, phase))
+        except Exception:
+            # Progress is best effort; never fail the action because a notification failed.
+            pass
+
+    return report
+
+
+def _job_manager() -> JobManager:
+    global _JOBS
+    if _JOBS is None:
+        _JOBS = JobManager(get_state_dir(DEFAULTS.state_dir) / "jobs.json")
+    return _JOBS
+
+
+def _start_job(
+    kind: str,
+    params: dict[str, Any],
+    *,
+    profile: str | None,
+    cookies_path: str | None,
+    chrome_bin: str | None,
+    debug_dir: Path | None,
+    trace: bool,
+    handler: Callable[[ActionContext, Path], Any],
+) -> dict[str, Any]:
+    def body(on_progress: ProgressCallback, cancel_event: threading.Event) -> Any:
+        return _run_with_page_sync(
+            profile=profile,
+            cookies_path=cookies_path,
+            chrome_bin=chrome_bin,
+            debug_dir=debug_dir,
+            trace=trace,
+            handler=handler,
+            on_progress=on_progress,
+            cancel_event=cancel_event,
+        )
+
+    job = _job_manager().submit(kind, body, params)
+    return {"job_id": job.id, "status": job.status}
+
+
 mcp = FastMCP("Xiaohongshu")
 
 
+def _redact(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return compile_rules(DEFAULTS.redact_rules).redact(items)
+
+
+def _shape(result: Any, projector: Projector | None) -> Any:
+    if projector is None:
+        return result
+    if isinstance(result, list):
+        return projector.project_many(result)
+    return projector.project(result)
+
+
+ExportProducer = Callable[[ActionContext, Path, Callable[[dict[str, Any]], None]], dict[str, Any]]
+
+
+def _export_handler(
+    ctx: ActionContext,
+    cookies_file: Path,
+    *,
+    produce: ExportProducer,
+    path: Path,
+    fmt: str,
+    rules: tuple[str, ...],
+    projector: Projector | None = None,
+) -> dict[str, Any]:
+    redactor = compile_rules(rules)
+    with ExportWriter(path, fmt) as writer:
+
+        def sink(item: dict[str, Any]) -> None:
+            redactor.apply(item)
+            writer.write(projector.project(item) if projector is not None else item)
+            if writer.rows % 100 == 0:
+                ctx.report(None, f"exported {writer.rows} rows")
+
+        extra = produce(ctx, cookies_file, sink)
+    return {**writer.summary(), **extra}
+
+
+async def _export(
+    name: str,
+    produce: ExportProducer,
+    fmt: str,
+    export_path: str | None,
+    invocation: tuple[str | None, str | None, str | None, Path | None, bool],
+    *,
+    projector: Projector | None = None,
+    mcp_ctx: Context | None = None,
+) -> dict[str, Any]:
+    """Run ``produce`` in a browser call, streaming its items to a file; returns path/rows/bytes."""
+
+    check_format(fmt)
+    if export_path:
+        path = Path(export_path).expanduser()
+    else:
+        path = default_path(get_state_dir(DEFAULTS.state_dir) / "exports", name, fmt)
+    profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff = invocation
+    return await _run_with_page(
+        profile=profile_eff,
+        cookies_path=cookies_eff,
+        chrome_bin=chrome_eff,
+        debug_dir=debug_eff,
+        trace=trace_eff,
+        handler=partial(
+            _export_handler,
+            produce=produce,
+            path=path.resolve(),
+            fmt=fmt,
+            rules=DEFAULTS.redact_rules,
+            projector=projector,
+        ),
+        on_progress=_mcp_progress(mcp_ctx),
+    )
+
+
+def _export_items(
+    ctx: ActionContext,
+    cookies_file: Path,
+    sink: Callable[[dict[str, Any]], None],
+    *,
+    handler: Callable[..., list[dict[str, Any]]],
+) -> dict[str, Any]:
+    for item in handler(ctx, cookies_file):
+        sink(item)
+    return {}
+
+
+def _feeds_list_handler(ctx: ActionContext, _cookies: Path) -> list[dict[str, Any]]:
+    action = FeedsListAction(ctx)
+    feeds: list[Feed] = action.get_feeds()
+    return [feed.raw for feed in feeds]
+
+
 @mcp.tool()
 async def feeds_list(
+    fields: str | list[str] | None = None,
+    export: str | None = None,
+    export_path: str | None = None,
     profile: str | None = None,
     cookies_path: str | None = None,
     chrome_bin: str | None = None,
     debug_dir: str | None = None,
     trace: bool | None = None,
-) -> list[dict[str, Any]]:
-    """Fetch homepage feed entries.使用前请先登录，无需要其他参数"""
-
-    profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff = _resolve_invocation_args(
-        profile, cookies_path, chrome_bin, debug_dir, trace
-    )
-
-    def handler(ctx: ActionContext, _cookies: Path) -> list[dict[str, Any]]:
-        action = FeedsListAction(ctx)
-        feeds: list[Feed] = action.get_feeds()
-        return clean_array.clean_xsec_tokens([feed.raw for feed in feeds])
-
-    return await _run_with_page(
+) -> list[dict[str, Any]] | dict[str, Any]:
+    """Fetch homepage feed entries.使用前请先登录，无需要其他参数
+
+    ``fields`` trims each item before it is returned: a preset (``summary``, ``ids_only``,
+    ``full``) or a list of dotted paths where ``*`` selects list elements.
+    ``export`` (``jsonl``, ``jsonl.zst``, ``parquet``) writes the items to ``export_path``
+    instead and returns only the file path, row count and size.
+    """
+
+    projector = resolve_projector("feed", fields)
+    invocation = _resolve_invocation_args(profile, cookies_path, chrome_bin, debug_dir, trace)
+    if export:
+        produce = partial(_export_items, handler=_feeds_list_handler)
+        return await _export("feeds", produce, export, export_path, invocation, projector=projector)
+    profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff = invocation
+
+    feeds = await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=_feeds_list_handler,
     )
+    return _shape(_redact(feeds), projector)
+
+
+def _search_handler(ctx: ActionContext, _cookies: Path, *, keyword: str) -> list[dict[str, Any]]:
+    action = SearchAction(ctx)
+    feeds = action.search(keyword)
+    return [feed.raw for feed in feeds]
 
 
 @mcp.tool()
 async def search_feeds(
     keyword: str,
+    fields: str | list[str] | None = None,
+    export: str | None = None,
+    export_path: str | None = None,
     profile: str | None = None,
     cookies_path: str | None = None,
     chrome_bin: str | None = None,
     debug_dir: str | None = None,
     trace: bool | None = None,
-) -> list[dict[str, Any]]:
-    """Search feeds for a keyword."""
-
-    profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff = _resolve_invocation_args(
-        profile, cookies_path, chrome_bin, debug_dir, trace
-    )
-
-    def handler(ctx: ActionContext, _cookies: Path) -> list[dict[str, Any]]:
-        action = SearchAction(ctx)
-        feeds = action.search(keyword)
-        return clean_array.clean_xsec_tokens([feed.raw for feed in feeds])
-
-    return await _run_with_page(
+) -> list[dict[str, Any]] | dict[str, Any]:
+    """Search feeds for a keyword.
+
+    ``fields`` trims each item before it is returned: a preset (``summary``, ``ids_only``,
+    ``full``) or a list of dotted paths where ``*`` selects list elements.
+    ``export`` (``jsonl``, ``jsonl.zst``, ``parquet``) writes the items to ``export_path``
+    instead and returns only the file path, row count and size.
+    """
+
+    projector = resolve_projector("feed", fields)
+    invocation = _resolve_invocation_args(profile, cookies_path, chrome_bin, debug_dir, trace)
+    if export:
+        produce = partial(_export_items, handler=partial(_search_handler, keyword=keyword))
+        return await _export("search", produce, export, export_path, invocation, projector=projector)
+    profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff = invocation
+
+    feeds = await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=partial(_search_handler, keyword=keyword),
     )
+    return _shape(_redact(feeds), projector)
+
+
+def _feed_detail_handler(ctx: ActionContext, _cookies: Path, *, feed_id: str, xsec_token: str) -> dict[str, Any]:
+    action = FeedDetailAction(ctx)
+    detail = action.get_detail(feed_id, xsec_token)
+    return {"note": detail.data, "comments": detail.comments}
 
 
 @mcp.tool()
 async def feed_detail(
     feed_id: str,
     xsec_token: str,
+    fields: str | list[str] | None = None,
     profile: str | None = None,
     cookies_path: str | None = None,
     chrome_bin: str | None = None,
     debug_dir: str | None = None,
     trace: bool | None = None,
 ) -> dict[str, Any]:
-    """Return note detail and comments."""
+    """Return note detail and comments.
 
+    ``fields`` trims the result before it is returned: a preset (``summary``, ``ids_only``,
+    ``full``) or a list of dotted paths where ``*`` selects list elements.
+    """
+
+    projector = resolve_projector("detail", fields)
     profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff = _resolve_invocation_args(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, Any]:
-        action = FeedDetailAction(ctx)
-        detail = action.get_detail(feed_id, xsec_token)
-        return {"note": detail.data, "comments": detail.comments}
+    detail = await _run_with_page(
+        profile=profile_eff,
+        cookies_path=cookies_eff,
+        chrome_bin=chrome_eff,
+        debug_dir=debug_eff,
+        trace=trace_eff,
+        handler=partial(_feed_detail_handler, feed_id=feed_id, xsec_token=xsec_token),
+    )
+    return _shape(detail, projector)
+
+
+def _feed_comments_handler(
+    ctx: ActionContext,
+    _cookies: Path,
+    *,
+    feed_id: str,
+    xsec_token: str,
+    limit: int,
+    cursor: str | None,
+    expand_replies: bool,
+    max_replies: int,
+) -> dict[str, Any]:
+    batch = FeedCommentsAction(ctx).fetch(
+        feed_id,
+        xsec_token,
+        limit=limit,
+        cursor=cursor,
+        expand_replies=expand_replies,
+        max_replies=max_replies,
+    )
+    return {"comments": batch.comments, "count": len(batch.comments), "cursor": batch.cursor, "has_more": batch.has_more}
+
+
+def _export_comments(
+    ctx: ActionContext,
+    _cookies: Path,
+    sink: Callable[[dict[str, Any]], None],
+    *,
+    feed_id: str,
+    xsec_token: str,
+    limit: int,
+    cursor: str | None,
+    expand_replies: bool,
+    max_replies: int,
+) -> dict[str, Any]:
+    batch = FeedCommentsAction(ctx).fetch(
+        feed_id,
+        xsec_token,
+        limit=limit,
+        cursor=cursor,
+        expand_replies=expand_replies,
+        max_replies=max_replies,
+        sink=sink,
+    )
+    return {"cursor": batch.cursor, "has_more": batch.has_more}
+
+
+@mcp.tool()
+async def feed_comments(
+    feed_id: str,
+    xsec_token: str,
+    limit: int = 50,
+    cursor: str | None = None,
+    expand_replies: bool = False,
+    max_replies: int = 20,
+    export: str | None = None,
+    export_path: str | None = None,
+    profile: str | None = None,
+    cookies_path: str | None = None,
+    chrome_bin: str | None = None,
+    debug_dir: str | None = None,
+    trace: bool | None = None,
+    mcp_ctx: Context | None = None,
+) -> dict[str, Any]:
+    """Page through a note's comments (up to 500 per call).
+
+    Pass the returned ``cursor`` back to continue where the previous call stopped.
+    ``expand_replies`` also loads up to ``max_replies`` sub-comments per comment.
+    ``export`` (``jsonl``, ``jsonl.zst``, ``parquet``) streams comments to ``export_path``
+    as they load, without the 500 cap, and returns only path, row count, size and cursor.
+    """
+
+    invocation = _resolve_invocation_args(profile, cookies_path, chrome_bin, debug_dir, trace)
+    if export:
+        produce = partial(
+            _export_comments,
+            feed_id=feed_id,
+            xsec_token=xsec_token,
+            limit=limit,
+            cursor=cursor,
+            expand_replies=expand_replies,
+            max_replies=max_replies,
+        )
+        return await _export(f"comments-{feed_id}", produce, export, export_path, invocation, mcp_ctx=mcp_ctx)
+    profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff = invocation
 
     return await _run_with_page(
         profile=profile_eff,
@@ -252,29 +813,156 @@ async def feed_detail(
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=partial(
+            _feed_comments_handler,
+            feed_id=feed_id,
+            xsec_token=xsec_token,
+            limit=limit,
+            cursor=cursor,
+            expand_replies=expand_replies,
+            max_replies=max_replies,
+        ),
+        on_progress=_mcp_progress(mcp_ctx),
     )
 
 
+def _media_notes_handler(ctx: ActionContext, _cookies: Path, *, refs: list[tuple[str, str]]) -> list[dict[str, Any]]:
+    action = FeedDetailAction(ctx)
+    notes = []
+    for index, (feed_id, xsec_token) in enumerate(refs):
+        ctx.raise_if_cancelled()
+        try:
+            notes.append({"note": action.get_detail(feed_id, xsec_token).data})
+        except Exception as exc:
+            notes.append({"feed_id": feed_id, "error": f"{type(exc).__name__}: {exc}"})
+        ctx.report(100.0 * (index + 1) / len(refs), f"resolved {feed_id}")
+    return notes
+
+
+def _split_media_items(items: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[tuple[str, str]]]:
+    """Separate note payloads (``feed_detail`` results or bare notes) from ``{feed_id, xsec_token}`` refs."""
+
+    notes: list[dict[str, Any]] = []
+    refs: list[tuple[str, str]] = []
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValueError(f"expected an object per item, got {type(item).__name__}")
+        note = item.get("note", item)
+        if isinstance(note, dict) and ("imageList" in note or "video" in note):
+            notes.append(note)
+            continue
+        feed_id = item.get("feed_id") or item.get("note_id") or item.get("id")
+        xsec_token = item.get("xsec_token") or item.get("xsecToken")
+        if not feed_id or not xsec_token:
+            raise ValueError("each item needs a note payload or feed_id + xsec_token")
+        refs.append((str(feed_id), str(xsec_token)))
+    return notes, refs
+
+
+@mcp.tool()
+async def download_media(
+    items: list[dict[str, Any]],
+    dest_dir: str | None = None,
+    kinds: str = "all",
+    concurrency: int = 8,
+    per_host: int = 4,
+    profile: str | None = None,
+    cookies_path: str | None = None,
+    chrome_bin: str | None = None,
+    debug_dir: str | None = None,
+    trace: bool | None = None,
+    mcp_ctx: Context | None = None,
+) -> dict[str, Any]:
+    """Download the best-quality images/videos of notes to ``dest_dir`` (default ``<state>/media``).
+
+    ``items`` are ``feed_detail`` results or note payloads, or ``{feed_id, xsec_token}``
+    objects whose details are fetched first. ``kinds`` is ``all``, ``images`` or
+    ``videos``. Files land in ``<dest_dir>/<note_id>/``; interrupted files resume, and
+    byte-identical files are stored once. Only paths and stats are returned.
+    """
+
+    if kinds not in ("all", "images", "videos"):
+        raise ValueError("kinds must be 'all', 'images' or 'videos'")
+    profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff = _resolve_invocation_args(
+        profile, cookies_path, chrome_bin, debug_dir, trace
+    )
+    notes, refs = _split_media_items(items)
+    errors: list[dict[str, str]] = []
+    if refs:
+        fetched = await _run_with_page(
+            profile=profile_eff,
+            cookies_path=cookies_eff,
+            chrome_bin=chrome_eff,
+            debug_dir=debug_eff,
+            trace=trace_eff,
+            handler=partial(_media_notes_handler, refs=refs),
+            on_progress=_mcp_progress(mcp_ctx),
+        )
+        notes += [entry["note"] for entry in fetched if "note" in entry]
+        errors += [entry for entry in fetched if "error" in entry]
+
+    dest = Path(dest_dir).expanduser() if dest_dir else get_state_dir(DEFAULTS.state_dir) / "media"
+    requests = [
+        DownloadRequest(item.urls, dest / (item.note_id or "unknown") / f"{item.index:02d}_{item.kind}")
+        for note in notes
+        for item in resolve_media(note, images=kinds != "videos", videos=kinds != "images")
+    ]
+    downloader = MediaDownloader(
+        dest,
+        headers={"User-Agent": _stealth_context_args()["user_agent"], "Referer": "https://www.xiaohongshu.com/"},
+        cookies=load_storage_state(get_cookies_path(cookies_eff, profile_eff)),
+        concurrency=concurrency,
+        per_host=per_host,
+    )
+    report = _mcp_progress(mcp_ctx)
+
+    def on_done(result: Any, finished: int, total: int) -> None:
+        if report is not None:
+            report(100.0 * finished / total, f"{result.status} {Path(result.path).name if result.path else result.url}")
+
+    results = await anyio.to_thread.run_sync(partial(downloader.download, requests, on_done))
+    summary: dict[str, int] = {}
+    for result in results:
+        summary[result.status] = summary.get(result.status, 0) + 1
+    return {
+        "dest_dir": str(dest),
+        "notes": len(notes),
+        "files": [r.to_dict() for r in results],
+        "summary": summary,
+        "bytes": sum(r.bytes for r in results if r.status in ("downloaded", "resumed")),
+        "errors": errors,
+    }
+
+
 def _normalize_tags(tags: Iterable[str] | None) -> list[str]:
     if not tags:
         return []
     return [tag.lstrip("#") for tag in tags if tag]
 
 
+def _publish_image_handler(ctx: ActionContext, _cookies: Path, *, payload: PublishImageContent) -> dict[str, str]:
+    action = PublishImageAction(ctx)
+    action.publish(payload)
+    return {"status": "submitted"}
+
+
 @mcp.tool()
 async def publish_image(
     title: str,
     content: str,
     image_paths: Sequence[str],
     tags: Sequence[str] | None = None,
+    optimize_images: bool | None = None,
     profile: str | None = None,
     cookies_path: str | None = None,
     chrome_bin: str | None = None,
     debug_dir: str | None = None,
     trace: bool | None = None,
 ) -> dict[str, str]:
-    """Publish an image note."""
+    """Publish an image note.
+
+    optimize_images re-encodes oversized or rotated photos before upload (requires Pillow).
+    """
 
     if not image_paths:
         raise ValueError("image_paths must contain at least one file")
@@ -285,17 +973,19 @@ async def publish_image(
 
     normalized_tags = _normalize_tags(tags)
     normalized_images = [str(Path(path).expanduser()) for path in image_paths]
-
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, str]:
-        action = PublishImageAction(ctx)
-        payload = PublishImageContent(
-            title=title,
-            content=content,
-            image_paths=normalized_images,
-            tags=normalized_tags,
-        )
-        action.publish(payload)
-        return {"status": "submitted"}
+    if _resolve_bool(optimize_images, DEFAULTS.optimize_images):
+        options = ImageOptions(max_edge=DEFAULTS.image_max_edge)
+        missing = [path for path in normalized_images if not Path(path).is_file()]
+        if missing:
+            raise ValueError(f"image files not found: {', '.join(missing)}")
+        normalized_images = await anyio.to_thread.run_sync(partial(prepare_images, normalized_images, options))
+
+    payload = PublishImageContent(
+        title=title,
+        content=content,
+        image_paths=normalized_images,
+        tags=normalized_tags,
+    )
 
     return await _run_with_page(
         profile=profile_eff,
@@ -303,23 +993,39 @@ async def publish_image(
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=partial(_publish_image_handler, payload=payload),
     )
 
 
+def _publish_video_handler(
+    ctx: ActionContext, _cookies: Path, *, payload: PublishVideoContent, stall_timeout: float
+) -> dict[str, str]:
+    action = PublishVideoAction(ctx)
+    action.publish(payload, stall_timeout=stall_timeout)
+    return {"status": "submitted"}
+
+
 @mcp.tool()
 async def publish_video(
     title: str,
     content: str,
     video_path: str,
     tags: Sequence[str] | None = None,
+    wait: bool = False,
+    stall_timeout: float = 90.0,
     profile: str | None = None,
     cookies_path: str | None = None,
     chrome_bin: str | None = None,
     debug_dir: str | None = None,
     trace: bool | None = None,
-) -> dict[str, str]:
-    """Publish a video note."""
+    mcp_ctx: Context | None = None,
+) -> dict[str, Any]:
+    """Publish a video note.
+
+    Returns a job id immediately (poll with job_status); pass wait=true to block until done
+    and receive upload progress notifications. The upload fails fast when the creator page
+    rejects it or no progress is seen for stall_timeout seconds.
+    """
 
     profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff = _resolve_invocation_args(
         profile, cookies_path, chrome_bin, debug_dir, trace
@@ -328,16 +1034,25 @@ async def publish_video(
     normalized_tags = _normalize_tags(tags)
     normalized_video = str(Path(video_path).expanduser())
 
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, str]:
-        action = PublishVideoAction(ctx)
-        payload = PublishVideoContent(
-            title=title,
-            content=content,
-            video_path=normalized_video,
-            tags=normalized_tags,
+    payload = PublishVideoContent(
+        title=title,
+        content=content,
+        video_path=normalized_video,
+        tags=normalized_tags,
+    )
+    handler = partial(_publish_video_handler, payload=payload, stall_timeout=stall_timeout)
+
+    if not wait:
+        return _start_job(
+            "publish_video",
+            {"title": title, "video_path": normalized_video, "profile": profile_eff},
+            profile=profile_eff,
+            cookies_path=cookies_eff,
+            chrome_bin=chrome_eff,
+            debug_dir=debug_eff,
+            trace=trace_eff,
+            handler=handler,
         )
-        action.publish(payload)
-        return {"status": "submitted"}
 
     return await _run_with_page(
         profile=profile_eff,
@@ -346,9 +1061,179 @@ async def publish_video(
         debug_dir=debug_eff,
         trace=trace_eff,
         handler=handler,
+        on_progress=_mcp_progress(mcp_ctx),
+    )
+
+
+def _post_comment_handler(
+    ctx: ActionContext, _cookies: Path, *, feed_id: str, xsec_token: str, content: str
+) -> dict[str, str]:
+    action = CommentAction(ctx)
+    action.post_comment(feed_id, xsec_token, content)
+    return {"status": "submitted"}
+
+
+def _publish_queue_path() -> Path:
+    return get_state_dir(DEFAULTS.state_dir) / "publish_queue.json"
+
+
+def _publish_queue_handler(ctx: ActionContext, _cookies: Path, *, queue_path: Path, item_ids: list[str]) -> dict[str, str]:
+    """Publish claimed queue items one after another on the same creator page."""
+
+    queue = PublishQueue(queue_path)
+    outcomes: dict[str, str] = {}
+    for index, item_id in enumerate(item_ids):
+        item = queue.get(item_id)
+        if item is None or item.status != CLAIMED:
+            continue
+        ctx.report(index * 100.0 / len(item_ids), f"publishing {item_id}")
+        started = time.time()
+        queue.update(item_id, status=RUNNING, started_at=started, attempts=item.attempts + 1, error=None)
+        try:
+            ctx.raise_if_cancelled()
+            if item.kind == "video":
+                PublishVideoAction(ctx).publish(
+                    PublishVideoContent(
+                        title=item.title, content=item.content, video_path=item.video_path or "", tags=item.tags
+                    )
+                )
+            else:
+                PublishImageAction(ctx).publish(
+                    PublishImageContent(
+                        title=item.title, content=item.content, image_paths=item.image_paths, tags=item.tags
+                    )
+                )
+        except Exception as exc:
+            finished = time.time()
+            queue.update(
+                item_id,
+                status=FAILED,
+                error=f"{type(exc).__name__}: {exc}",
+                finished_at=finished,
+                duration_s=round(finished - started, 3),
+            )
+            outcomes[item_id] = FAILED
+            if isinstance(exc, ActionCancelled):
+                raise
+            # A half-filled editor must not leak into the next post.
+            ctx.page.goto("about:blank")
+            continue
+        finished = time.time()
+        queue.update(item_id, status=SUCCEEDED, finished_at=finished, duration_s=round(finished - started, 3))
+        outcomes[item_id] = SUCCEEDED
+    return outcomes
+
+
+def _run_publish_session(_key: str, items: list[QueueItem]) -> None:
+    first = items[0]
+    _run_with_page_sync(
+        profile=first.profile,
+        cookies_path=first.cookies_path,
+        chrome_bin=DEFAULTS.chrome_bin,
+        debug_dir=DEFAULTS.debug_dir,
+        trace=DEFAULTS.trace,
+        handler=partial(_publish_queue_handler, queue_path=_publish_queue_path(), item_ids=[i.id for i in items]),
+    )
+
+
+def _publish_scheduler() -> PublishQueueScheduler:
+    global _PUBLISH_SCHEDULER
+    if _PUBLISH_SCHEDULER is None:
+        # Without `serve --publish-queue-interval` the scheduler only runs on publish_queue_run.
+        _PUBLISH_SCHEDULER = PublishQueueScheduler(PublishQueue(_publish_queue_path()), _run_publish_session)
+        _PUBLISH_SCHEDULER.queue.recover()
+    return _PUBLISH_SCHEDULER
+
+
+def configure_publish_queue(interval: float) -> None:
+    """Start the background publish-queue scheduler (interval <= 0 leaves it manual)."""
+
+    global _PUBLISH_SCHEDULER
+    if _PUBLISH_SCHEDULER is not None:
+        _PUBLISH_SCHEDULER.close()
+        _PUBLISH_SCHEDULER = None
+    if interval <= 0:
+        return
+    scheduler = PublishQueueScheduler(PublishQueue(_publish_queue_path()), _run_publish_session, interval=interval)
+    scheduler.start()
+    _PUBLISH_SCHEDULER = scheduler
+
+
+def _queue_item_from_request(raw: dict[str, Any], profile: str | None, cookies_path: str | None) -> QueueItem:
+    title = raw.get("title")
+    if not title:
+        raise ValueError("each queue item needs a title")
+    video_path = raw.get("video_path")
+    image_paths = [str(Path(p).expanduser()) for p in raw.get("image_paths") or []]
+    if not video_path and not image_paths:
+        raise ValueError(f"queue item '{title}' needs image_paths or video_path")
+    item_profile = raw.get("profile", profile)
+    item_cookies = raw.get("cookies_path", cookies_path)
+    return QueueItem(
+        id="",
+        kind="video" if video_path else "image",
+        title=title,
+        content=raw.get("content", ""),
+        image_paths=image_paths,
+        video_path=str(Path(video_path).expanduser()) if video_path else None,
+        tags=_normalize_tags(raw.get("tags")),
+        profile=item_profile,
+        cookies_path=item_cookies,
+        session_key=str(get_cookies_path(item_cookies, item_profile)),
+        scheduled_at=parse_schedule(raw.get("scheduled_at")),
     )
 
 
+@mcp.tool()
+async def publish_queue_add(
+    items: list[dict[str, Any]],
+    profile: str | None = None,
+    cookies_path: str | None = None,
+) -> dict[str, Any]:
+    """Queue notes for publishing.
+
+    Each item: title, content, image_paths or video_path, optional tags and scheduled_at
+    (ISO 8601 or epoch seconds; omitted means as soon as possible). Items of one profile
+    are published in a single creator-page session.
+    """
+
+    profile_eff = _effective_str(profile, DEFAULTS.profile)
+    cookies_eff = _effective_str(cookies_path, DEFAULTS.cookies_path)
+    queue_items = [_queue_item_from_request(raw, profile_eff, cookies_eff) for raw in items]
+    scheduler = _publish_scheduler()
+    scheduler.queue.add(queue_items)
+    scheduler.wake()
+    return {"added": [item.id for item in queue_items]}
+
+
+@mcp.tool()
+async def publish_queue_status(item_id: str | None = None, status: str | None = None) -> dict[str, Any]:
+    """Show queued/finished publish items with per-item outcome and timing."""
+
+    queue = _publish_scheduler().queue
+    if item_id is not None:
+        item = queue.get(item_id)
+        if item is None:
+            raise ValueError(f"unknown queue item {item_id}")
+        return item.to_dict()
+    return {"items": [item.to_dict() for item in queue.list(status)]}
+
+
+@mcp.tool()
+async def publish_queue_run() -> dict[str, Any]:
+    """Start publishing every due item now instead of waiting for the next scheduler tick."""
+
+    claimed = await anyio.to_thread.run_sync(_publish_scheduler().tick)
+    return {"sessions": claimed}
+
+
+@mcp.tool()
+async def publish_queue_remove(item_id: str) -> dict[str, Any]:
+    """Remove an item that has not started publishing yet."""
+
+    return {"item_id": item_id, "removed": _publish_scheduler().queue.remove(item_id)}
+
+
 @mcp.tool()
 async def post_comment(
     feed_id: str,
@@ -366,21 +1251,77 @@ async def post_comment(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, str]:
-        action = CommentAction(ctx)
-        action.post_comment(feed_id, xsec_token, content)
-        return {"status": "submitted"}
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=partial(_post_comment_handler, feed_id=feed_id, xsec_token=xsec_token, content=content),
     )
 
 
+_INTERACT_EXECUTORS: dict[str, Callable[[ActionContext, str, str, bool], InteractResult]] = {
+    "like": lambda ctx, feed_id, token, nav: LikeAction(ctx).like(feed_id, token, navigate=nav),
+    "unlike": lambda ctx, feed_id, token, nav: LikeAction(ctx).unlike(feed_id, token, navigate=nav),
+    "favorite": lambda ctx, feed_id, token, nav: FavoriteAction(ctx).favorite(feed_id, token, navigate=nav),
+    "unfavorite": lambda ctx, feed_id, token, nav: FavoriteAction(ctx).unfavorite(feed_id, token, navigate=nav),
+}
+
+
+def _interact_handler(
+    ctx: ActionContext, _cookies: Path, *, action: str, feed_id: str, xsec_token: str
+) -> dict[str, Any]:
+    result = _INTERACT_EXECUTORS[action](ctx, feed_id, xsec_token, True)
+    return {"status": "confirmed", **result.to_dict()}
+
+
+def _interact_batch_handler(ctx: ActionContext, _cookies: Path, *, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Open each note once and run all of its actions on the same page."""
+
+    results: list[dict[str, Any]] = []
+    for index, item in enumerate(items):
+        ctx.raise_if_cancelled()
+        feed_id, xsec_token = item["feed_id"], item["xsec_token"]
+        ctx.report(index * 100.0 / len(items), f"note {feed_id}")
+        entry: dict[str, Any] = {"feed_id": feed_id, "ok": True, "actions": []}
+        results.append(entry)
+        try:
+            NavigateAction(ctx).to_note_page(feed_id, xsec_token)
+        except Exception as exc:
+            entry["ok"] = False
+            entry["error"] = f"navigation failed: {type(exc).__name__}: {exc}"
+            entry["actions"] = [{"action": name, "ok": False, "error": "skipped"} for name in item["actions"]]
+            continue
+        for name in item["actions"]:
+            try:
+                if name == "comment":
+                    CommentAction(ctx).post_comment(feed_id, xsec_token, item["comment"], navigate=False)
+                    detail: dict[str, Any] = {}
+                else:
+                    detail = _INTERACT_EXECUTORS[name](ctx, feed_id, xsec_token, False).to_dict()
+            except Exception as exc:
+                entry["ok"] = False
+                entry["actions"].append({"action": name, "ok": False, "error": f"{type(exc).__name__}: {exc}"})
+            else:
+                entry["actions"].append({"action": name, "ok": True, **detail})
+    return results
+
+
+def _normalize_batch_item(raw: dict[str, Any]) -> dict[str, Any]:
+    feed_id = raw.get("feed_id")
+    xsec_token = raw.get("xsec_token")
+    if not feed_id or not xsec_token:
+        raise ValueError("each item needs feed_id and xsec_token")
+    actions = [str(a) for a in raw.get("actions") or []]
+    unknown = [a for a in actions if a != "comment" and a not in _INTERACT_EXECUTORS]
+    if unknown:
+        raise ValueError(f"unsupported actions for {feed_id}: {unknown}")
+    if "comment" in actions and not raw.get("comment"):
+        raise ValueError(f"item {feed_id} lists 'comment' but has no comment text")
+    return {"feed_id": feed_id, "xsec_token": xsec_token, "actions": actions, "comment": raw.get("comment")}
+
+
 async def _interact_common(
     *,
     feed_id: str,
@@ -390,23 +1331,19 @@ async def _interact_common(
     chrome_bin: str | None,
     debug_dir: str | None,
     trace: bool | None,
-    executor: Callable[[ActionContext], None],
-) -> dict[str, str]:
+    action: str,
+) -> dict[str, Any]:
     profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff = _resolve_invocation_args(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, str]:
-        executor(ctx)
-        return {"status": "submitted"}
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=partial(_interact_handler, action=action, feed_id=feed_id, xsec_token=xsec_token),
     )
 
 
@@ -419,7 +1356,7 @@ async def like_feed(
     chrome_bin: str | None = None,
     debug_dir: str | None = None,
     trace: bool | None = None,
-) -> dict[str, str]:
+) -> dict[str, Any]:
     """Like a feed."""
 
     return await _interact_common(
@@ -430,7 +1367,7 @@ async def like_feed(
         chrome_bin=chrome_bin,
         debug_dir=debug_dir,
         trace=trace,
-        executor=lambda ctx: LikeAction(ctx).like(feed_id, xsec_token),
+        action="like",
     )
 
 
@@ -443,7 +1380,7 @@ async def unlike_feed(
     chrome_bin: str | None = None,
     debug_dir: str | None = None,
     trace: bool | None = None,
-) -> dict[str, str]:
+) -> dict[str, Any]:
     """Cancel a like."""
 
     return await _interact_common(
@@ -454,7 +1391,7 @@ async def unlike_feed(
         chrome_bin=chrome_bin,
         debug_dir=debug_dir,
         trace=trace,
-        executor=lambda ctx: LikeAction(ctx).unlike(feed_id, xsec_token),
+        action="unlike",
     )
 
 
@@ -467,7 +1404,7 @@ async def favorite_feed(
     chrome_bin: str | None = None,
     debug_dir: str | None = None,
     trace: bool | None = None,
-) -> dict[str, str]:
+) -> dict[str, Any]:
     """Collect a feed."""
 
     return await _interact_common(
@@ -478,7 +1415,7 @@ async def favorite_feed(
         chrome_bin=chrome_bin,
         debug_dir=debug_dir,
         trace=trace,
-        executor=lambda ctx: FavoriteAction(ctx).favorite(feed_id, xsec_token),
+        action="favorite",
     )
 
 
@@ -491,7 +1428,7 @@ async def unfavorite_feed(
     chrome_bin: str | None = None,
     debug_dir: str | None = None,
     trace: bool | None = None,
-) -> dict[str, str]:
+) -> dict[str, Any]:
     """Cancel a collect."""
 
     return await _interact_common(
@@ -502,45 +1439,132 @@ async def unfavorite_feed(
         chrome_bin=chrome_bin,
         debug_dir=debug_dir,
         trace=trace,
-        executor=lambda ctx: FavoriteAction(ctx).unfavorite(feed_id, xsec_token),
+        action="unfavorite",
     )
 
 
-@mcp.tool()
-async def user_profile(
+def _profile_result(profile_data: Any) -> dict[str, Any]:
+    return {
+        "basic_info": profile_data.basic_info,
+        "interactions": profile_data.interactions,
+        "feeds": profile_data.feeds,
+        "cursor": profile_data.cursor,
+        "has_more": profile_data.has_more,
+    }
+
+
+def _user_profile_handler(
+    ctx: ActionContext,
+    _cookies: Path,
+    *,
     user_id: str,
     xsec_token: str,
+    max_notes: int | None = None,
+    cursor: str | None = None,
+) -> dict[str, Any]:
+    action = UserProfileAction(ctx)
+    return _profile_result(action.user_profile(user_id, xsec_token, max_notes=max_notes, cursor=cursor))
+
+
+def _export_user_notes(
+    ctx: ActionContext,
+    _cookies: Path,
+    sink: Callable[[dict[str, Any]], None],
+    *,
+    user_id: str,
+    xsec_token: str,
+    max_notes: int | None,
+    cursor: str | None,
+) -> dict[str, Any]:
+    result = UserProfileAction(ctx).user_profile(user_id, xsec_token, max_notes=max_notes, cursor=cursor, sink=sink)
+    return {"cursor": result.cursor, "has_more": result.has_more}
+
+
+@mcp.tool()
+async def interact_batch(
+    items: list[dict[str, Any]],
     profile: str | None = None,
     cookies_path: str | None = None,
     chrome_bin: str | None = None,
     debug_dir: str | None = None,
     trace: bool | None = None,
-) -> dict[str, Any]:
-    """Fetch user profile information."""
+) -> list[dict[str, Any]]:
+    """Like/favorite/comment many notes in one browser session.
+
+    Each item: feed_id, xsec_token, actions (any of like, unlike, favorite, unfavorite,
+    comment) and comment text when commenting. Each note is opened once; results are
+    reported per item and per action.
+    """
 
+    normalized = [_normalize_batch_item(raw) for raw in items]
     profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff = _resolve_invocation_args(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, Any]:
-        action = UserProfileAction(ctx)
-        profile_data = action.user_profile(user_id, xsec_token)
-        return {
-            "basic_info": profile_data.basic_info,
-            "interactions": profile_data.interactions,
-            "feeds": profile_data.feeds,
-        }
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=partial(_interact_batch_handler, items=normalized),
     )
 
 
+@mcp.tool()
+async def user_profile(
+    user_id: str,
+    xsec_token: str,
+    max_notes: int | None = None,
+    cursor: str | None = None,
+    fields: str | list[str] | None = None,
+    export: str | None = None,
+    export_path: str | None = None,
+    profile: str | None = None,
+    cookies_path: str | None = None,
+    chrome_bin: str | None = None,
+    debug_dir: str | None = None,
+    trace: bool | None = None,
+    mcp_ctx: Context | None = None,
+) -> dict[str, Any]:
+    """Fetch user profile information.
+
+    Set ``max_notes`` (up to 500) to page through the creator's notes; pass the returned
+    ``cursor`` to continue. Without either only the first rendered page is returned.
+    ``fields`` trims the result: a preset (``summary``, ``ids_only``, ``full``) or a list
+    of dotted paths where ``*`` selects list elements. ``export`` (``jsonl``,
+    ``jsonl.zst``, ``parquet``) streams the notes to ``export_path`` instead (all of them
+    unless ``max_notes`` is set) and returns only path, row count, size and cursor.
+    """
+
+    projector = resolve_projector("profile", fields)
+    invocation = _resolve_invocation_args(profile, cookies_path, chrome_bin, debug_dir, trace)
+    if export:
+        produce = partial(
+            _export_user_notes, user_id=user_id, xsec_token=xsec_token, max_notes=max_notes, cursor=cursor
+        )
+        return await _export(f"user-{user_id}", produce, export, export_path, invocation, mcp_ctx=mcp_ctx)
+    profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff = invocation
+
+    result = await _run_with_page(
+        profile=profile_eff,
+        cookies_path=cookies_eff,
+        chrome_bin=chrome_eff,
+        debug_dir=debug_eff,
+        trace=trace_eff,
+        handler=partial(
+            _user_profile_handler, user_id=user_id, xsec_token=xsec_token, max_notes=max_notes, cursor=cursor
+        ),
+        on_progress=_mcp_progress(mcp_ctx),
+    )
+    return _shape(result, projector)
+
+
+def _my_profile_handler(ctx: ActionContext, _cookies: Path) -> dict[str, Any]:
+    action = UserProfileAction(ctx)
+    return _profile_result(action.get_my_profile_via_sidebar())
+
+
 @mcp.tool()
 async def my_profile(
     profile: str | None = None,
@@ -555,25 +1579,21 @@ async def my_profile(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, Any]:
-        action = UserProfileAction(ctx)
-        profile_data = action.get_my_profile_via_sidebar()
-        return {
-            "basic_info": profile_data.basic_info,
-            "interactions": profile_data.interactions,
-            "feeds": profile_data.feeds,
-        }
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=_my_profile_handler,
     )
 
 
+def _check_login_handler(ctx: ActionContext, _cookies: Path) -> dict[str, bool]:
+    logged = check_login_status(ctx.page)
+    return {"logged_in": logged}
+
+
 @mcp.tool()
 async def check_login(
     profile: str | None = None,
@@ -588,85 +1608,213 @@ async def check_login(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, bool]:
-        logged = check_login_status(ctx.page)
-        return {"logged_in": logged}
-
     return await _run_with_page(
         profile=profile_eff,
         cookies_path=cookies_eff,
         chrome_bin=chrome_eff,
         debug_dir=debug_eff,
         trace=trace_eff,
-        handler=handler,
+        handler=_check_login_handler,
     )
 
 
+def _login_qrcode_handler(
+    ctx: ActionContext, _cookies: Path, *, timeout: int, poll_interval: float, reload_interval: float
+) -> dict[str, Any]:
+    src, logged = fetch_qrcode_image(
+        ctx.page,
+        timeout_seconds=timeout,
+        poll_interval=poll_interval,
+        reload_interval=reload_interval,
+        verbose=False,
+    )
+    return {"logged_in": logged, "qrcode": src}
+
+
+def _login_sessions() -> LoginSessionManager:
+    global _LOGIN_SESSIONS
+    if _LOGIN_SESSIONS is None:
+        _LOGIN_SESSIONS = LoginSessionManager()
+    return _LOGIN_SESSIONS
+
+
+@contextlib.contextmanager
+def _login_page(cookies_file: Path, chrome_exe: str | None, debug_dir: Path | None, trace: bool) -> Iterator[Any]:
+    # Runs on the session thread, so the admission grant covers the browser for the
+    # whole session, not just the call that opened it.
+    admission = _ADMISSION
+    with (
+        admission.admit("login_qrcode") if admission is not None else contextlib.nullcontext(),
+        pw() as playwright,
+        _local_context(playwright, cookies_file, chrome_exe) as context,
+    ):
+        page = context.new_page()
+        with debug_capture(context, page, debug_dir, trace):
+            yield page
+
+
+def _in_session(
+    session: LoginSession,
+    handler: Callable[[ActionContext, Path], T],
+    cookies_file: Path,
+    *,
+    on_progress: ProgressCallback | None = None,
+    cancel_event: threading.Event | None = None,
+) -> T:
+    def run(page: Any) -> T:
+        return handler(ActionContext(page, on_progress=on_progress, cancel_event=cancel_event), cookies_file)
+
+    with metrics.timed(f"call.{_handler_name(handler)}"):
+        return session.call(run)
+
+
+def _open_login_session(
+    *,
+    cookies_path: str | None,
+    profile: str | None,
+    chrome_bin: str | None,
+    debug_dir: Path | None,
+    trace: bool,
+    ttl: float,
+    handler: Callable[[ActionContext, Path], dict[str, Any]],
+) -> dict[str, Any]:
+    cookies_file = get_cookies_path(cookies_path, profile)
+    opener = partial(_login_page, cookies_file, get_chrome_executable(chrome_bin), debug_dir, trace)
+    manager = _login_sessions()
+    session = manager.open(str(cookies_file), opener, ttl=ttl)
+    try:
+        result = _in_session(session, handler, cookies_file)
+    except BaseException:
+        manager.close(session.id)
+        raise
+    if not result.get("qrcode"):
+        # Already logged in, or no QR code to scan: nothing to keep open.
+        manager.close(session.id)
+        return {**result, "session_id": None}
+    return {**result, "session_id": session.id, "expires_at": session.expires_at}
+
+
 @mcp.tool()
 async def get_login_qrcode(
     timeout: int = 240,
     poll_interval: float = 0.5,
     reload_interval: float = 10.0,
+    session_ttl: float = 300.0,
     profile: str | None = None,
     cookies_path: str | None = None,
     chrome_bin: str | None = None,
     debug_dir: str | None = None,
     trace: bool | None = None,
 ) -> dict[str, Any]:
-    """Fetch login QR code image source."""
+    """Fetch login QR code image source.
+
+    The page showing the QR code stays open for ``session_ttl`` seconds under the returned
+    ``session_id``; pass it to wait_for_login_complete so the scan is detected on that page.
+    """
 
     profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff = _resolve_invocation_args(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, _cookies: Path) -> dict[str, Any]:
-        src, logged = fetch_qrcode_image(
-            ctx.page,
-            timeout_seconds=timeout,
-            poll_interval=poll_interval,
-            reload_interval=reload_interval,
-            verbose=False,
+    return await anyio.to_thread.run_sync(
+        partial(
+            _open_login_session,
+            cookies_path=cookies_eff,
+            profile=profile_eff,
+            chrome_bin=chrome_eff,
+            debug_dir=debug_eff,
+            trace=trace_eff,
+            ttl=session_ttl,
+            handler=partial(
+                _login_qrcode_handler,
+                timeout=timeout,
+                poll_interval=poll_interval,
+                reload_interval=reload_interval,
+            ),
         )
-        return {"logged_in": logged, "qrcode": src}
+    )
 
-    return await _run_with_page(
-        profile=profile_eff,
-        cookies_path=cookies_eff,
-        chrome_bin=chrome_eff,
-        debug_dir=debug_eff,
-        trace=trace_eff,
-        handler=handler,
+
+def _wait_login_handler(ctx: ActionContext, cookies_file: Path, *, timeout: int, poll_interval: float) -> dict[str, Any]:
+    ctx.report(None, "waiting_for_scan")
+    success = wait_for_login(
+        ctx.page,
+        timeout_seconds=timeout,
+        poll_interval=poll_interval,
+        verbose=False,
+        should_stop=lambda: ctx.cancelled,
     )
+    ctx.raise_if_cancelled()
+    if not success:
+        raise RuntimeError("Login timed out.")
+    ctx.report(None, "saving_cookies")
+    state = ctx.page.context.storage_state()
+    save_storage_state(cookies_file, state)
+    return {"status": "logged_in", "cookies_path": str(cookies_file)}
+
+
+def _wait_in_session(
+    session: LoginSession,
+    handler: Callable[[ActionContext, Path], dict[str, Any]],
+    on_progress: ProgressCallback | None = None,
+    cancel_event: threading.Event | None = None,
+) -> dict[str, Any]:
+    result = _in_session(
+        session, handler, Path(session.key), on_progress=on_progress, cancel_event=cancel_event
+    )
+    # Cookies are saved; a timed-out wait leaves the session open for another try.
+    _login_sessions().close(session.id)
+    return result
 
 
 @mcp.tool()
 async def wait_for_login_complete(
     timeout: int = 240,
     poll_interval: float = 0.5,
+    wait: bool = False,
+    session_id: str | None = None,
     profile: str | None = None,
     cookies_path: str | None = None,
     chrome_bin: str | None = None,
     debug_dir: str | None = None,
     trace: bool | None = None,
 ) -> dict[str, Any]:
-    """Wait for QR login to succeed and persist cookies."""
+    """Wait for QR login to succeed and persist cookies.
+
+    Pass the ``session_id`` from get_login_qrcode to watch the page showing that QR code;
+    cookies then go to that call's profile. Without it a new browser is opened.
+    Returns a job id immediately (poll with job_status); pass wait=true to block until done.
+    """
+
+    handler = partial(_wait_login_handler, timeout=timeout, poll_interval=poll_interval)
+    if session_id is not None:
+        session = _login_sessions().get(session_id)
+        if session is None:
+            raise ValueError(f"unknown or expired login session {session_id}; call get_login_qrcode again")
+        if not wait:
+            job = _job_manager().submit(
+                "wait_for_login_complete",
+                partial(_wait_in_session, session, handler),
+                {"timeout": timeout, "session_id": session_id},
+            )
+            return {"job_id": job.id, "status": job.status}
+        return await anyio.to_thread.run_sync(partial(_wait_in_session, session, handler))
 
     profile_eff, cookies_eff, chrome_eff, debug_eff, trace_eff = _resolve_invocation_args(
         profile, cookies_path, chrome_bin, debug_dir, trace
     )
 
-    def handler(ctx: ActionContext, cookies_file: Path) -> dict[str, Any]:
-        success = wait_for_login(
-            ctx.page,
-            timeout_seconds=timeout,
-            poll_interval=poll_interval,
-            verbose=False,
+    if not wait:
+        return _start_job(
+            "wait_for_login_complete",
+            {"timeout": timeout, "profile": profile_eff},
+            profile=profile_eff,
+            cookies_path=cookies_eff,
+            chrome_bin=chrome_eff,
+            debug_dir=debug_eff,
+            trace=trace_eff,
+            handler=handler,
         )
-        if not success:
-            raise RuntimeError("Login timed out.")
-        state = ctx.page.context.storage_state()
-        save_storage_state(cookies_file, state)
-        return {"status": "logged_in", "cookies_path": str(cookies_file)}
 
     return await _run_with_page(
         profile=profile_eff,
@@ -678,6 +1826,246 @@ async def wait_for_login_complete(
     )
 
 
+def _keepalive_handler(ctx: ActionContext, _cookies: Path) -> dict[str, Any] | None:
+    if not check_login_status(ctx.page):
+        return None  # logged out: keep the old file for diagnosis rather than saving an empty session
+    return ctx.page.context.storage_state()
+
+
+def _refresh_profile(profile: str, _cookies_file: Path) -> dict[str, Any] | None:
+    return _run_with_page_sync(
+        profile=profile,
+        cookies_path=None,
+        chrome_bin=DEFAULTS.chrome_bin,
+        debug_dir=DEFAULTS.debug_dir,
+        trace=False,
+        handler=_keepalive_handler,
+    )
+
+
+def _server_busy() -> bool:
+    if _ADMISSION is not None and _ADMISSION.status()["in_flight"]:
+        return True
+    pool = _WORKER_POOL
+    return pool is not None and any(worker["busy"] for worker in pool.status())
+
+
+def configure_keepalive(interval: float, *, jitter: float = 0.2, warn_before: float = 72 * 3600.0) -> None:
+    """Keep saved profiles' sessions fresh every ``interval`` seconds (<= 0 disables).
+
+    Each ``profiles/*/cookies.json`` is opened on the explore page in turn and, if still
+    logged in, its storage state is saved back; runs are jittered, niced and yield to
+    user calls in flight.
+    """
+
+    global _KEEPALIVE
+    if _KEEPALIVE is not None:
+        _KEEPALIVE.close()
+        _KEEPALIVE = None
+    if interval <= 0:
+        return
+    _KEEPALIVE = KeepAliveScheduler(
+        DEFAULT_PROFILES_DIR,
+        _refresh_profile,
+        interval=interval,
+        jitter=jitter,
+        warn_before=warn_before,
+        is_busy=_server_busy,
+    )
+    _KEEPALIVE.start()
+
+
+@mcp.tool()
+async def keepalive_status(run_now: bool = False, profile: str | None = None) -> dict[str, Any]:
+    """Report each saved profile's login state, cookie time-to-expiry and last keep-alive run.
+
+    ``run_now`` refreshes ``profile`` (or every profile) immediately instead of waiting for
+    its scheduled run.
+    """
+
+    scheduler = _KEEPALIVE
+    if scheduler is None:
+        raise RuntimeError("keep-alive is off (serve --keepalive-interval SECONDS)")
+    if run_now:
+        await anyio.to_thread.run_sync(scheduler.discover)
+        names = [profile] if profile else [s["profile"] for s in scheduler.status()]
+        for name in names:
+            try:
+                await anyio.to_thread.run_sync(scheduler.run_profile, name)
+            except KeyError:
+                raise ValueError(f"unknown profile {name}") from None
+    profiles = scheduler.status()
+    if profile:
+        profiles = [s for s in profiles if s["profile"] == profile]
+    return {
+        "interval_s": scheduler.interval,
+        "warn_before_s": scheduler.warn_before,
+        "expiring": [s["profile"] for s in profiles if s["expiring"] or s["logged_in"] is False],
+        "profiles": profiles,
+    }
+
+
+@mcp.tool()
+async def job_status(job_id: str | None = None, active_only: bool = False) -> dict[str, Any]:
+    """Report phase, progress and result of a background job; lists jobs when job_id is omitted."""
+
+    manager = _job_manager()
+    if job_id is None:
+        return {"jobs": [job.snapshot() for job in manager.list(active_only=active_only)]}
+    job = manager.get(job_id)
+    if job is None:
+        raise ValueError(f"unknown job {job_id}")
+    return job.snapshot()
+
+
+@mcp.tool()
+async def job_cancel(job_id: str) -> dict[str, Any]:
+    """Ask a running background job to stop."""
+
+    manager = _job_manager()
+    if manager.get(job_id) is None:
+        raise ValueError(f"unknown job {job_id}")
+    return {"job_id": job_id, "cancel_requested": manager.cancel(job_id)}
+
+
+def _watch_user_handler(ctx: ActionContext, _cookies: Path, *, user_id: str, xsec_token: str) -> list[dict[str, Any]]:
+    return UserProfileAction(ctx).user_profile(user_id, xsec_token).feeds
+
+
+def _run_watch(watch: Watch) -> list[dict[str, Any]]:
+    if watch.kind == KEYWORD:
+        handler = partial(_search_handler, keyword=watch.target)
+    else:
+        handler = partial(_watch_user_handler, user_id=watch.target, xsec_token=watch.xsec_token or "")
+    notes = _run_with_page_sync(
+        profile=watch.profile,
+        cookies_path=watch.cookies_path,
+        chrome_bin=DEFAULTS.chrome_bin,
+        debug_dir=DEFAULTS.debug_dir,
+        trace=DEFAULTS.trace,
+        handler=handler,
+    )
+    return _redact(notes)
+
+
+def _watch_manager() -> WatchManager:
+    global _WATCHES
+    if _WATCHES is None:
+        _WATCHES = WatchManager(get_state_dir(DEFAULTS.state_dir) / "watches.json", _run_watch)
+        _WATCHES.start()
+    return _WATCHES
+
+
+def configure_watches(sink: Path | None = None) -> None:
+    """Start running persisted watches at boot, appending deltas to ``sink`` (JSONL) when set."""
+
+    global _WATCHES
+    if _WATCHES is not None:
+        _WATCHES.close()
+    _WATCHES = WatchManager(get_state_dir(DEFAULTS.state_dir) / "watches.json", _run_watch, sink=sink)
+    _WATCHES.start()
+
+
+@mcp.tool()
+async def watch_add(
+    kind: str,
+    target: str,
+    interval_s: float = 300.0,
+    xsec_token: str | None = None,
+    profile: str | None = None,
+    cookies_path: str | None = None,
+) -> dict[str, Any]:
+    """Watch a search keyword (kind="keyword") or a creator (kind="user", needs xsec_token) for new notes.
+
+    The first run only records what is already there; later runs report notes not seen
+    before through watch_poll.
+    """
+
+    if kind == USER and not xsec_token:
+        raise ValueError("user watches need the creator's xsec_token")
+    watch = Watch(
+        id="",
+        kind=kind,
+        target=target,
+        xsec_token=xsec_token,
+        interval_s=max(30.0, interval_s),
+        profile=_effective_str(profile, DEFAULTS.profile),
+        cookies_path=_effective_str(cookies_path, DEFAULTS.cookies_path),
+    )
+    return _watch_manager().add(watch).snapshot()
+
+
+@mcp.tool()
+async def watch_list() -> dict[str, Any]:
+    """List watches with their last run, error and counts."""
+
+    return {"watches": [w.snapshot() for w in _watch_manager().list()]}
+
+
+@mcp.tool()
+async def watch_remove(watch_id: str) -> dict[str, Any]:
+    """Stop and delete a watch."""
+
+    return {"removed": _watch_manager().remove(watch_id)}
+
+
+@mcp.tool()
+async def watch_poll(since: int = 0, watch_id: str | None = None, limit: int = 100) -> dict[str, Any]:
+    """Return newly appeared notes with sequence numbers greater than ``since``.
+
+    Pass the returned ``next_since`` on the next call. Only recent deltas are buffered
+    in memory; use ``serve --watch-sink`` to keep a complete JSONL log.
+    """
+
+    deltas, next_since = _watch_manager().poll(since, watch_id, limit)
+    return {"deltas": [asdict(d) for d in deltas], "next_since": next_since}
+
+
+@mcp.tool()
+async def server_metrics(reset: bool = False) -> dict[str, Any]:
+    """Report per-tool call latency (ms) and error counts plus redaction counters."""
+
+    data = metrics.snapshot()
+    if reset:
+        metrics.reset()
+    return data
+
+
+@mcp.tool()
+async def worker_status() -> dict[str, Any]:
+    """Report browser worker pool, remote browser endpoint and admission-control health."""
+
+    pool = _WORKER_POOL
+    endpoints = _ENDPOINTS.status() if _ENDPOINTS is not None else []
+    admission = _ADMISSION.status() if _ADMISSION is not None else None
+    cache = _profile_cache()
+    browser_cache = await anyio.to_thread.run_sync(cache.status) if cache is not None else None
+    asset_cache = _ASSET_PROXY.stats() if _ASSET_PROXY is not None else None
+    login_sessions = _LOGIN_SESSIONS.status() if _LOGIN_SESSIONS is not None else []
+    if pool is None:
+        return {
+            "mode": "in-process",
+            "workers": [],
+            "browser_endpoints": endpoints,
+            "admission": admission,
+            "browser_cache": browser_cache,
+            "asset_cache": asset_cache,
+            "login_sessions": login_sessions,
+        }
+    return {
+        "mode": "process-pool",
+        "workers": pool.status(),
+        "browser_endpoints": endpoints,
+        "admission": admission,
+        "browser_cache": browser_cache,
+        "asset_cache": asset_cache,
+        "login_sessions": login_sessions,
+        "prewarm": _PREWARM_REPORT,
+        "keep_warm": pool.keep_warm,
+        "memory_limits": asdict(pool.memory_limits) if pool.memory_limits is not None else None,
+    }
+
+
 def create_server() -> FastMCP:
     """Return the configured FastMCP server instance."""
 
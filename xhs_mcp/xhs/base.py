@@ -1,14 +1,39 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
+from typing import Callable
+
 from playwright.sync_api import Page
 
 
+ProgressCallback = Callable[[float | None, str], None]
+
+
+class ActionCancelled(RuntimeError):
+    """Raised inside an action when its caller asked it to stop."""
+
+
 @dataclass
 class ActionContext:
     """Lightweight wrapper carrying shared Playwright page and options."""
 
     page: Page
+    on_progress: ProgressCallback | None = None
+    cancel_event: threading.Event | None = None
+
+    def report(self, progress: float | None, phase: str) -> None:
+        """Report progress (0-100, or None when unknown) for the current phase."""
+        if self.on_progress is not None:
+            self.on_progress(progress, phase)
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise ActionCancelled("action cancelled")
 
 
 class PlaywrightAction:
@@ -20,4 +45,3 @@ class PlaywrightAction:
     @property
     def page(self) -> Page:
         return self.ctx.page
-
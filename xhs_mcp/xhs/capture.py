@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlparse
+
+from playwright.sync_api import Page
+
+from xhs_mcp.infra.codec import loads
+
+
+@dataclass(slots=True)
+class CapturedPage:
+    """One JSON API response the page fetched for itself, with its request query."""
+
+    query: dict[str, str]
+    data: dict[str, Any]
+
+
+class ApiResponseTap:
+    """Collects responses from one site API endpoint while the page drives pagination.
+
+    The web APIs need request signatures generated by the site's own scripts, so
+    instead of calling them directly the action scrolls/clicks and this tap picks up
+    the responses. Only response handles are queued in the event callback; bodies are
+    read when drained, outside Playwright's dispatcher, and dropped once consumed.
+    """
+
+    def __init__(self, page: Page, path_marker: str, *, max_pending: int = 32) -> None:
+        self.page = page
+        self.path_marker = path_marker
+        self._pending: deque = deque(maxlen=max_pending)
+        page.on("response", self._on_response)
+
+    def _on_response(self, response) -> None:
+        if self.path_marker in response.url and response.request.method == "GET":
+            self._pending.append(response)
+
+    def close(self) -> None:
+        self.page.remove_listener("response", self._on_response)
+
+    def __enter__(self) -> "ApiResponseTap":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def drain(self) -> list[CapturedPage]:
+        pages: list[CapturedPage] = []
+        while self._pending:
+            response = self._pending.popleft()
+            try:
+                body = loads(response.body())
+            except Exception:
+                continue
+            if not isinstance(body, dict) or body.get("success") is False:
+                continue
+            query = {k: v[0] for k, v in parse_qs(urlparse(response.url).query).items()}
+            pages.append(CapturedPage(query=query, data=body.get("data") or {}))
+        return pages
+
+    def wait(self, timeout_s: float, poll_ms: int = 250) -> list[CapturedPage]:
+        """Let the page run until at least one response arrives or the timeout passes."""
+        deadline = time.monotonic() + timeout_s
+        while not self._pending and time.monotonic() < deadline:
+            self.page.wait_for_timeout(poll_ms)
+        return self.drain()
+
+
+def encode_cursor(api_cursor: str, offset: int) -> str:
+    """Cursor handed back to callers: the site's page cursor plus how far into that page we got."""
+    return f"{api_cursor}~{offset}"
+
+
+def decode_cursor(cursor: str | None) -> tuple[str, int]:
+    if not cursor:
+        return "", 0
+    api_cursor, sep, offset = cursor.rpartition("~")
+    if not sep:
+        return cursor, 0
+    return api_cursor, int(offset or 0)
+
+
+@dataclass(slots=True)
+class Window:
+    items: list[dict[str, Any]]
+    cursor: str | None = None
+    has_more: bool = False
+    count: int = 0
+
+
+def collect_window(
+    first: list[CapturedPage],
+    more: Callable[[], list[CapturedPage]],
+    *,
+    items_field: str,
+    key: Callable[[dict[str, Any]], str],
+    limit: int,
+    cursor: str | None = None,
+    on_item: Callable[[dict[str, Any]], None] | None = None,
+    on_page: Callable[[int, int], None] | None = None,
+    keep: bool = True,
+) -> Window:
+    """Walk captured API pages from ``cursor`` until ``limit`` unique items are collected.
+
+    Pages before the resume cursor are read and dropped, so only the requested window
+    is ever held; with ``keep=False`` not even that, items only reach ``on_item``.
+    ``more`` drives the page to the next page (scroll, click) and returns whatever it
+    captured; an empty list means the feed ran dry.
+    """
+    resume_cursor, skip = decode_cursor(cursor)
+    reached = resume_cursor == ""
+    window = Window(items=[])
+    seen: set[str] = set()
+    pages_read = 0
+    captured = first
+    while captured:
+        for api_page in captured:
+            request_cursor = api_page.query.get("cursor", "")
+            if not reached:
+                if request_cursor != resume_cursor:
+                    continue
+                reached = True
+            start = skip if request_cursor == resume_cursor else 0
+            skip = 0
+            entries = api_page.data.get(items_field) or []
+            for index in range(start, len(entries)):
+                if window.count >= limit:
+                    window.cursor = encode_cursor(request_cursor, index)
+                    window.has_more = True
+                    return window
+                item = entries[index]
+                item_key = key(item)
+                if item_key in seen:
+                    continue
+                seen.add(item_key)
+                if on_item is not None:
+                    on_item(item)
+                if keep:
+                    window.items.append(item)
+                window.count += 1
+            pages_read += 1
+            window.has_more = bool(api_page.data.get("has_more"))
+            window.cursor = encode_cursor(str(api_page.data.get("cursor", "")), 0) if window.has_more else None
+            if on_page is not None:
+                on_page(pages_read, window.count)
+            if not window.has_more or window.count >= limit:
+                # Full on a page boundary: the cursor already points at the next page.
+                return window
+        captured = more()
+    if not reached:
+        raise ValueError(f"cursor {cursor!r} not reached; the listing may have changed")
+    return window
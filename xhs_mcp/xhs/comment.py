@@ -3,16 +3,17 @@ from __future__ import annotations
 from playwright.sync_api import Page
 
 from .base import PlaywrightAction
+from .navigate import note_url
 
 
 class CommentAction(PlaywrightAction):
-    def post_comment(self, feed_id: str, xsec_token: str, content: str) -> None:
+    def post_comment(self, feed_id: str, xsec_token: str, content: str, *, navigate: bool = True) -> None:
         page: Page = self.page
-        url = f"https://www.xiaohongshu.com/explore/{feed_id}?xsec_token={xsec_token}&xsec_source=pc_feed"
-        page.goto(url,wait_until="domcontentloaded")
+        if navigate:
+            page.goto(note_url(feed_id, xsec_token), wait_until="domcontentloaded")
 
-        print("进入目标页面")
-        page.wait_for_timeout(3_000)  # 停留 3 秒
+            print("进入目标页面")
+            page.wait_for_timeout(3_000)  # 停留 3 秒
 
         # page.wait_for_load_state("networkidle")
 
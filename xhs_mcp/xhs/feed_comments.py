@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List
+
+from playwright.sync_api import Page
+
+from .base import PlaywrightAction
+from .capture import ApiResponseTap, CapturedPage, collect_window
+from .navigate import NavigateAction
+
+
+_COMMENT_PAGE_API = "/api/sns/web/v2/comment/page"
+_SUB_COMMENT_API = "/api/sns/web/v2/comment/sub/page"
+MAX_COMMENTS_PER_CALL = 500
+
+_SCROLL_COMMENTS_JS = """
+() => {
+  const el = document.querySelector('.note-scroller') || document.scrollingElement;
+  el.scrollTop = el.scrollHeight;
+}
+"""
+
+_STATE_COMMENTS_JS = """
+(feedId) => {
+  const map = window.__INITIAL_STATE__?.note?.noteDetailMap;
+  const comments = (map && (map[feedId] ?? map._value?.[feedId]))?.comments;
+  if (!comments) return null;
+  return { comments: comments.list || [], cursor: comments.cursor || "", has_more: !!comments.hasMore };
+}
+"""
+
+
+@dataclass(slots=True)
+class CommentBatch:
+    comments: List[Dict[str, Any]] = field(default_factory=list)
+    cursor: str | None = None
+    has_more: bool = False
+    count: int = 0
+
+
+class FeedCommentsAction(PlaywrightAction):
+    """Page through a note's comment thread by scrolling and reading the comment API responses.
+
+    Only the requested window of comments is kept: pages before ``cursor`` are read and
+    dropped, and collection stops at ``limit`` with a cursor pointing at the next comment.
+    With a ``sink`` comments are handed over one by one instead of being returned, and
+    ``limit`` is not capped.
+
+    Resuming is not a true continuation: the signed comment API can only be driven by
+    the page, so each call reopens the note and scrolls through every page before
+    ``cursor`` again. A thread read in k calls therefore loads O(k²) pages in total;
+    prefer one call with a larger ``limit`` (or an export sink) for long threads.
+    """
+
+    def fetch(
+        self,
+        feed_id: str,
+        xsec_token: str,
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+        expand_replies: bool = False,
+        max_replies: int = 20,
+        idle_timeout: float = 8.0,
+        sink: Callable[[Dict[str, Any]], None] | None = None,
+    ) -> CommentBatch:
+        page: Page = self.page
+
+        def report_page(pages_read: int, total: int) -> None:
+            self.ctx.report(None, f"page {pages_read}: {total} comments")
+
+        def on_comment(comment: Dict[str, Any]) -> None:
+            self.ctx.raise_if_cancelled()
+            if expand_replies:
+                self._expand_replies(comment, sub_tap, max_replies, idle_timeout)
+            if sink is not None:
+                sink(comment)
+
+        def more() -> list[CapturedPage]:
+            self.ctx.raise_if_cancelled()
+            page.evaluate(_SCROLL_COMMENTS_JS)
+            return tap.wait(idle_timeout)
+
+        with ApiResponseTap(page, _COMMENT_PAGE_API) as tap, ApiResponseTap(page, _SUB_COMMENT_API) as sub_tap:
+            NavigateAction(self.ctx).to_note_page(feed_id, xsec_token)
+            first = tap.wait(idle_timeout)
+            if not first:
+                # First page server-rendered (no API response). Seed from it even when
+                # resuming: it carries the cursor of the page the next scroll fetches.
+                state = page.evaluate(_STATE_COMMENTS_JS, feed_id)
+                if state:
+                    first = [CapturedPage(query={"cursor": ""}, data=state)]
+            if not first:
+                first = more()
+            window = collect_window(
+                first,
+                more,
+                items_field="comments",
+                key=lambda c: str(c.get("id", "")),
+                limit=max(1, limit if sink is not None else min(limit, MAX_COMMENTS_PER_CALL)),
+                cursor=cursor,
+                on_item=on_comment,
+                on_page=report_page,
+                keep=sink is None,
+            )
+        return CommentBatch(comments=window.items, cursor=window.cursor, has_more=window.has_more, count=window.count)
+
+    def _expand_replies(self, comment: Dict[str, Any], sub_tap: ApiResponseTap, max_replies: int, idle_timeout: float) -> None:
+        replies: List[Dict[str, Any]] = list(comment.get("sub_comments") or [])
+        if not comment.get("sub_comment_has_more") or len(replies) >= max_replies:
+            comment["sub_comments"] = replies[:max_replies]
+            return
+
+        comment_id = str(comment.get("id", ""))
+        reply_ids = {str(r.get("id", "")) for r in replies}
+        button = self.page.locator(f"#comment-{comment_id} .show-more").first
+        has_more = True
+        while has_more and len(replies) < max_replies:
+            self.ctx.raise_if_cancelled()
+            try:
+                button.scroll_into_view_if_needed(timeout=3_000)
+                button.click(timeout=3_000)
+            except Exception:
+                break
+            pages = [p for p in sub_tap.wait(idle_timeout) if p.query.get("root_comment_id") == comment_id]
+            if not pages:
+                break
+            for sub_page in pages:
+                for reply in sub_page.data.get("comments") or []:
+                    reply_id = str(reply.get("id", ""))
+                    if reply_id not in reply_ids:
+                        reply_ids.add(reply_id)
+                        replies.append(reply)
+                has_more = bool(sub_page.data.get("has_more"))
+                comment["sub_comment_cursor"] = sub_page.data.get("cursor", "")
+        comment["sub_comments"] = replies[:max_replies]
+        comment["sub_comment_has_more"] = has_more
+
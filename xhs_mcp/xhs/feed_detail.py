@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from typing import Any, Dict
 
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 
+from xhs_mcp.infra.codec import evaluate_json
+
 from .base import ActionContext, PlaywrightAction
 
 
@@ -25,7 +26,8 @@ class FeedDetailAction(PlaywrightAction):
         except PlaywrightTimeoutError:
             pass
 
-        payload = page.evaluate(
+        note_detail_map = evaluate_json(
+            page,
             """
             () => {
               const state = window.__INITIAL_STATE__;
@@ -34,10 +36,8 @@ class FeedDetailAction(PlaywrightAction):
             }
             """
         )
-        if not payload:
+        if note_detail_map is None:
             raise ValueError("no noteDetailMap found in __INITIAL_STATE__")
-
-        note_detail_map = json.loads(payload)
         detail = note_detail_map.get(feed_id)
         if not detail:
             raise ValueError(f"feed {feed_id} not found in noteDetailMap")
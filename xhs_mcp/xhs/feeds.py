@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List
@@ -8,6 +7,8 @@ from urllib.parse import urlencode
 
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 
+from xhs_mcp.infra.codec import evaluate_json
+
 from .base import ActionContext, PlaywrightAction
 
 
@@ -33,7 +34,8 @@ class FeedsListAction(PlaywrightAction):
         debug_dir = Path("debug")
         debug_dir.mkdir(parents=True, exist_ok=True)
         page.screenshot(path=str(debug_dir / "feeds_after_wait.png"), full_page=True)
-        payload = page.evaluate(
+        data = evaluate_json(
+            page,
             """
             () => {
               const state = window.__INITIAL_STATE__;
@@ -44,9 +46,8 @@ class FeedsListAction(PlaywrightAction):
             }
             """
         )
-        if not payload:
+        if data is None:
             raise ValueError("no feeds found in __INITIAL_STATE__")
-        data = json.loads(payload)
         return [Feed(raw=item) for item in data]
 
 
@@ -60,7 +61,8 @@ class SearchAction(PlaywrightAction):
         except PlaywrightTimeoutError:
             pass
 
-        payload = page.evaluate(
+        data = evaluate_json(
+            page,
             """
             () => {
               const state = window.__INITIAL_STATE__;
@@ -71,7 +73,6 @@ class SearchAction(PlaywrightAction):
             }
             """
         )
-        if not payload:
+        if data is None:
             raise ValueError("no search feeds found in __INITIAL_STATE__")
-        data = json.loads(payload)
         return [Feed(raw=item) for item in data]
@@ -1,109 +1,159 @@
 from __future__ import annotations
 
-import json
-
-from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
-
-from .base import PlaywrightAction
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from .base import ActionContext, PlaywrightAction
+from .navigate import NavigateAction
+
+
+_LIKE_BUTTON = ".interact-container .left .like-lottie"
+_COLLECT_BUTTON = ".interact-container .left .reds-icon.collect-icon"
+
+# Endpoints the note page calls when the buttons are clicked, keyed by (field, target).
+_TOGGLE_APIS = {
+    ("liked", True): "/api/sns/web/v1/note/like",
+    ("liked", False): "/api/sns/web/v1/note/dislike",
+    ("collected", True): "/api/sns/web/v1/note/collect",
+    ("collected", False): "/api/sns/web/v1/note/uncollect",
+}
+
+# Reads just the interactInfo of one note instead of serializing the whole noteDetailMap.
+_INTERACT_STATE_JS = """
+(feedId) => {
+  const map = window.__INITIAL_STATE__?.note?.noteDetailMap;
+  const detail = map && (map[feedId] ?? map._value?.[feedId]);
+  const info = detail?.note?.interactInfo;
+  if (!info) return null;
+  return { liked: !!info.liked, collected: !!info.collected };
+}
+"""
+
+_STATE_MATCHES_JS = f"""
+([feedId, field, target]) => {{
+  const read = {_INTERACT_STATE_JS};
+  const state = read(feedId);
+  return !!state && state[field] === target;
+}}
+"""
+
+
+@dataclass
+class InteractResult:
+    """Outcome of a like/favorite toggle.
+
+    ``confirmed_by`` is ``"unchanged"`` when the note was already in the target state,
+    ``"api"`` when the site's like/collect endpoint acknowledged the click and
+    ``"state"`` when only the page state was seen to flip.
+    """
+
+    feed_id: str
+    field: str
+    state: bool
+    changed: bool
+    confirmed_by: str
+    latency_ms: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
 
 
 def _load_interact_state(page: Page, feed_id: str) -> tuple[bool, bool]:
-    payload = page.evaluate(
-        """
-        () => {
-          const state = window.__INITIAL_STATE__;
-          if (!state || !state.note || !state.note.noteDetailMap) return "";
-          return JSON.stringify(state.note.noteDetailMap);
-        }
-        """
-    )
-    if not payload:
-        raise ValueError("no noteDetailMap in __INITIAL_STATE__")
-    note_detail = json.loads(payload)
-    detail = note_detail.get(feed_id) or {}
-    interact = detail.get("note", {}).get("interactInfo", {})
-    return bool(interact.get("liked")), bool(interact.get("collected"))
+    state = page.evaluate(_INTERACT_STATE_JS, feed_id)
+    if not state:
+        raise ValueError(f"no interactInfo for {feed_id} in __INITIAL_STATE__")
+    return bool(state["liked"]), bool(state["collected"])
+
+
+def _api_acknowledged(response) -> bool:
+    if response.status >= 400:
+        return False
+    try:
+        body = response.json()
+    except Exception:
+        return True
+    return not isinstance(body, dict) or body.get("success", True) is not False
+
+
+def _toggle_interaction(
+    page: Page,
+    feed_id: str,
+    *,
+    field: str,
+    target: bool,
+    selector: str,
+    timeout_ms: float = 8_000,
+) -> InteractResult:
+    started = time.perf_counter()
+
+    def result(state: bool, changed: bool, confirmed_by: str) -> InteractResult:
+        latency = round((time.perf_counter() - started) * 1000, 1)
+        return InteractResult(feed_id, field, state, changed, confirmed_by, latency)
+
+    try:
+        liked, collected = _load_interact_state(page, feed_id)
+        current: bool | None = liked if field == "liked" else collected
+    except Exception:
+        current = None
+    if current == target:
+        return result(target, False, "unchanged")
+
+    api_path = _TOGGLE_APIS[(field, target)]
+    button = page.locator(selector).first
+    try:
+        with page.expect_response(
+            lambda r: api_path in r.url and r.request.method == "POST", timeout=timeout_ms
+        ) as response_info:
+            button.click()
+        response = response_info.value
+    except PlaywrightTimeoutError:
+        response = None
+
+    if response is not None:
+        if not _api_acknowledged(response):
+            raise RuntimeError(f"{api_path} rejected the request (HTTP {response.status})")
+        return result(target, True, "api")
+
+    # No API call observed (endpoint renamed or served from another path):
+    # fall back to watching the note's own interactInfo flip.
+    try:
+        page.wait_for_function(_STATE_MATCHES_JS, arg=[feed_id, field, target], timeout=timeout_ms / 2)
+    except PlaywrightTimeoutError as exc:
+        raise RuntimeError(f"{field} state for {feed_id} did not change to {target}") from exc
+    return result(target, True, "state")
 
 
 class LikeAction(PlaywrightAction):
-    def like(self, feed_id: str, xsec_token: str) -> None:
-        self._toggle(feed_id, xsec_token, target=True)
+    """Like/unlike a note; pass navigate=False when the note page is already open."""
 
-    def unlike(self, feed_id: str, xsec_token: str) -> None:
-        self._toggle(feed_id, xsec_token, target=False)
+    def like(self, feed_id: str, xsec_token: str, *, navigate: bool = True) -> InteractResult:
+        return self._toggle(feed_id, xsec_token, target=True, navigate=navigate)
 
-    def _toggle(self, feed_id: str, xsec_token: str, target: bool) -> None:
+    def unlike(self, feed_id: str, xsec_token: str, *, navigate: bool = True) -> InteractResult:
+        return self._toggle(feed_id, xsec_token, target=False, navigate=navigate)
+
+    def _toggle(self, feed_id: str, xsec_token: str, target: bool, navigate: bool = True) -> InteractResult:
         page: Page = self.page
-        url = f"https://www.xiaohongshu.com/explore/{feed_id}?xsec_token={xsec_token}&xsec_source=pc_feed"
-        page.goto(url, wait_until="domcontentloaded")
-        try:
-            page.wait_for_load_state("networkidle", timeout=3_000)
-        except PlaywrightTimeoutError:
-            pass
-
-        try:
-            liked, _ = _load_interact_state(page, feed_id)
-        except Exception:
-            liked = None
-
-        if liked is not None:
-            if target and liked:
-                return
-            if not target and not liked:
-                return
-
-        button = page.locator(".interact-container .left .like-lottie").first
-        button.click()
-        page.wait_for_timeout(2_000)
-
-        try:
-            liked_after, _ = _load_interact_state(page, feed_id)
-            if liked_after == target:
-                return
-        except Exception:
-            pass
-
-        button.click()
-        page.wait_for_timeout(1_000)
+        if navigate:
+            NavigateAction(ActionContext(page)).to_note_page(feed_id, xsec_token)
+        return _toggle_interaction(page, feed_id, field="liked", target=target, selector=_LIKE_BUTTON)
 
 
 class FavoriteAction(PlaywrightAction):
-    def favorite(self, feed_id: str, xsec_token: str) -> None:
-        self._toggle(feed_id, xsec_token, target=True)
+    """Collect/uncollect a note; pass navigate=False when the note page is already open."""
+
+    def favorite(self, feed_id: str, xsec_token: str, *, navigate: bool = True) -> InteractResult:
+        return self._toggle(feed_id, xsec_token, target=True, navigate=navigate)
 
-    def unfavorite(self, feed_id: str, xsec_token: str) -> None:
-        self._toggle(feed_id, xsec_token, target=False)
+    def unfavorite(self, feed_id: str, xsec_token: str, *, navigate: bool = True) -> InteractResult:
+        return self._toggle(feed_id, xsec_token, target=False, navigate=navigate)
 
-    def _toggle(self, feed_id: str, xsec_token: str, target: bool) -> None:
+    def _toggle(self, feed_id: str, xsec_token: str, target: bool, navigate: bool = True) -> InteractResult:
         page: Page = self.page
-        url = f"https://www.xiaohongshu.com/explore/{feed_id}?xsec_token={xsec_token}&xsec_source=pc_feed"
-        page.goto(url, wait_until="domcontentloaded")
-        try:
-            page.wait_for_load_state("networkidle", timeout=3_000)
-        except PlaywrightTimeoutError:
-            pass
-
-        try:
-            _, collected = _load_interact_state(page, feed_id)
-        except Exception:
-            collected = None
-
-        if collected is not None:
-            if target and collected:
-                return
-            if not target and not collected:
-                return
-
-        button = page.locator(".interact-container .left .reds-icon.collect-icon").first
-        button.click()
-        page.wait_for_timeout(2_000)
-
-        try:
-            _, collected_after = _load_interact_state(page, feed_id)
-            if collected_after == target:
-                return
-        except Exception:
-            pass
-
-        button.click()
-        page.wait_for_timeout(1_000)
+        if navigate:
+            NavigateAction(ActionContext(page)).to_note_page(feed_id, xsec_token)
+        return _toggle_interaction(page, feed_id, field="collected", target=target, selector=_COLLECT_BUTTON)
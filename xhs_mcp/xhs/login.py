@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import time
-from typing import Tuple
+from typing import TYPE_CHECKING, Callable, Tuple
 
-from playwright.sync_api import Page
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
 
 
 EXPLORE_URL = "https://www.xiaohongshu.com/explore"
 LOGIN_QR_SELECTOR = ".login-container .qrcode-img"
 LOGGED_IN_SELECTOR = ".main-container .user .link-wrapper .channel"
+# Matches once either the user is logged in or the QR image has a src to hand out.
+_QR_OR_LOGGED_IN = f"{LOGGED_IN_SELECTOR}, {LOGIN_QR_SELECTOR}[src]:not([src=''])"
+# Replaced by a new value when a QR scan is confirmed, even before the page re-renders.
+SESSION_COOKIE = "web_session"
 
 
 def check_login_status(page: Page, *, wait_load: bool = True) -> bool:
@@ -39,54 +44,49 @@ def fetch_qrcode_image(
     - If already logged in: (None, True)
     - If QR found: (src, False)
     - If timed out: (None, False)
+
+    Waits on the page for either element instead of polling; the page is reloaded when
+    neither shows up within ``reload_interval`` seconds. ``poll_interval`` is accepted
+    for compatibility and no longer used.
     """
 
     # Navigate and use DOMContentLoaded for faster readiness
     page.goto(EXPLORE_URL, wait_until="domcontentloaded")
-    deadline = time.time() + max(0, timeout_seconds)
-    last_reload = time.time()
-
-    while time.time() < deadline:
-        # 1) Check login state first
-        try:
-            if page.query_selector(LOGGED_IN_SELECTOR):
-                if verbose:
-                    print("[fetch_qrcode_image] Detected logged-in status.")
-                return None, True
-        except Exception:
-            # ignore intermittent failures
-            pass
+    deadline = time.monotonic() + max(0, timeout_seconds)
 
-        # 2) Try to locate QR image element
+    while (remaining := deadline - time.monotonic()) > 0:
         try:
-            el = page.query_selector(LOGIN_QR_SELECTOR)
-            if el:
-                src = el.get_attribute("src")
-                if src:
-                    if verbose:
-                        print("[fetch_qrcode_image] QR src fetched.")
-                    return src, False
-        except Exception:
-            # swallow and retry
-            pass
-
-        # 3) Prefer waiting for network idle briefly; fallback to sleep
-        try:
-            page.wait_for_load_state("networkidle", timeout=int(max(1, poll_interval * 1000)))
+            page.wait_for_selector(
+                _QR_OR_LOGGED_IN,
+                state="attached",
+                timeout=min(remaining, max(1.0, reload_interval)) * 1000,
+            )
         except Exception:
-            time.sleep(poll_interval)
-
-        # 4) Periodically reload to recover from dynamic modal/DOM issues
-        now = time.time()
-        if now - last_reload >= max(1.0, reload_interval):
-            last_reload = now
+            if time.monotonic() >= deadline:
+                break
+            # Neither appeared: reload to recover from dynamic modal/DOM issues
             try:
                 if verbose:
                     print("[fetch_qrcode_image] Reloading page to recover...")
                 page.reload(wait_until="domcontentloaded")
             except Exception:
-                # ignore reload failures
                 pass
+            continue
+
+        try:
+            if page.query_selector(LOGGED_IN_SELECTOR):
+                if verbose:
+                    print("[fetch_qrcode_image] Detected logged-in status.")
+                return None, True
+            el = page.query_selector(LOGIN_QR_SELECTOR)
+            src = el.get_attribute("src") if el else None
+        except Exception:
+            # the DOM changed under us (navigation); wait again
+            continue
+        if src:
+            if verbose:
+                print("[fetch_qrcode_image] QR src fetched.")
+            return src, False
 
     # Timed out without login or QR src
     if verbose:
@@ -94,6 +94,14 @@ def fetch_qrcode_image(
     return None, False
 
 
+def _session_cookie(page: Page) -> str | None:
+    try:
+        cookies = page.context.cookies()
+    except Exception:
+        return None
+    return next((c["value"] for c in cookies if c.get("name") == SESSION_COOKIE), None)
+
+
 def wait_for_login(
     page: Page,
     *,
@@ -101,26 +109,40 @@ def wait_for_login(
     deadline: float | None = None,
     poll_interval: float = 0.5,
     verbose: bool = False,
+    should_stop: Callable[[], bool] | None = None,
 ) -> bool:
     """Wait until logged-in selector appears.
 
     Accepts either timeout_seconds or an absolute deadline (epoch seconds).
+    Returns False early once ``should_stop`` reports True.
+
+    The page is watched for the logged-in element in slices of ``poll_interval``
+    seconds (at least 1s); between slices ``should_stop`` is checked and, if the
+    session cookie changed (scan confirmed) without the page updating, it is reloaded.
     """
     if deadline is None:
         deadline = time.time() + (timeout_seconds or 0)
-    while time.time() < deadline:
+    last_cookie = _session_cookie(page)
+    slice_ms = max(1.0, poll_interval) * 1000
+    while (remaining := deadline - time.time()) > 0:
+        if should_stop is not None and should_stop():
+            return False
         try:
-            if page.query_selector(LOGGED_IN_SELECTOR):
-                if verbose:
-                    print("[wait_for_login] Logged in detected.")
-                return True
+            page.wait_for_selector(LOGGED_IN_SELECTOR, state="attached", timeout=min(remaining * 1000, slice_ms))
+            if verbose:
+                print("[wait_for_login] Logged in detected.")
+            return True
         except Exception:
             pass
-        # brief attempt to reach network idle to speed up DOM settling
-        try:
-            page.wait_for_load_state("networkidle", timeout=int(max(1, poll_interval * 1000)))
-        except Exception:
-            time.sleep(poll_interval)
+        cookie = _session_cookie(page)
+        if cookie and cookie != last_cookie:
+            last_cookie = cookie
+            if verbose:
+                print("[wait_for_login] Session cookie changed; reloading.")
+            try:
+                page.reload(wait_until="domcontentloaded")
+            except Exception:
+                pass
     if verbose:
         print("[wait_for_login] Timeout waiting for login.")
     return False
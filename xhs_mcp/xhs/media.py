@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+IMAGE = "image"
+VIDEO = "video"
+
+# Codec preference when two streams have the same resolution and bitrate: h264 plays
+# everywhere, the others are smaller but not universally decodable.
+_CODECS = ("h264", "h265", "av1", "h266")
+_IMAGE_SCENES = ("WB_DFT", "CRD_WM_WEBP", "WB_PRV")
+
+
+@dataclass(slots=True)
+class MediaItem:
+    note_id: str
+    kind: str
+    index: int
+    url: str
+    # Alternative URLs for the same file (CDN backups), tried in order when ``url`` fails.
+    fallbacks: list[str] = field(default_factory=list)
+    width: int | None = None
+    height: int | None = None
+
+    @property
+    def urls(self) -> list[str]:
+        return [self.url, *self.fallbacks]
+
+
+def _https(url: str) -> str:
+    return f"https:{url}" if url.startswith("//") else url
+
+
+def _best_image_url(image: dict[str, Any]) -> tuple[str | None, list[str]]:
+    by_scene = {
+        info.get("imageScene"): info.get("url")
+        for info in image.get("infoList") or []
+        if isinstance(info, dict) and info.get("url")
+    }
+    candidates = [by_scene.get(scene) for scene in _IMAGE_SCENES]
+    candidates += [image.get("urlDefault"), image.get("url"), image.get("urlPre")]
+    urls = list(dict.fromkeys(_https(url) for url in candidates if url))
+    if not urls:
+        return None, []
+    return urls[0], urls[1:]
+
+
+def _best_stream(streams: dict[str, Any]) -> dict[str, Any] | None:
+    best = None
+    best_rank = None
+    for codec_index, codec in enumerate(_CODECS):
+        for stream in streams.get(codec) or []:
+            if not isinstance(stream, dict) or not stream.get("masterUrl"):
+                continue
+            rank = (
+                (stream.get("width") or 0) * (stream.get("height") or 0),
+                stream.get("avgBitrate") or stream.get("videoBitrate") or 0,
+                -codec_index,
+            )
+            if best_rank is None or rank > best_rank:
+                best, best_rank = stream, rank
+    return best
+
+
+def resolve_media(note: dict[str, Any], *, images: bool = True, videos: bool = True) -> list[MediaItem]:
+    """Best-quality image and video URLs of a note detail (``feed_detail``'s ``note``).
+
+    Images prefer the full-size scene of ``infoList`` over the preview; videos pick the
+    highest-resolution, highest-bitrate stream across codecs, with its backup URLs as
+    fallbacks. Live-photo clips attached to images are returned as videos.
+    """
+    note_id = str(note.get("noteId") or note.get("id") or "")
+    items: list[MediaItem] = []
+    for index, image in enumerate(note.get("imageList") or []):
+        if not isinstance(image, dict):
+            continue
+        if images:
+            url, fallbacks = _best_image_url(image)
+            if url:
+                items.append(
+                    MediaItem(note_id, IMAGE, index, url, fallbacks, image.get("width"), image.get("height"))
+                )
+        if videos and image.get("livePhoto"):
+            stream = _best_stream(image.get("stream") or {})
+            if stream:
+                items.append(_video_item(note_id, index, stream))
+    if videos:
+        media = ((note.get("video") or {}).get("media") or {}).get("stream") or {}
+        stream = _best_stream(media)
+        if stream:
+            items.append(_video_item(note_id, len(items), stream))
+    return items
+
+
+def _video_item(note_id: str, index: int, stream: dict[str, Any]) -> MediaItem:
+    backups = [_https(url) for url in stream.get("backupUrls") or [] if url]
+    return MediaItem(
+        note_id,
+        VIDEO,
+        index,
+        _https(stream["masterUrl"]),
+        backups,
+        stream.get("width"),
+        stream.get("height"),
+    )
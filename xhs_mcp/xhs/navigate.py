@@ -5,7 +5,19 @@ from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 from .base import PlaywrightAction
 
 
+def note_url(feed_id: str, xsec_token: str) -> str:
+    return f"https://www.xiaohongshu.com/explore/{feed_id}?xsec_token={xsec_token}&xsec_source=pc_feed"
+
+
 class NavigateAction(PlaywrightAction):
+    def to_note_page(self, feed_id: str, xsec_token: str, *, settle_ms: int = 3_000) -> None:
+        page: Page = self.page
+        page.goto(note_url(feed_id, xsec_token), wait_until="domcontentloaded")
+        try:
+            page.wait_for_load_state("networkidle", timeout=settle_ms)
+        except PlaywrightTimeoutError:
+            pass
+
     def to_explore_page(self) -> None:
         page: Page = self.page
         page.goto("https://www.xiaohongshu.com/explore", wait_until="load")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -12,6 +13,51 @@ from .base import ActionContext, PlaywrightAction
 
 PUBLISH_URL = "https://creator.xiaohongshu.com/publish/publish?source=official"
 
+# Chunked video uploads go to the ROS upload hosts / creator media API.
+# Chunk PUT/POSTs hit the ROS hosts; the creator API hands out the upload permit first.
+_UPLOAD_CHUNK_URL = re.compile(r"^https://ros-upload[\w.-]*\.(?:xiaohongshu|xhscdn)\.com/")
+_UPLOAD_PERMIT_URL = re.compile(r"^https://creator\.xiaohongshu\.com/api/media/v\d+/upload/")
+_UPLOAD_FAILURE_TEXTS = ("上传失败", "上传异常", "格式不支持", "不支持该格式", "文件过大")
+# Shown after the bytes are in while the platform transcodes; can outlast the stall timeout.
+_UPLOAD_PROCESSING_TEXTS = ("处理中", "转码中", "检测中", "上传成功")
+# Synthetic paste: the editor's own paste handler inserts the text in one go and
+# returns true when it took over (preventDefault).
+_PASTE_JS = """
+(el, text) => {
+  el.focus();
+  const selection = window.getSelection();
+  selection.selectAllChildren(el);
+  selection.collapseToEnd();
+  const data = new DataTransfer();
+  data.setData('text/plain', text);
+  const event = new ClipboardEvent('paste', { clipboardData: data, bubbles: true, cancelable: true });
+  return !el.dispatchEvent(event);
+}
+"""
+_TOPIC_SUGGESTION_SELECTOR = "#creator-editor-topic-container .item, .publish-topic-container .item"
+_TOPIC_NODE_SELECTOR = "a.tiptap-topic, .mention, [data-topic]"
+# Suggestion rows read "#topic" followed by a view count on its own line.
+_TOPIC_NAME_JS = """
+(items) => items.map((el) => {
+  const name = el.querySelector('.name, .title') || el;
+  return (name.innerText || '').split('\\n')[0].trim();
+})
+"""
+
+_UPLOAD_STATE_JS = """
+([failTexts, processingTexts]) => {
+  const nodes = document.querySelectorAll('[class*="upload"], [class*="progress"]');
+  let text = '';
+  nodes.forEach((node) => { text += ' ' + (node.innerText || ''); });
+  const failure = failTexts.find((t) => text.includes(t)) || null;
+  const processing = processingTexts.find((t) => text.includes(t)) || null;
+  const match = text.match(/(\\d{1,3}(?:\\.\\d+)?)\\s*%/);
+  // Digits stripped so percent ticks don't count; any other text change is a new phase.
+  const phase = text.replace(/[\\d.%\\s]+/g, ' ').trim().slice(0, 200);
+  return { percent: match ? parseFloat(match[1]) : null, failure, processing, phase };
+}
+"""
+
 
 @dataclass(slots=True)
 class PublishImageContent:
@@ -35,6 +81,13 @@ class _PublishBase(PlaywrightAction):
         page.goto(PUBLISH_URL, wait_until="domcontentloaded")
         page.wait_for_load_state("networkidle", timeout=30_000)
 
+    def _ensure_publish_page(self) -> None:
+        """Reuse an already-loaded publish page (batch sessions); navigate only when needed."""
+        page = self.page
+        if page.url.startswith(PUBLISH_URL.split("?", 1)[0]) and page.locator("div.upload-content").count() > 0:
+            return
+        self._goto_publish()
+
     def _remove_popover(self) -> None:
         page = self.page
         popover = page.locator("div.d-popover")
@@ -122,6 +175,53 @@ class _PublishBase(PlaywrightAction):
         fallback.wait_for(timeout=5_000)
         return fallback
 
+    def _insert_body(self, page: Page, editor: Locator, content: str) -> None:
+        """Put the whole body in with a paste event, falling back to one insertText per line."""
+        expected = len("".join(content.split()))
+        if editor.evaluate(_PASTE_JS, content):
+            try:
+                page.wait_for_function(
+                    "([el, n]) => el.innerText.replace(/\\s/g, '').length >= n",
+                    arg=[editor.element_handle(), expected],
+                    timeout=2_000,
+                )
+                return
+            except PlaywrightTimeoutError:
+                editor.fill("")
+
+        for index, line in enumerate(content.split("\n")):
+            if index:
+                page.keyboard.press("Enter")
+            if line:
+                page.keyboard.insert_text(line)
+
+    def _insert_tag(self, page: Page, editor: Locator, tag: str) -> None:
+        """Type a tag key by key so the topic popup opens, then pick the exact suggestion."""
+        topics = editor.locator(_TOPIC_NODE_SELECTOR)
+        before = topics.count()
+        page.keyboard.type("#" + tag)
+
+        suggestions = page.locator(_TOPIC_SUGGESTION_SELECTOR)
+        try:
+            suggestions.first.wait_for(state="visible", timeout=3_000)
+        except PlaywrightTimeoutError:
+            # No topic match: keep it as plain text.
+            page.keyboard.insert_text(" ")
+            return
+
+        names = [name.lstrip("#") for name in suggestions.evaluate_all(_TOPIC_NAME_JS)]
+        wanted = tag.strip().lstrip("#")
+        if wanted not in names:
+            # Only near matches (e.g. a longer, more popular topic): keep it as plain text.
+            page.keyboard.insert_text(" ")
+            return
+
+        suggestions.nth(names.index(wanted)).click()
+        try:
+            topics.nth(before).wait_for(state="attached", timeout=3_000)
+        except PlaywrightTimeoutError:
+            page.keyboard.insert_text(" ")
+
     def _fill_text_and_tags(self, page: Page, title: str, content: str, tags: Iterable[str]) -> None:
         page.locator("div.d-input input").first.fill(title)
 
@@ -129,20 +229,19 @@ class _PublishBase(PlaywrightAction):
         editor.click()
         editor.fill("")
         if content:
-            editor.type(content)
+            self._insert_body(page, editor, content)
 
         normalized = [tag.lstrip("#") for tag in tags][:10]
         for tag in normalized:
             if not tag:
                 continue
-            editor.type("#" + tag + " ")
-            time.sleep(0.2)
+            self._insert_tag(page, editor, tag)
 
 
 class PublishImageAction(_PublishBase):
     def __init__(self, ctx: ActionContext) -> None:
         super().__init__(ctx)
-        self._goto_publish()
+        self._ensure_publish_page()
         self._select_tab("上传图文")
 
     def publish(self, payload: PublishImageContent) -> None:
@@ -164,13 +263,100 @@ class PublishImageAction(_PublishBase):
         page.wait_for_timeout(3_000)
 
 
+class _UploadWatcher:
+    """Follows chunk uploads on the network so stalls and rejections surface early."""
+
+    def __init__(self, page: Page) -> None:
+        self.page = page
+        self.last_activity = time.time()
+        self.chunks = 0
+        self.rejection: str | None = None
+        self.last_failure: str | None = None
+        page.on("response", self._on_response)
+        page.on("requestfailed", self._on_request_failed)
+
+    @staticmethod
+    def _is_upload(method: str, url: str) -> bool:
+        if _UPLOAD_PERMIT_URL.match(url):
+            return True
+        return method in ("PUT", "POST") and bool(_UPLOAD_CHUNK_URL.match(url))
+
+    def _on_response(self, response) -> None:
+        request = response.request
+        if not self._is_upload(request.method, response.url):
+            return
+        self.last_activity = time.time()
+        if 400 <= response.status < 500:
+            self.rejection = f"upload request rejected with HTTP {response.status}"
+        elif response.status < 400 and _UPLOAD_CHUNK_URL.match(response.url):
+            self.chunks += 1
+        # 5xx: the page retries the chunk itself; a lasting outage shows up as a stall.
+
+    def _on_request_failed(self, request) -> None:
+        # Resets and aborts are retried by the page like 5xx; if the retries never
+        # get through, the stall timer reports it. Not counted as activity.
+        if self._is_upload(request.method, request.url):
+            self.last_failure = str(request.failure)
+
+    def close(self) -> None:
+        self.page.remove_listener("response", self._on_response)
+        self.page.remove_listener("requestfailed", self._on_request_failed)
+
+
 class PublishVideoAction(_PublishBase):
     def __init__(self, ctx: ActionContext) -> None:
         super().__init__(ctx)
-        self._goto_publish()
+        self._ensure_publish_page()
         self._select_tab("上传视频")
 
-    def publish(self, payload: PublishVideoContent) -> None:
+    def _wait_upload(self, publish_btn: Locator, watcher: _UploadWatcher, stall_timeout: float) -> None:
+        """Wait until the publish button enables, failing fast on rejection or stalled progress."""
+        page = self.page
+        deadline = time.time() + 600
+        last_percent: float | None = None
+        last_phase: str | None = None
+        self.ctx.report(0.0, "uploading")
+        while True:
+            self.ctx.raise_if_cancelled()
+            if publish_btn.first.is_visible():
+                self.ctx.report(100.0, "uploaded")
+                return
+
+            state = page.evaluate(_UPLOAD_STATE_JS, [list(_UPLOAD_FAILURE_TEXTS), list(_UPLOAD_PROCESSING_TEXTS)]) or {}
+            if state.get("failure"):
+                raise RuntimeError(f"video upload rejected by creator page: {state['failure']}")
+            if watcher.rejection:
+                raise RuntimeError(f"video upload rejected: {watcher.rejection}")
+
+            percent = state.get("percent")
+            if percent is not None and percent != last_percent:
+                last_percent = percent
+                watcher.last_activity = time.time()
+                self.ctx.report(min(float(percent), 99.0), "uploading")
+            phase = state.get("phase")
+            if phase != last_phase:
+                last_phase = phase
+                watcher.last_activity = time.time()
+            if state.get("processing"):
+                # Server-side processing after the upload: no network or percent activity,
+                # but not stalled either; the overall deadline still bounds it.
+                watcher.last_activity = time.time()
+                self.ctx.report(99.0, "processing")
+
+            now = time.time()
+            if now - watcher.last_activity > stall_timeout:
+                at = f"{last_percent:.0f}%" if last_percent is not None else "unknown progress"
+                failure = f", last request failure: {watcher.last_failure}" if watcher.last_failure else ""
+                raise RuntimeError(
+                    f"video upload stalled: no progress for {stall_timeout:.0f}s at {at} "
+                    f"({watcher.chunks} chunks acknowledged{failure})"
+                )
+            if now >= deadline:
+                raise TimeoutError("video upload did not finish within 600s")
+            # Pumps Playwright events so the network watcher stays current.
+            page.wait_for_timeout(1_000)
+
+    def publish(self, payload: PublishVideoContent, *, stall_timeout: float = 90.0) -> None:
         page = self.page
         video_path = Path(payload.video_path).expanduser()
         if not video_path.is_file():
@@ -179,11 +365,18 @@ class PublishVideoAction(_PublishBase):
         file_input = page.locator(".upload-input input[type='file']")
         if file_input.count() == 0:
             file_input = page.locator("input[type='file']")
-        file_input.first.set_input_files(str(video_path))
 
         publish_btn = page.locator("button.publishBtn:not([disabled])")
-        publish_btn.first.wait_for(state="visible", timeout=600_000)
+        watcher = _UploadWatcher(page)
+        try:
+            file_input.first.set_input_files(str(video_path))
+            self._wait_upload(publish_btn, watcher, stall_timeout)
+        finally:
+            watcher.close()
 
+        self.ctx.report(None, "filling")
         self._fill_text_and_tags(page, payload.title, payload.content, payload.tags)
+        self.ctx.raise_if_cancelled()
+        self.ctx.report(None, "submitting")
         publish_btn.first.click()
         page.wait_for_timeout(3_000)
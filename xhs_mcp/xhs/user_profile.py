@@ -1,12 +1,43 @@
 from __future__ import annotations
 
-import json
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 
+from xhs_mcp.infra.codec import evaluate_json
+
 from .base import ActionContext, PlaywrightAction
+from .capture import ApiResponseTap, CapturedPage, collect_window
+
+
+_USER_POSTED_API = "/api/sns/web/v1/user_posted"
+MAX_NOTES_PER_CALL = 500
+DEFAULT_PAGED_NOTES = 100
+
+# First page of the "笔记" tab as rendered, with the query state the site will continue from.
+_POSTED_FIRST_PAGE_JS = """
+() => {
+  const unwrap = (t) => (t && t.value !== undefined ? t.value : t && t._value);
+  const user = window.__INITIAL_STATE__?.user;
+  const notes = unwrap(user?.notes) || [];
+  const query = (unwrap(user?.noteQueries) || [])[0] || {};
+  return { notes: JSON.parse(JSON.stringify(notes[0] || [])), cursor: query.cursor || "", has_more: !!query.hasMore };
+}
+"""
+
+_SCROLL_PAGE_JS = "() => window.scrollTo(0, document.body.scrollHeight)"
+
+
+def _note_key(note: Dict[str, Any]) -> str:
+    return str(note.get("id") or note.get("note_id") or (note.get("noteCard") or {}).get("noteId") or "")
+
+
+def _note_limit(max_notes: int | None, *, streaming: bool) -> int:
+    if streaming:
+        return max(1, max_notes) if max_notes else sys.maxsize
+    return max(1, min(max_notes or DEFAULT_PAGED_NOTES, MAX_NOTES_PER_CALL))
 
 
 @dataclass(slots=True)
@@ -14,18 +45,74 @@ class UserProfile:
     basic_info: Dict[str, Any] = field(default_factory=dict)
     interactions: List[Dict[str, Any]] = field(default_factory=list)
     feeds: List[Dict[str, Any]] = field(default_factory=list)
+    cursor: str | None = None
+    has_more: bool = False
 
 
 class UserProfileAction(PlaywrightAction):
-    def user_profile(self, user_id: str, xsec_token: str) -> UserProfile:
+    def user_profile(
+        self,
+        user_id: str,
+        xsec_token: str,
+        *,
+        max_notes: int | None = None,
+        cursor: str | None = None,
+        idle_timeout: float = 8.0,
+        sink: Callable[[Dict[str, Any]], None] | None = None,
+    ) -> UserProfile:
+        """Load a creator's profile.
+
+        Without ``max_notes``/``cursor`` only the first rendered page of notes is
+        returned. Otherwise the posted-notes list is scrolled and the ``user_posted``
+        responses are collected until ``max_notes`` unique notes past ``cursor`` are
+        gathered; the returned ``cursor`` resumes from the next note. With a ``sink`` the
+        notes are streamed to it instead of being kept on the profile, with no cap.
+
+        Resuming is not a true continuation: ``user_posted`` requests are signed by the
+        page, so each call loads the profile again and re-scrolls every page before
+        ``cursor`` (O(pages so far) per call). For a long listing prefer one call with a
+        larger ``max_notes`` or an export sink over many small resumed calls.
+        """
         page: Page = self.page
         url = f"https://www.xiaohongshu.com/user/profile/{user_id}?xsec_token={xsec_token}&xsec_source=pc_note"
+        if max_notes is None and cursor is None and sink is None:
+            self._open(url)
+            return self._extract_profile(page)
+
+        with ApiResponseTap(page, _USER_POSTED_API) as tap:
+            self._open(url)
+            profile = self._extract_profile(page)
+            first = [CapturedPage(query={"cursor": ""}, data=page.evaluate(_POSTED_FIRST_PAGE_JS))]
+            first.extend(tap.drain())
+
+            def more() -> list[CapturedPage]:
+                self.ctx.raise_if_cancelled()
+                page.evaluate(_SCROLL_PAGE_JS)
+                return tap.wait(idle_timeout)
+
+            window = collect_window(
+                first,
+                more,
+                items_field="notes",
+                key=_note_key,
+                limit=_note_limit(max_notes, streaming=sink is not None),
+                cursor=cursor,
+                on_item=sink,
+                on_page=lambda pages_read, total: self.ctx.report(None, f"page {pages_read}: {total} notes"),
+                keep=sink is None,
+            )
+        profile.feeds = window.items
+        profile.cursor = window.cursor
+        profile.has_more = window.has_more
+        return profile
+
+    def _open(self, url: str) -> None:
+        page: Page = self.page
         page.goto(url, wait_until="domcontentloaded")
         try:
             page.wait_for_load_state("networkidle", timeout=3_000)
         except PlaywrightTimeoutError:
             pass
-        return self._extract_profile(page)
 
     def get_my_profile_via_sidebar(self) -> UserProfile:
         page: Page = self.page
@@ -40,7 +127,8 @@ class UserProfileAction(PlaywrightAction):
         return self._extract_profile(page)
 
     def _extract_profile(self, page: Page) -> UserProfile:
-        payload_user = page.evaluate(
+        user_data = evaluate_json(
+            page,
             """
             () => {
               const state = window.__INITIAL_STATE__;
@@ -51,10 +139,11 @@ class UserProfileAction(PlaywrightAction):
             }
             """
         )
-        if not payload_user:
+        if user_data is None:
             raise ValueError("userPageData not found in __INITIAL_STATE__")
 
-        payload_notes = page.evaluate(
+        notes_data = evaluate_json(
+            page,
             """
             () => {
               const state = window.__INITIAL_STATE__;
@@ -65,12 +154,9 @@ class UserProfileAction(PlaywrightAction):
             }
             """
         )
-        if not payload_notes:
+        if notes_data is None:
             raise ValueError("user.notes not found in __INITIAL_STATE__")
 
-        user_data = json.loads(payload_user)
-        notes_data = json.loads(payload_notes)
-
         profile = UserProfile(
             basic_info=user_data.get("basicInfo", {}),
             interactions=user_data.get("interactions", []),